@@ -0,0 +1,48 @@
+import time  # Medição de tempo
+from dataclasses import replace
+
+import numpy as np  # Geração dos cenários
+
+from linear_programming_and_applications_in_python.batch import ROOT
+from linear_programming_and_applications_in_python.batched import solve_scenarios
+from linear_programming_and_applications_in_python.models import load_model
+
+# =============================================================================
+# BENCHMARK: 100 MIL CENÁRIOS DE PREÇO/CAPACIDADE DO MODELO DA PROVA-01/Q1
+# -----------------------------------------------------------------------------
+# Compara uma única chamada de solve_scenarios (todos os tableaus pivotando
+# juntos) com a resolução problema a problema pelos backends 'cbc' e
+# 'revised', extrapolada a partir de uma amostra.
+#
+# Uso:
+#   python benchmarks/bench_batched.py
+# =============================================================================
+
+K = 100_000
+SAMPLE = {'cbc': 50, 'revised': 1000}
+
+
+def main():
+    model = load_model(ROOT / 'prova-01' / 'q1' / 'q1.toml')
+    rng = np.random.default_rng(0)
+    prices = model.objective * rng.uniform(0.5, 1.5, (K, len(model.variables)))
+    capacities = model.b * rng.uniform(0.5, 1.5, (K, len(model.b)))
+
+    start = time.perf_counter()
+    batch = solve_scenarios(model, prices, capacities)
+    elapsed = time.perf_counter() - start
+    print(f"solve_scenarios ({K} cenários): {elapsed:.3f} s  "
+          f"({elapsed / K * 1e6:.2f} µs por cenário, {batch.optimal.sum()} ótimos)")
+
+    for backend, n in SAMPLE.items():
+        start = time.perf_counter()
+        for k in range(n):
+            scenario = replace(model, objective=prices[k], b=capacities[k])
+            solution = scenario.solve(backend)
+            assert np.isclose(solution.objective, batch.objective[k])
+        per = (time.perf_counter() - start) / n
+        print(f"{backend:>8} um a um: {per * 1e6:9.1f} µs por cenário  (~{per * K:.0f} s para {K})")
+
+
+if __name__ == '__main__':
+    main()
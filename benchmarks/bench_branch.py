@@ -0,0 +1,75 @@
+import time  # Medição de tempo
+
+import numpy as np  # Enumeração vetorizada
+
+from linear_programming_and_applications_in_python.branch import branch_and_bound
+from linear_programming_and_applications_in_python.models import parse_model
+
+# =============================================================================
+# BENCHMARK: BRANCH-AND-BOUND x ENUMERAÇÃO NO PROBLEMA DOS ÔNIBUS AMPLIADO
+# -----------------------------------------------------------------------------
+# O modelo da prova-02/q9 (até 8 ônibus grandes, 12 pequenos, 13 motoristas,
+# 600 passageiros) com os limites multiplicados por SCALE. A enumeração
+# percorre todos os pares (G, P), como prova-04/exercise10solution2.py, mas
+# vetorizada em NumPy por valor de G; o branch-and-bound resolve só as
+# relaxações dos nós que não são podados.
+#
+# Uso:
+#   python benchmarks/bench_branch.py
+# =============================================================================
+
+SCALES = (1, 10, 100, 1_000, 10_000)
+EXTRA = 30  # passageiros a mais, para a relaxação não cair num vértice inteiro
+
+
+def bus_model(scale):
+    return parse_model({
+        'name': f'Onibus_x{scale}',
+        'sense': 'min',
+        'objective_name': 'Custo_Total',
+        'variables': {
+            'names': ['Onibus_G', 'Onibus_P'],
+            'objective': [190, 140],
+            'upper': [8 * scale, 12 * scale],
+            'integer': [True, True],
+        },
+        'constraints': {
+            'names': ['Capacidade_Passageiros', 'Motoristas_Disponiveis'],
+            'senses': ['>=', '<='],
+            'rhs': [600 * scale + EXTRA, 13 * scale],
+            'matrix': [[60, 40], [1, 1]],
+        },
+    })
+
+
+def enumerate_bus(scale):
+    best = (np.inf, None)
+    P = np.arange(12 * scale + 1)
+    for g in range(8 * scale + 1):
+        feasible = (60 * g + 40 * P >= 600 * scale + EXTRA) & (g + P <= 13 * scale)
+        if feasible.any():
+            cost = 190 * g + 140 * P[feasible]
+            k = int(np.argmin(cost))
+            if cost[k] < best[0]:
+                best = (float(cost[k]), (g, int(P[feasible][k])))
+    return best
+
+
+def main():
+    print(f"{'escala':>7} {'pares':>12} {'enumeração':>12} {'B&B':>10} {'nós':>5} {'custo':>12}")
+    for scale in SCALES:
+        start = time.perf_counter()
+        cost, _ = enumerate_bus(scale)
+        brute = time.perf_counter() - start
+
+        start = time.perf_counter()
+        solution = branch_and_bound(bus_model(scale))
+        elapsed = time.perf_counter() - start
+        assert abs(solution.objective - cost) < 1e-6, (solution.objective, cost)
+        pairs = (8 * scale + 1) * (12 * scale + 1)
+        print(f"{scale:>7} {pairs:>12,} {brute * 1e3:>10.2f}ms {elapsed * 1e3:>8.2f}ms "
+              f"{solution.extra['nodes']:>5} {cost:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import time  # Medição de tempo
+
+import numpy as np  # Geração da tabela sintética
+
+from linear_programming_and_applications_in_python.builder import ModelBuilder, add_pulp_constraints
+
+# =============================================================================
+# BENCHMARK: MONTAGEM DE UM MODELO COM 10 MIL LINHAS
+# -----------------------------------------------------------------------------
+# Tabela sintética no formato da tabela de máquinas do Exercise7 (uma linha
+# por máquina, uma coluna por produto, ~PER_ROW produtos por máquina).
+# Compara três formas de montar as mesmas restrições:
+#
+#   pulp termo a termo   -> model += lpSum(t * x) <= cap, como nos scripts
+#   add_pulp_constraints -> mesmas linhas no pulp, em uma chamada
+#   ModelBuilder         -> modelo próprio (SparseModel), sem objetos do pulp
+#
+# Uso:
+#   python benchmarks/bench_builder.py
+# =============================================================================
+
+ROWS = 10_000
+COLUMNS = 1_000
+PER_ROW = 5
+
+
+def machine_table(rng):
+    rows = np.repeat(np.arange(ROWS), PER_ROW)
+    cols = rng.integers(0, COLUMNS, ROWS * PER_ROW)
+    values = rng.uniform(5, 25, ROWS * PER_ROW)
+    return (rows, cols, values), rng.uniform(1_000, 5_000, ROWS)
+
+
+def pulp_terms(table, capacity):
+    import pulp
+
+    rows, cols, values = table
+    model = pulp.LpProblem("Maquinas", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x{j + 1}", lowBound=0) for j in range(COLUMNS)]
+    for i in range(ROWS):
+        k = slice(i * PER_ROW, (i + 1) * PER_ROW)
+        model += pulp.lpSum(t * x[j] for j, t in zip(cols[k], values[k])) <= capacity[i], f"Maquina_{i + 1}"
+    return model
+
+
+def pulp_bulk(table, capacity):
+    import pulp
+
+    model = pulp.LpProblem("Maquinas", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x{j + 1}", lowBound=0) for j in range(COLUMNS)]
+    return add_pulp_constraints(model, x, table, '<=', capacity,
+                                names=[f"Maquina_{i + 1}" for i in range(ROWS)])
+
+
+def builder(table, capacity):
+    model = ModelBuilder("Maquinas", sense='max')
+    model.add_variables([f"x{j + 1}" for j in range(COLUMNS)], objective=1.0)
+    model.add_constraints(table, '<=', capacity, names=[f"Maquina_{i + 1}" for i in range(ROWS)])
+    return model.build_sparse()
+
+
+def main():
+    table, capacity = machine_table(np.random.default_rng(0))
+    print(f"{ROWS:,} linhas, {COLUMNS:,} variáveis, {len(table[0]):,} coeficientes")
+    for label, build in (('pulp termo a termo', pulp_terms), ('add_pulp_constraints', pulp_bulk),
+                         ('ModelBuilder', builder)):
+        start = time.perf_counter()
+        build(table, capacity)
+        print(f"{label:<21} {(time.perf_counter() - start) * 1e3:>9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import time  # Medição de tempo
+
+import numpy as np  # Geração da rede sintética
+
+from linear_programming_and_applications_in_python.cpm import ActivityNetwork, cpm
+
+# =============================================================================
+# BENCHMARK: CPM EM REDES SINTÉTICAS DE ATÉ 1 MILHÃO DE ATIVIDADES
+# -----------------------------------------------------------------------------
+# Cada atividade j depende de até 3 atividades anteriores sorteadas numa
+# janela de j - WINDOW a j - 1, o que gera redes com milhares de níveis. O
+# tempo por atividade deve ficar estável com o tamanho (custo linear).
+#
+# Uso:
+#   python benchmarks/bench_cpm.py
+# =============================================================================
+
+SIZES = (10_000, 100_000, 1_000_000)
+WINDOW = 2_000
+
+
+def synthetic_network(n, rng, window=WINDOW, max_preds=3):
+    """Rede aleatória acíclica com n atividades (arestas sempre para frente)."""
+    dst = np.repeat(np.arange(1, n), rng.integers(1, max_preds + 1, n - 1))
+    src = dst - rng.integers(1, window + 1, len(dst))
+    keep = src >= 0
+    src, dst = src[keep], dst[keep]
+    edges = np.unique(np.stack([src, dst], axis=1), axis=0)
+    duration = rng.integers(1, 30, n)
+    return ActivityNetwork.from_edges([f"A{i}" for i in range(n)], duration, edges[:, 0], edges[:, 1])
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        network = synthetic_network(n, rng)
+        start = time.perf_counter()
+        schedule = cpm(network)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>9} atividades, {len(network.succ_idx):>9} dependências: {elapsed:.3f} s  "
+              f"({elapsed / n * 1e6:.2f} µs por atividade, duração {schedule.duration:.0f}, "
+              f"{int(schedule.critical.sum())} críticas)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import time  # Medição de tempo
+
+import numpy as np  # Sorteio das atualizações
+
+from linear_programming_and_applications_in_python.cpm import cpm
+
+from bench_cpm import synthetic_network
+
+# =============================================================================
+# BENCHMARK: ATUALIZAÇÃO INCREMENTAL DO CPM NUMA REDE DE 1 MILHÃO DE ATIVIDADES
+# -----------------------------------------------------------------------------
+# Mede a latência de Schedule.update_duration (uma duração alterada por vez,
+# como PAI de 24 para 26 semanas na prova-05/q1) contra o CPM completo, e
+# confere o resultado final com um recálculo do zero.
+#
+# Uso:
+#   python benchmarks/bench_cpm_update.py
+# =============================================================================
+
+ACTIVITIES = 1_000_000
+UPDATES = 1_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    network = synthetic_network(ACTIVITIES, rng)
+
+    start = time.perf_counter()
+    schedule = cpm(network)
+    full = time.perf_counter() - start
+    print(f"CPM completo: {full * 1e3:.1f} ms")
+
+    targets = rng.integers(0, ACTIVITIES, UPDATES)
+    durations = rng.integers(1, 30, UPDATES)
+    latencies, touched = [], []
+    for j, d in zip(targets.tolist(), durations.tolist()):
+        start = time.perf_counter()
+        touched.append(schedule.update_duration(j, float(d)))
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies) * 1e3
+    print(f"update_duration ({UPDATES} atualizações): mediana {np.median(latencies):.3f} ms, "
+          f"p99 {np.percentile(latencies, 99):.2f} ms, máx {latencies.max():.2f} ms; "
+          f"mediana de {int(np.median(touched))} atividades recalculadas")
+
+    check = cpm(network)
+    same = all(np.allclose(getattr(schedule, a), getattr(check, a))
+               for a in ('es', 'ef', 'ls', 'lf', 'total_float', 'free_float'))
+    print(f"confere com o recálculo completo: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import time  # Medição de tempo
+import tracemalloc  # Pico de memória alocada
+
+from linear_programming_and_applications_in_python.enumeration import enumerate_plans
+
+from bench_branch import bus_model
+
+# =============================================================================
+# BENCHMARK: ENUMERAÇÃO DE ~10^8 PLANOS INTEIROS EM BLOCOS
+# -----------------------------------------------------------------------------
+# Problema dos ônibus da prova-02/q9 com os limites multiplicados por 1000
+# (8001 x 12001 = 96 milhões de pares). Compara com o laço Python de
+# prova-04/exercise10solution2.py medido numa fatia da grade e mostra o pico
+# de memória: a grade inteira nunca é materializada.
+#
+# Uso:
+#   python benchmarks/bench_enumeration.py
+# =============================================================================
+
+SCALE = 1_000
+TOP = 5
+SAMPLE_ROWS = 20  # valores de G avaliados pelo laço Python
+
+
+def python_loop(scale, rows):
+    # Mesmo laço de exercise10solution2.py, para as primeiras `rows` linhas
+    best = None
+    for g in range(rows):
+        for p in range(12 * scale + 1):
+            if 60 * g + 40 * p >= 600 * scale + 30 and g + p <= 13 * scale:
+                cost = 190 * g + 140 * p
+                if best is None or cost < best:
+                    best = cost
+    return best
+
+
+def main():
+    model = bus_model(SCALE)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = enumerate_plans(model, top=TOP)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    python_loop(SCALE, SAMPLE_ROWS)
+    per_point = (time.perf_counter() - start) / (SAMPLE_ROWS * (12 * SCALE + 1))
+
+    print(f"pontos avaliados: {result.evaluated:,} ({result.feasible:,} factíveis)")
+    print(f"enumerate_plans:  {elapsed:.2f} s, pico de memória {peak / 1e6:.1f} MB")
+    print(f"laço Python:      ~{per_point * result.evaluated:.0f} s estimados "
+          f"({per_point * 1e9:.0f} ns por ponto)")
+    for k in range(len(result.plans)):
+        print(f"  {k + 1}º  {result.values(k)}  custo = {result.objective[k]:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import tempfile  # Arquivo temporário para o diagrama sintético
+import time  # Medição de tempo
+from pathlib import Path
+
+import numpy as np  # Geração da rede sintética
+
+from linear_programming_and_applications_in_python.cpm import cpm
+from linear_programming_and_applications_in_python.mermaid import check_chart, read_mermaid, write_mermaid
+
+from bench_cpm import synthetic_network
+
+# =============================================================================
+# BENCHMARK: LEITURA DE UM FLOWCHART MERMAID COM 100 MIL ARESTAS
+# -----------------------------------------------------------------------------
+# Gera uma rede sintética, grava o diagrama no formato da prova-05 com
+# write_mermaid, lê de volta com read_mermaid e confere com check_chart que
+# nenhuma folga mudou na ida e volta.
+#
+# Uso:
+#   python benchmarks/bench_mermaid.py
+# =============================================================================
+
+ACTIVITIES = 55_000  # ~110 mil arestas (1 a 3 predecessoras por atividade)
+
+
+def main():
+    network = synthetic_network(ACTIVITIES, np.random.default_rng(0))
+    schedule = cpm(network)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'synthetic.txt'
+        start = time.perf_counter()
+        write_mermaid(schedule, path)
+        written = time.perf_counter() - start
+        size = path.stat().st_size
+
+        start = time.perf_counter()
+        chart = read_mermaid(path)
+        elapsed = time.perf_counter() - start
+
+    edges = len(chart.network.succ_idx)
+    print(f"write_mermaid: {written:.3f} s ({size / 1e6:.1f} MB)")
+    print(f"read_mermaid:  {elapsed:.3f} s para {chart.network.size} nós e {edges} arestas "
+          f"({elapsed / edges * 1e6:.2f} µs por aresta)")
+    print(f"divergências após ida e volta: {len(check_chart(chart))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import time  # Medição de tempo
+from dataclasses import replace
+
+from linear_programming_and_applications_in_python.batch import ROOT
+from linear_programming_and_applications_in_python.cpm import cpm
+from linear_programming_and_applications_in_python.mermaid import read_mermaid
+from linear_programming_and_applications_in_python.pert import pert_estimates, simulate
+
+# =============================================================================
+# BENCHMARK: 1 MILHÃO DE CENÁRIOS DO PERT PROBABILÍSTICO NA REDE DA PROVA-05/Q1
+# -----------------------------------------------------------------------------
+# A rede Q1 só tem durações determinísticas; para o teste usamos estimativas
+# ilustrativas a = 0,8 m e b = 1,6 m em torno da duração do diagrama (m).
+#
+# Uso:
+#   python benchmarks/bench_pert.py
+# =============================================================================
+
+SAMPLES = 1_000_000
+
+
+def main():
+    network = read_mermaid(ROOT / 'prova-05' / 'q1' / 'Q1.txt').network
+    m = network.duration
+    a, b = 0.8 * m, 1.6 * m
+    mean, _ = pert_estimates(a, m, b)
+    classic = cpm(replace(network, duration=mean)).duration
+    print(f"PERT clássico (caminho crítico das médias): {classic:.2f} sem")
+
+    for jobs in (1, 2):
+        start = time.perf_counter()
+        sim = simulate(network, a, m, b, samples=SAMPLES, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        print(f"simulate ({SAMPLES} cenários, jobs={jobs}): {elapsed:.2f} s  "
+              f"média {sim.mean:.2f} sem, P95 {sim.quantile(0.95):.2f} sem, P(<= 70) = {sim.probability(70):.3f}")
+    print("índice de criticidade:", {k: round(v, 3) for k, v in sim.criticality_index().items()})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import time  # Medição de tempo
+
+import numpy as np  # Estatísticas dos tempos
+
+from linear_programming_and_applications_in_python.batch import discover_models
+from linear_programming_and_applications_in_python.models import load_model
+
+# =============================================================================
+# BENCHMARK: LATÊNCIA POR RESOLUÇÃO NOS MODELOS DA PROVA-01
+# -----------------------------------------------------------------------------
+# Compara o backend 'cbc' (pulp escreve o arquivo .mps, dispara o CBC e lê a
+# solução) com os backends que resolvem dentro do próprio processo.
+#
+# Uso:
+#   python benchmarks/bench_solvers.py
+# =============================================================================
+
+BACKENDS = ('cbc', 'numpy', 'revised')
+REPEAT = {'cbc': 20}
+
+
+def per_solve(model, backend, repeat):
+    model.solve(backend)  # aquecimento
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.solve(backend)
+        times.append(time.perf_counter() - start)
+    return np.median(times)
+
+
+def main():
+    models = [load_model(p) for p in discover_models(['prova-01'])]
+    print(f"{'Modelo':<38}" + ''.join(f"{b:>14}" for b in BACKENDS))
+    totals = dict.fromkeys(BACKENDS, 0.0)
+    for model in models:
+        row = f"{model.name:<38}"
+        for backend in BACKENDS:
+            t = per_solve(model, backend, REPEAT.get(backend, 2000))
+            totals[backend] += t
+            row += f"{t * 1e6:>11.1f} µs"
+        print(row)
+    print(f"{'Média':<38}" + ''.join(f"{totals[b] / len(models) * 1e6:>11.1f} µs" for b in BACKENDS))
+    print(f"{'Modelos por segundo':<38}" + ''.join(f"{len(models) / totals[b]:>14.0f}" for b in BACKENDS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+import time  # Medição de tempo
+import tracemalloc  # Pico de memória alocada
+
+import numpy as np  # Geração dos dados sintéticos
+
+from linear_programming_and_applications_in_python.sparse import SparseModel
+
+# =============================================================================
+# BENCHMARK: MONTAGEM DA FÁBRICA DE FACAS AMPLIADA (10^5 PRODUTOS)
+# -----------------------------------------------------------------------------
+# Versão ampliada do Exercise7: PRODUCTS modelos de faca, MACHINES máquinas,
+# cada modelo passa por MACHINES_PER_PRODUCT máquinas sorteadas e todos
+# consomem chapa (uma linha densa, como "Chapa" no exercício). Compara o
+# tempo e o pico de memória de montagem:
+#
+#   pulp       -> como nos scripts: lpSum(t * x) por máquina e model += ... <= ...
+#   CSR        -> SparseModel.from_coo com os arrays de uma vez
+#   CSR->pulp  -> SparseModel.to_pulp (problema pulp montado a partir do CSR)
+#
+# Uso:
+#   python benchmarks/bench_sparse.py
+# =============================================================================
+
+PRODUCTS = 100_000
+MACHINES = 300
+MACHINES_PER_PRODUCT = 3
+
+
+def knife_data(rng):
+    machine = rng.integers(0, MACHINES, (PRODUCTS, MACHINES_PER_PRODUCT))
+    seconds = rng.uniform(8, 25, (PRODUCTS, MACHINES_PER_PRODUCT))
+    area = rng.uniform(20, 50, PRODUCTS)
+    profit = rng.uniform(2, 6, PRODUCTS)
+    capacity = np.full(MACHINES, 8 * 3600.0)
+    return machine, seconds, area, profit, capacity
+
+
+def build_pulp(machine, seconds, area, profit, capacity):
+    import pulp
+
+    model = pulp.LpProblem("Facas_Ampliado", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x{p + 1}", lowBound=0) for p in range(PRODUCTS)]
+    model += pulp.lpSum(profit[p] * x[p] for p in range(PRODUCTS)), "Lucro_Total"
+    users = [[] for _ in range(MACHINES)]
+    for p in range(PRODUCTS):
+        for k in range(MACHINES_PER_PRODUCT):
+            users[machine[p, k]].append((p, seconds[p, k]))
+    for i in range(MACHINES):
+        model += pulp.lpSum(t * x[p] for p, t in users[i]) <= capacity[i], f"Maquina_{i + 1}"
+    model += pulp.lpSum(area[p] * x[p] for p in range(PRODUCTS)) <= 50_000 * PRODUCTS / 3, "Chapa"
+    return model
+
+
+def build_csr(machine, seconds, area, profit, capacity):
+    rows = np.concatenate([machine.ravel(), np.full(PRODUCTS, MACHINES)])
+    cols = np.concatenate([np.repeat(np.arange(PRODUCTS), MACHINES_PER_PRODUCT), np.arange(PRODUCTS)])
+    values = np.concatenate([seconds.ravel(), area])
+    return SparseModel.from_coo(
+        rows, cols, values, profit, ['<='], np.append(capacity, 50_000 * PRODUCTS / 3),
+        sense='max', name='Facas_Ampliado', objective_name='Lucro_Total',
+        constraint_names=[f"Maquina_{i + 1}" for i in range(MACHINES)] + ['Chapa'],
+    )
+
+
+def measure(label, build, *args):
+    # Tempo sem o tracemalloc (que deixa cada alocação mais lenta); memória
+    # numa segunda execução
+    start = time.perf_counter()
+    result = build(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    build(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<11} {elapsed:>8.3f} s   pico {peak / 1e6:>8.1f} MB")
+    return result
+
+
+def main():
+    data = knife_data(np.random.default_rng(0))
+    print(f"{PRODUCTS:,} variáveis, {MACHINES + 1} linhas, "
+          f"{PRODUCTS * (MACHINES_PER_PRODUCT + 1):,} coeficientes não nulos")
+    measure('pulp', build_pulp, *data)
+    model = measure('CSR', build_csr, *data)
+    measure('CSR->pulp', lambda m: m.to_pulp(), model)
+    dense = model.shape[0] * model.shape[1] * 8
+    print(f"CSR ocupa {(model.values.nbytes + model.col_idx.nbytes + model.row_ptr.nbytes) / 1e6:.1f} MB "
+          f"(matriz densa: {dense / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import time  # Medição de tempo
+from pathlib import Path
+
+from linear_programming_and_applications_in_python.spreadsheets import (
+    clear_workbook_cache, read_activity_boxes, read_lp_sheets,
+)
+
+# =============================================================================
+# BENCHMARK: LEITURA DAS PLANILHAS DAS AULAS (FRIA x CACHE)
+# -----------------------------------------------------------------------------
+# Lê as planilhas com tabelas de PL nas células (Aula 01 _01 e Aula 03) e os
+# diagramas PERT/CPM da prova-05, primeiro sem cache e depois com o cache por
+# mtime. Confere que os EXEMPLOS 1-5 da Aula 01 (rótulo das variáveis à
+# esquerda de "Lucro") são lidos e têm o mesmo ótimo que os da Aula 03.
+#
+# Uso:
+#   python benchmarks/bench_spreadsheets.py
+# =============================================================================
+
+ROOT = Path(__file__).resolve().parent.parent
+AULA_01 = ROOT / 'aula-01' / 'Exercícios - Aula 01 (Modelagem Matemática)_01.XLSX'
+AULA_03 = ROOT / 'aula-03' / 'Exercícios - Aula 03 (Método Simplex).xlsx'
+PERT = ROOT / 'prova-05' / 'Exercícios - Aula 04(Pert_CPM).xlsx'
+READERS = ((AULA_01, read_lp_sheets), (AULA_03, read_lp_sheets), (PERT, read_activity_boxes))
+
+
+def check_aula_01():
+    aula_01, aula_03 = read_lp_sheets(AULA_01), read_lp_sheets(AULA_03)
+    expected = [f'EXEMPLO {k}' for k in range(1, 6)]
+    assert all(name in aula_01 for name in expected), sorted(aula_01)
+    for name in expected:
+        got, ref = aula_01[name].solve('revised'), aula_03[name].solve('revised')
+        assert got.status == 'Optimal' and abs(got.objective - ref.objective) < 1e-6, (name, got, ref)
+    return len(aula_01)
+
+
+def main():
+    print(f"{'planilha':<50} {'itens':>6} {'fria':>10} {'cache':>10}")
+    for path, reader in READERS:
+        clear_workbook_cache()
+        start = time.perf_counter()
+        result = reader(path)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        reader(path)
+        warm = time.perf_counter() - start
+        print(f"{path.name:<50} {len(result):>6} {cold * 1e3:>8.1f}ms {warm * 1e6:>8.1f}us")
+    print(f"\nAula 01 (_01): {check_aula_01()} modelos lidos, EXEMPLOS 1-5 conferidos com a Aula 03")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,63 +21,30 @@
 
 # [CÓDIGO COMPLETO EM PYTHON COM SOLUÇÃO E GRÁFICO]
 
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Importa a biblioteca PuLP para modelagem e solução de problemas de programação linear
 import numpy as np            # Importa o NumPy para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Importa o Matplotlib para criação de gráficos
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # ============================================================================
-# 1) Definir o problema
+# 1) Carregar o modelo
 # ----------------------------------------------------------------------------
-# Criamos um problema de otimização chamado "Exemplo_01" que terá o objetivo de
-# maximizar a função lucro. A opção 'pulp.LpMaximize' indica que o problema é
-# de maximização.
-model = pulp.LpProblem("Exemplo_01", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise1.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: x1, x2.
+model, (x1, x2) = load_model(Path(__file__).with_name('Exercise1.toml')).to_pulp()
 
 # ============================================================================
-# 2) Criar variáveis
-# ----------------------------------------------------------------------------
-# Neste passo definimos as variáveis de decisão:
-# - x1: Quantidade a produzir do produto P1
-# - x2: Quantidade a produzir do produto P2
-# Ambas são definidas como variáveis contínuas com limite inferior igual a 0.
-x1 = pulp.LpVariable('x1', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('x2', lowBound=0, cat='Continuous')
-
-# ============================================================================
-# 3) Definir a função objetivo
-# ----------------------------------------------------------------------------
-# A função objetivo representa o lucro total que desejamos maximizar.
-# Cada unidade de P1 gera um lucro de R$ 1.000,00 e cada unidade de P2 gera R$ 1.800,00.
-# Assim, a função é definida como: Lucro = 1000*x1 + 1800*x2.
-model += 1000 * x1 + 1800 * x2, "Lucro"
-
-# ============================================================================
-# 4) Adicionar restrições
-# ----------------------------------------------------------------------------
-# Aqui adicionamos as restrições do problema para refletir os limites reais da produção.
-
-# Restrição de tempo de produção:
-# Cada unidade de P1 requer 20 horas e cada unidade de P2 requer 30 horas, com um total
-# máximo de 1200 horas disponíveis.
-model += 20 * x1 + 30 * x2 <= 1200, "Restricao_tempo"
-
-# Restrição de demanda para o produto P1:
-# Não é possível produzir mais do que a demanda esperada, que é de 40 unidades.
-model += x1 <= 40, "Restricao_demanda_P1"
-
-# Restrição de demanda para o produto P2:
-# Não é possível produzir mais do que a demanda esperada, que é de 30 unidades.
-model += x2 <= 30, "Restricao_demanda_P2"
-
-# ============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # ----------------------------------------------------------------------------
 # O método solve() é utilizado para encontrar a solução ótima (maximização do lucro)
 # que satisfaz todas as restrições definidas.
 model.solve()
 
 # ============================================================================
-# 6) Mostrar resultados
+# 3) Mostrar resultados
 # ----------------------------------------------------------------------------
 # Após a resolução, imprimimos o status da solução, os valores ótimos das variáveis
 # x1 e x2, e o valor máximo do lucro obtido.
@@ -87,7 +54,7 @@ print("x2 =", x2.varValue)
 print("Lucro máximo = R$", pulp.value(model.objective))
 
 # ============================================================================
-# 7) Plotar a região factível e a solução ótima
+# 4) Plotar a região factível e a solução ótima
 # ----------------------------------------------------------------------------
 # Nesta seção, utilizamos o Matplotlib para visualizar graficamente a região
 # factível do problema e destacar a solução ótima encontrada.
@@ -111,13 +78,9 @@ plt.axvline(x=40, color='red', label='x1 = 40')
 # Plota uma linha horizontal que representa o limite de demanda para P2 (x2 = 30)
 plt.hlines(y=30, xmin=0, xmax=40, color='green', label='x2 = 30')
 
-# Define a região factível para x2, considerando que x2 não pode ultrapassar o valor
-# calculado pela restrição de tempo e nem o valor máximo de 30 unidades.
-x2_feasible = np.minimum(x2_from_time, 30)
-x2_feasible = np.maximum(x2_feasible, 0)
-
-# Preenche a área da região factível com uma cor cinza semitransparente
-plt.fill_between(x1_vals, x2_feasible, color='gray', alpha=0.3)
+# Preenche a região factível (polígono exato das restrições do modelo) com uma
+# cor cinza semitransparente
+draw_model_region(plt.gca(), model, box=(0, 45, 0, 35))
 
 # Destaca a solução ótima encontrada, colocando um ponto preto no gráfico
 plt.scatter(x1.varValue, x2.varValue, color='black', zorder=5, label='Solução Ótima')
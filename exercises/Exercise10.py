@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -49,47 +52,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Minimização)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exemplo_10", pulp.LpMinimize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise10.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: x1
+# (Fabrica1_dias), x2 (Fabrica2_dias).
+model, (x1, x2) = load_model(Path(__file__).with_name('Exercise10.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# x1: número de dias que a Fábrica 1 opera
-# x2: número de dias que a Fábrica 2 opera
-# As variáveis são definidas como contínuas; se necessário, podem ser forçadas a inteiras.
-x1 = pulp.LpVariable('Fabrica1_dias', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('Fabrica2_dias', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# O objetivo é minimizar o custo total de operação:
-#   Min Z = 1000*x1 + 2000*x2
-model += 1000 * x1 + 2000 * x2, "Custo_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Para atender aos pedidos, a produção deve ser, no mínimo:
-#
-# Papel fino: 8*x1 + 2*x2 >= 16
-model += 8 * x1 + 2 * x2 >= 16, "Papel_Fino"
-
-# Papel médio: x1 + x2 >= 6
-model += x1 + x2 >= 6, "Papel_Medio"
-
-# Papel grosso: 2*x1 + 7*x2 >= 28
-model += 2 * x1 + 7 * x2 >= 28, "Papel_Grosso"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("x1 (Dias de Fábrica 1) =", x1.varValue)
@@ -97,7 +74,7 @@ print("x2 (Dias de Fábrica 2) =", x2.varValue)
 print("Custo Mínimo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a plotagem, usamos x1 no eixo X e x2 no eixo Y. As restrições são:
 #
@@ -113,10 +90,6 @@ x2_fino = 8 - 4 * x1_vals          # x2 >= 8 - 4*x1
 x2_medio = 6 - x1_vals             # x2 >= 6 - x1
 x2_grosso = 4 - (2 / 7) * x1_vals   # x2 >= 4 - (2/7)*x1
 
-# Para cada valor de x1, o limite inferior efetivo para x2 é o máximo entre as três fronteiras e 0:
-x2_feasible = np.maximum(np.maximum(x2_fino, x2_medio), x2_grosso)
-x2_feasible = np.maximum(x2_feasible, 0)  # Garantir que x2 não seja negativo
-
 # Criação da figura para a plotagem
 plt.figure(figsize=(8, 6))
 
@@ -126,7 +99,7 @@ plt.plot(x1_vals, x2_medio, label='x1 + x2 = 6 (Papel Médio)', color='red')
 plt.plot(x1_vals, x2_grosso, label='2x1 + 7x2 = 28 (Papel Grosso)', color='green')
 
 # Preencher a região factível (acima do maior limite inferior) até um limite de exibição (y=20)
-plt.fill_between(x1_vals, x2_feasible, 20, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 20), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x1.varValue, x2.varValue, color='black', zorder=5, label='Solução Ótima')
@@ -141,7 +114,7 @@ plt.legend()
 plt.grid(True)
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 2D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from linear_programming_and_applications_in_python import feasible_polygon
+
 # /**
 #  * Problema: Maximização da função objetivo L = 3x1 + 5x2 sujeito às restrições:
 #  *          x1 <= 4,
@@ -11,14 +13,10 @@ import numpy as np
 #  * onde a função objetivo L atinge o valor máximo de 36.
 #  */
 
-# Definindo os vértices da região viável
-vertices = np.array([
-    [0, 0],
-    [4, 0],
-    [4, 3],
-    [2, 6],
-    [0, 6]
-])
+# Vértices da região viável, calculados a partir das restrições (A x <= b)
+A = np.array([[1, 0], [0, 1], [3, 2]])
+b = np.array([4, 6, 18])
+vertices = feasible_polygon(A, b)
 
 # Configuração do gráfico
 plt.figure(figsize=(6, 6))
@@ -41,7 +39,7 @@ plt.fill(vertices[:, 0], vertices[:, 1], color='lightgrey', alpha=0.5)
 # Marcando os vértices e adicionando rótulos
 for v in vertices:
     plt.plot(v[0], v[1], 'ko')
-    plt.text(v[0] + 0.1, v[1] + 0.1, f'({v[0]},{v[1]})', fontsize=9)
+    plt.text(v[0] + 0.1, v[1] + 0.1, f'({v[0]:g},{v[1]:g})', fontsize=9)
 
 # Destaque para o ponto ótimo
 plt.plot(2, 6, 'mo', markersize=8, label='Ótimo (2,6)')
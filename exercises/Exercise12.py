@@ -1,40 +1,29 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Gera um grid de valores para x1 e x2 (ex: de 0 a 5)
-x1_vals = np.linspace(0, 5, 200)
-x2_vals = np.linspace(0, 5, 200)
-X1, X2 = np.meshgrid(x1_vals, x2_vals)
+from linear_programming_and_applications_in_python import draw_boundaries, draw_region
+
+# Caixa do gráfico: x1 e x2 de 0 a 5
+box = (0, 5, 0, 5)
 
 # Restrições no plano x3=x4=x5=0
 # R1: 30x1 + 20x2 >= 80
 # R2: 60x1 + 20x2 >= 120
 # R3:  5x1 + 10x2 >= 30
-R1 = (30*X1 + 20*X2 >= 80)
-R2 = (60*X1 + 20*X2 >= 120)
-R3 = (5*X1 + 10*X2 >= 30)
-
-# Define a região factível
-feasible = R1 & R2 & R3
+A = np.array([[30, 20], [60, 20], [5, 10]])
+b = np.array([80, 120, 30])
+senses = ['>=', '>=', '>=']
 
 # Configuração do gráfico
 plt.figure(figsize=(6,6))
 plt.title("Corte do problema no plano (x1, x2)")
 
-# Preenche a área que satisfaz TODAS as restrições
-plt.contourf(X1, X2, feasible, levels=[0, 0.5, 1], alpha=0.3)
-
-# Desenha as retas de fronteira (igualdades)
-# R1: 30x1 + 20x2 = 80 => x2 = (80 - 30x1)/20
-x2_r1 = (80 - 30*x1_vals)/20
-# R2: 60x1 + 20x2 = 120 => x2 = (120 - 60x1)/20
-x2_r2 = (120 - 60*x1_vals)/20
-# R3:  5x1 + 10x2 = 30 => x2 = (30 - 5*x1_vals)/10
-x2_r3 = (30 - 5*x1_vals)/10
+# Preenche a área que satisfaz TODAS as restrições (polígono exato, recortado pela caixa)
+draw_region(plt.gca(), A, b, senses, box=box, color='C0')
 
-plt.plot(x1_vals, x2_r1, 'r--', label="30x1 + 20x2 = 80")
-plt.plot(x1_vals, x2_r2, 'g--', label="60x1 + 20x2 = 120")
-plt.plot(x1_vals, x2_r3, 'b--', label="5x1 + 10x2 = 30")
+# Desenha as retas de fronteira (igualdades) como segmentos dentro da caixa
+draw_boundaries(plt.gca(), A, b, box=box, colors=['r', 'g', 'b'], linestyle='--',
+                labels=["30x1 + 20x2 = 80", "60x1 + 20x2 = 120", "5x1 + 10x2 = 30"])
 
 # Destaca a solução ótima (x1=1.2, x2=2.4) no corte
 plt.plot(1.2, 2.4, 'mo', markersize=8, label='Ótimo (1.2, 2.4)')
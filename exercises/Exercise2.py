@@ -1,7 +1,10 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e solução de problemas de programação linear
 import numpy as np            # Biblioteca para cálculos numéricos e manipulação de arrays
 import matplotlib.pyplot as plt  # Biblioteca para geração de gráficos 2D
 from mpl_toolkits.mplot3d import Axes3D  # Módulo necessário para criação de gráficos 3D
+from linear_programming_and_applications_in_python import feasible_grid  # Amostragem vetorizada da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -24,55 +27,23 @@ from mpl_toolkits.mplot3d import Axes3D  # Módulo necessário para criação de
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-# Cria um objeto do tipo problema de programação linear, especificando que
-# o objetivo é maximizar a função receita.
-model = pulp.LpProblem("Exemplo_02", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise2.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: x1, x2, x3.
+lp = load_model(Path(__file__).with_name('Exercise2.toml'))
+model, (x1, x2, x3) = lp.to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# As variáveis representam a quantidade de equipes de cada tipo a ser empregada.
-# x1: Número de equipes do Tipo I
-# x2: Número de equipes do Tipo II
-# x3: Número de equipes do Tipo III
-# Todas as variáveis são contínuas e possuem limite inferior igual a 0.
-x1 = pulp.LpVariable('x1', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('x2', lowBound=0, cat='Continuous')
-x3 = pulp.LpVariable('x3', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# A função objetivo é maximizar a receita total obtida pela formação das equipes.
-# Receita total = 2000*x1 + 3000*x2 + 2800*x3
-model += 2000 * x1 + 3000 * x2 + 2800 * x3, "Receita"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# As restrições refletem a disponibilidade de mão de obra da empresa.
-
-# Restrição de engenheiros:
-# Cada equipe do Tipo I consome 2 engenheiros, do Tipo II consome 4 e do Tipo III consome 3.
-# O total de engenheiros disponíveis é 25.
-model += 2 * x1 + 4 * x2 + 3 * x3 <= 25, "Restricao_Engenheiros"
-
-# Restrição de técnicos:
-# Cada equipe do Tipo I consome 6 técnicos, do Tipo II consome 8 e do Tipo III consome 9.
-# O total de técnicos disponíveis é 40.
-model += 6 * x1 + 8 * x2 + 9 * x3 <= 40, "Restricao_Tecnicos"
-
-# =============================================================================
-# 5) Resolver o problema de otimização
+# 2) Resolver o problema de otimização
 # -----------------------------------------------------------------------------
 # O método solve() encontra a solução ótima que maximiza a receita, respeitando
 # as restrições impostas.
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 # Imprime o status da solução, os valores ótimos das variáveis e a receita máxima.
 print("Status da solução:", pulp.LpStatus[model.status])
@@ -82,7 +53,7 @@ print("x3 =", x3.varValue)
 print("Receita máxima = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 3D
+# 4) Visualizar a região factível e a solução ótima em 3D
 # -----------------------------------------------------------------------------
 # Para ilustrar a região factível, vamos varrer uma malha de pontos em torno dos
 # possíveis valores de x1, x2 e x3. Os intervalos escolhidos (0<=x1<=~7, 0<=x2<=~6,
@@ -91,23 +62,13 @@ x1_range = np.arange(0, 7, 0.25)  # Valores para x1 com incremento de 0.25
 x2_range = np.arange(0, 6, 0.25)  # Valores para x2 com incremento de 0.25
 x3_range = np.arange(0, 5, 0.25)  # Valores para x3 com incremento de 0.25
 
-# Lista para armazenar os pontos que satisfazem as restrições
-feasible_points = []
-
-# Percorre todos os pontos possíveis dentro dos intervalos definidos
-for xv1 in x1_range:
-    for xv2 in x2_range:
-        for xv3 in x3_range:
-            # Verifica se o ponto satisfaz a restrição de engenheiros
-            c1 = (2 * xv1 + 4 * xv2 + 3 * xv3 <= 25)
-            # Verifica se o ponto satisfaz a restrição de técnicos
-            c2 = (6 * xv1 + 8 * xv2 + 9 * xv3 <= 40)
-            # Se ambos os critérios forem satisfeitos, adiciona o ponto à lista
-            if c1 and c2:
-                feasible_points.append((xv1, xv2, xv3))
+# Matriz de restrições (engenheiros e técnicos) e vetor de disponibilidades,
+# direto do modelo carregado
+A, b = lp.A, lp.b
 
-# Converte a lista de pontos factíveis em um array NumPy para facilitar o plot
-feasible_points = np.array(feasible_points)
+# Avalia A @ x <= b para todos os pontos da malha de uma só vez e retorna
+# diretamente o array NumPy com os pontos factíveis
+feasible_points = feasible_grid(A, b, (x1_range, x2_range, x3_range))
 
 # Cria uma figura para o gráfico 3D
 fig = plt.figure(figsize=(10, 7))
@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np  # Biblioteca para cálculos numéricos e manipulação de arrays
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -21,51 +23,23 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-# Criamos um objeto de problema com o objetivo de maximizar o lucro por hora.
-model = pulp.LpProblem("Exemplo_03", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise3.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: x1 (Sapatos),
+# x2 (Cintos).
+model, (x1, x2) = load_model(Path(__file__).with_name('Exercise3.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# Definimos as variáveis:
-#   x1: número de sapatos produzidos por hora.
-#   x2: número de cintos produzidos por hora.
-# As variáveis são contínuas e não podem assumir valores negativos (lowBound=0).
-x1 = pulp.LpVariable('Sapatos', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('Cintos', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# A função objetivo visa maximizar o lucro por hora, calculado como:
-# Lucro = 5*x1 + 2*x2.
-model += 5 * x1 + 2 * x2, "Lucro_por_hora"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de tempo:
-# Se o sapateiro produzir x1 sapatos, ele utiliza x1/6 horas (6 sapatos/hora),
-# e se produzir x2 cintos, ele utiliza x2/5 horas (5 cintos/hora). Assim,
-# a soma dos tempos não pode exceder 1 hora.
-model += (1 / 6) * x1 + (1 / 5) * x2 <= 1, "Restricao_de_tempo"
-
-# Restrição de couro:
-# Cada sapato utiliza 2 unidades de couro e cada cinto 1 unidade. Portanto,
-# o total de couro consumido (2*x1 + x2) deve ser menor ou igual a 6 unidades.
-model += 2 * x1 + x2 <= 6, "Restricao_de_couro"
-
-# =============================================================================
-# 5) Resolver o problema de otimização
+# 2) Resolver o problema de otimização
 # -----------------------------------------------------------------------------
 # O método solve() do PuLP encontra a solução ótima que maximiza o lucro,
 # respeitando as restrições impostas.
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 # Imprime o status da solução, os valores ótimos para as variáveis e o lucro máximo.
 print("Status da solução:", pulp.LpStatus[model.status])
@@ -74,7 +48,7 @@ print("x2 (Cintos)  =", x2.varValue)
 print("Lucro máximo por hora = $", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima
+# 4) Visualizar a região factível e a solução ótima
 # -----------------------------------------------------------------------------
 # Para visualizar a região factível em 2D, definimos um intervalo de valores para x1
 # e calculamos os limites de x2 para cada restrição:
@@ -117,7 +91,7 @@ plt.legend()
 plt.grid(True)
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico antes de exibi-lo, garantindo que a figura completa seja gravada.
 # O caminho completo para o arquivo é especificado com uma string bruta para evitar
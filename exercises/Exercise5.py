@@ -1,7 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # Biblioteca para modelagem e resolução de problemas de programação linear
-import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
+from linear_programming_and_applications_in_python import draw_hull  # Casca triangulada exata da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -44,52 +46,24 @@ from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-# Cria um objeto do problema "Exemplo_05" com o objetivo de maximizar o lucro.
-model = pulp.LpProblem("Exemplo_05", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise5.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: xA (A), xB (B),
+# xC (C).
+lp = load_model(Path(__file__).with_name('Exercise5.toml'))
+model, (xA, xB, xC) = lp.to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# Define as variáveis:
-#   xA: número de lotes de combustível A a produzir.
-#   xB: número de lotes de combustível B a produzir.
-#   xC: número de lotes de combustível C a produzir.
-# Todas as variáveis são contínuas e não podem assumir valores negativos (lowBound=0).
-xA = pulp.LpVariable('A', lowBound=0, cat='Continuous')
-xB = pulp.LpVariable('B', lowBound=0, cat='Continuous')
-xC = pulp.LpVariable('C', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# A função objetivo visa maximizar o lucro total por lote:
-# Lucro = 20*xA + 22*xB + 18*xC
-model += 20 * xA + 22 * xB + 18 * xC, "Lucro"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de extrato mineral:
-# Cada lote de combustível A consome 8 L, B consome 5 L e C consome 4 L.
-# O total consumido não pode exceder 120 L.
-model += 8 * xA + 5 * xB + 4 * xC <= 120, "Extrato_mineral"
-
-# Restrição de solvente:
-# Cada lote de combustível A consome 5 L, B consome 4 L e C consome 2 L.
-# O total consumido não pode exceder 200 L.
-model += 5 * xA + 4 * xB + 2 * xC <= 200, "Solvente"
-
-# =============================================================================
-# 5) Resolver o problema de otimização
+# 2) Resolver o problema de otimização
 # -----------------------------------------------------------------------------
 # O método solve() encontra a solução ótima que maximiza o lucro,
 # respeitando as restrições impostas.
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 # Imprime o status da solução (por exemplo, "Ótimo"), os valores ótimos das variáveis
 # e o lucro máximo obtido.
@@ -100,50 +74,25 @@ print("xC (Combustível C) =", xC.varValue)
 print("Lucro máximo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 3D
+# 4) Visualizar a região factível e a solução ótima em 3D
 # -----------------------------------------------------------------------------
-# Para visualizar a região factível, definimos intervalos para as variáveis com base
-# nas restrições:
+# A região factível é limitada pelo extrato mineral:
 #   - Se produzir somente A: 8*xA <= 120  -> xA <= 15
 #   - Se produzir somente B: 5*xB <= 120  -> xB <= 24
 #   - Se produzir somente C: 4*xC <= 120  -> xC <= 30
-#
-# Para abranger uma gama um pouco maior, definimos:
-xA_range = np.arange(0, 21, 1)  # xA de 0 a 20
-xB_range = np.arange(0, 26, 1)  # xB de 0 a 25
-xC_range = np.arange(0, 36, 1)  # xC de 0 a 35
-
-# Lista para armazenar os pontos factíveis que satisfazem todas as restrições
-feasible_points = []
+# e é desenhada pela sua casca (vértices e faces exatos de A x <= b).
 
-# Varre os intervalos de xA, xB e xC e verifica as condições de cada restrição
-for a in xA_range:
-    for b in xB_range:
-        for c in xC_range:
-            # Restrição de extrato mineral: 8*a + 5*b + 4*c <= 120
-            cond1 = (8 * a + 5 * b + 4 * c <= 120)
-            # Restrição de solvente: 5*a + 4*b + 2*c <= 200
-            cond2 = (5 * a + 4 * b + 2 * c <= 200)
-            if cond1 and cond2:
-                feasible_points.append((a, b, c))
-
-# Converte a lista em um array NumPy para facilitar a plotagem
-feasible_points = np.array(feasible_points)
+# Matriz de restrições, direto do modelo carregado:
+#   Extrato mineral: 8*a + 5*b + 4*c <= 120
+#   Solvente:        5*a + 4*b + 2*c <= 200
+A, b = lp.A, lp.b
 
 # Cria uma figura para o gráfico 3D
 fig = plt.figure(figsize=(10, 7))
 ax = fig.add_subplot(111, projection='3d')
 
-# Plota os pontos da região factível (em cinza com transparência)
-ax.scatter(
-    feasible_points[:, 0],  # Coordenada xA
-    feasible_points[:, 1],  # Coordenada xB
-    feasible_points[:, 2],  # Coordenada xC
-    s=5,  # Tamanho dos pontos
-    color='gray',  # Cor dos pontos
-    alpha=0.3,  # Transparência para melhor visualização
-    label='Região Factível'
-)
+# Desenha a região factível como casca triangulada (em cinza com transparência)
+draw_hull(ax, A, b, color='gray', alpha=0.3, label='Região Factível')
 
 # Destaca a solução ótima encontrada com um marcador vermelho
 ax.scatter(
@@ -159,7 +108,7 @@ ax.set_title('Região Factível (Exemplo 05) e Solução Ótima')
 ax.legend()
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 3D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
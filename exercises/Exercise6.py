@@ -1,7 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # Biblioteca para modelagem e resolução de problemas de programação linear
-import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
+from linear_programming_and_applications_in_python import draw_hull  # Casca triangulada exata da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -52,57 +54,24 @@ from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-# Cria um objeto do problema com o objetivo de maximizar a margem de contribuição.
-model = pulp.LpProblem("Exemplo_06", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise6.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: xv
+# (GasolinaVerde), xa (GasolinaAzul), xc (GasolinaComum).
+lp = load_model(Path(__file__).with_name('Exercise6.toml'))
+model, (xv, xa, xc) = lp.to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# Definimos as variáveis:
-#   xv: litros de gasolina verde produzidos por semana.
-#   xa: litros de gasolina azul produzidos por semana.
-#   xc: litros de gasolina comum produzidos por semana.
-# As variáveis são contínuas e não podem ser negativas.
-xv = pulp.LpVariable('GasolinaVerde', lowBound=0, cat='Continuous')
-xa = pulp.LpVariable('GasolinaAzul', lowBound=0, cat='Continuous')
-xc = pulp.LpVariable('GasolinaComum', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# A função objetivo é maximizar a margem total de contribuição:
-#   Margem = 0.30*xv + 0.25*xa + 0.20*xc
-model += 0.30 * xv + 0.25 * xa + 0.20 * xc, "MargemContribuicao"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de gasolina pura:
-model += 0.22 * xv + 0.52 * xa + 0.74 * xc <= 9_600_000, "GasolinaPura"
-
-# Restrição de octana:
-model += 0.50 * xv + 0.34 * xa + 0.20 * xc <= 4_800_000, "Octana"
-
-# Restrição de aditivo:
-model += 0.28 * xv + 0.14 * xa + 0.06 * xc <= 2_200_000, "Aditivo"
-
-# Restrição de demanda: gasolina comum deve ser pelo menos 16 vezes a gasolina verde
-model += xc - 16 * xv >= 0, "Comum_minimo_16_vezes_Verde"
-
-# Restrição de produção de gasolina azul:
-model += xa <= 600_000, "Azul_max_600mil"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 # Utiliza o método solve() para encontrar a solução ótima que maximiza a margem
 # de contribuição, respeitando todas as restrições.
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 # Imprime o status da solução, os valores ótimos das variáveis e a margem total de contribuição.
 print("Status da solução:", pulp.LpStatus[model.status])
@@ -112,48 +81,22 @@ print("xc (Gasolina Comum) =", xc.varValue)
 print("Margem total de contribuição = $", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 3D
+# 4) Visualizar a região factível e a solução ótima em 3D
 # -----------------------------------------------------------------------------
-# Devido aos grandes números envolvidos, a visualização da região factível é feita por amostragem
-# com intervalos maiores para não sobrecarregar o processamento. Os intervalos escolhidos são:
-#   - xv_range: de 0 até aproximadamente 8,5 milhões com passo de 500.000 litros.
-#   - xa_range: de 0 até aproximadamente 650.000 com passo de 100.000 litros (limitado por xa <= 600.000).
-#   - xc_range: de 0 até aproximadamente 13,5 milhões com passo de 500.000 litros.
-xv_range = np.arange(0, 8_500_000, 500_000)  # Ex: 0, 500k, 1M, ... até ~8M
-xa_range = np.arange(0, 650_000, 100_000)  # Ex: 0, 100k, 200k, ... até 600k
-xc_range = np.arange(0, 13_500_000, 500_000)  # Ex: 0, 500k, 1M, ... até ~13M
+# Mesmo com os grandes números envolvidos, a região é desenhada exata: os
+# vértices e as faces do poliedro saem direto das restrições, sem amostragem.
 
-feasible_points = []  # Lista para armazenar pontos factíveis (amostrados)
-
-# Verifica, para cada combinação de xv, xa e xc, se as restrições são satisfeitas
-for v in xv_range:
-    for a in xa_range:
-        for c in xc_range:
-            cond_gasolina = 0.22 * v + 0.52 * a + 0.74 * c <= 9_600_000
-            cond_octana = 0.50 * v + 0.34 * a + 0.20 * c <= 4_800_000
-            cond_aditivo = 0.28 * v + 0.14 * a + 0.06 * c <= 2_200_000
-            cond_comum = c >= 16 * v  # xc deve ser pelo menos 16 vezes xv
-            cond_azul = a <= 600_000  # xa deve ser no máximo 600,000
-            if cond_gasolina and cond_octana and cond_aditivo and cond_comum and cond_azul:
-                feasible_points.append((v, a, c))
-
-# Converte a lista em um array NumPy para facilitar a plotagem
-feasible_points = np.array(feasible_points)
+# Matriz de restrições, lado direito e sentido de cada linha, direto do modelo
+# carregado: gasolina pura, octana e aditivo (<=), comum >= 16 * verde e
+# azul <= 600 mil
+A, b, senses = lp.A, lp.b, lp.senses
 
 # Cria a figura para o gráfico 3D
 fig = plt.figure(figsize=(10, 7))
 ax = fig.add_subplot(111, projection='3d')
 
-# Plota os pontos da região factível (amostrados) em cinza com transparência
-ax.scatter(
-    feasible_points[:, 0],  # Valores de xv (Gasolina Verde)
-    feasible_points[:, 1],  # Valores de xa (Gasolina Azul)
-    feasible_points[:, 2],  # Valores de xc (Gasolina Comum)
-    s=5,
-    color='gray',
-    alpha=0.3,
-    label='Região Factível (amostrada)'
-)
+# Desenha a região factível como casca triangulada em cinza com transparência
+draw_hull(ax, A, b, senses, color='gray', alpha=0.3, label='Região Factível')
 
 # Destaca a solução ótima encontrada (calculada pelo solver) com um ponto vermelho
 ax.scatter(
@@ -173,7 +116,7 @@ ax.set_title('Região Factível (Exemplo 06) e Solução Ótima')
 ax.legend()
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 3D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
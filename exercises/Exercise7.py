@@ -1,7 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
-import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
+from linear_programming_and_applications_in_python import draw_hull  # Casca triangulada exata da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -46,82 +48,22 @@ from mpl_toolkits.mplot3d import Axes3D  # Necessário para criar gráficos 3D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exemplo_07", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise7.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: xP
+# (Facas_Padrao), xM (Facas_Media), xG (Facas_Grande).
+lp = load_model(Path(__file__).with_name('Exercise7.toml'))
+model, (xP, xM, xG) = lp.to_pulp()
 
 # =============================================================================
-# 2) Variáveis de decisão
-# -----------------------------------------------------------------------------
-xP = pulp.LpVariable("Facas_Padrao", lowBound=0, cat='Continuous')
-xM = pulp.LpVariable("Facas_Media",  lowBound=0, cat='Continuous')
-xG = pulp.LpVariable("Facas_Grande", lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Tempos de processamento (em segundos) para cada modelo e máquina
-# -----------------------------------------------------------------------------
-# Valores reais extraídos da tabela:
-#   Padrão (P), Médio (M), Grande (G)
-# Corte
-cP, cM, cG = 10, 10, 12
-# Modelagem
-sP, sM, sG = 10, 15.5, 17
-# Afiação
-aP, aM, aG = 12, 16, 19
-# Cabo
-hP, hM, hG = 19, 21, 24
-# Montagem
-tP, tM, tG = 19, 21, 22
-
-# =============================================================================
-# 4) Disponibilidade das máquinas (horas convertidas em segundos)
-# -----------------------------------------------------------------------------
-# Multiplicamos cada disponibilidade (horas/dia) por 3600 para obter em segundos.
-CUT_AVAILABLE      = 4 * 3600  # Corte
-SHAPE_AVAILABLE    = 6 * 3600  # Modelagem
-SHARP_AVAILABLE    = 6 * 3600  # Afiação
-HANDLE_AVAILABLE   = 8 * 3600  # Cabo
-ASSEMBLY_AVAILABLE = 8 * 3600  # Montagem
-
-# =============================================================================
-# 5) Restrição de matéria-prima (chapas metálicas)
-# -----------------------------------------------------------------------------
-# Cada chapa tem 2,00 m x 1,00 m = 20.000 cm²
-# Estão disponíveis 2,5 chapas => 2,5 * 20.000 = 50.000 cm²
-# Consumo de cada modelo (em cm²):
-#   Padrão: 25, Médio: 32, Grande: 45
-area_total = 50_000
-
-# =============================================================================
-# 6) Função objetivo (lucro)
-# -----------------------------------------------------------------------------
-# Lucro unitário:
-#   Padrão: R$3,00
-#   Médio:  R$4,00
-#   Grande: R$4,70
-model += 3.0*xP + 4.0*xM + 4.70*xG, "Lucro"
-
-# =============================================================================
-# 7) Adicionar restrições de tempo em cada máquina
-# -----------------------------------------------------------------------------
-model += cP*xP + cM*xM + cG*xG <= CUT_AVAILABLE,      "Limite_Corte"
-model += sP*xP + sM*xM + sG*xG <= SHAPE_AVAILABLE,    "Limite_Modelagem"
-model += aP*xP + aM*xM + aG*xG <= SHARP_AVAILABLE,    "Limite_Afiacao"
-model += hP*xP + hM*xM + hG*xG <= HANDLE_AVAILABLE,   "Limite_Cabo"
-model += tP*xP + tM*xM + tG*xG <= ASSEMBLY_AVAILABLE, "Limite_Montagem"
-
-# =============================================================================
-# 8) Restrição de área (chapas metálicas)
-# -----------------------------------------------------------------------------
-model += 25*xP + 32*xM + 45*xG <= area_total, "Limite_Chapas"
-
-# =============================================================================
-# 9) Resolver o problema
+# 2) Resolver o problema
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 10) Mostrar resultados no console
+# 3) Mostrar resultados no console
 # -----------------------------------------------------------------------------
 print("Status da Solução =", pulp.LpStatus[model.status])
 print("xP (Facas Padrão)  =", xP.varValue)
@@ -130,49 +72,20 @@ print("xG (Facas Grandes) =", xG.varValue)
 print("Lucro Máximo = R$ ", pulp.value(model.objective))
 
 # =============================================================================
-# 11) Plotagem em 3D da região factível (amostrada)
+# 4) Plotagem em 3D da região factível
 # -----------------------------------------------------------------------------
-# Definimos intervalos (xP_range, xM_range, xG_range) e varremos as restrições.
-# Intervalos muito grandes e passos pequenos podem deixar o loop lento.
-# Ajuste conforme necessário.
-
-xP_range = np.arange(0, 3001, 100)  # 0..3000, passo de 100
-xM_range = np.arange(0, 3001, 100)
-xG_range = np.arange(0, 3001, 100)
-
-feasible_points = []
-
-for p in xP_range:
-    for m in xM_range:
-        for g in xG_range:
-            # Verifica primeiro a restrição de área (mais rápida de checar).
-            if 25*p + 32*m + 45*g <= area_total:
-                # Agora verifica as restrições de cada máquina:
-                cond_corte  = (cP*p + cM*m + cG*g) <= CUT_AVAILABLE
-                cond_model  = (sP*p + sM*m + sG*g) <= SHAPE_AVAILABLE
-                cond_afia   = (aP*p + aM*m + aG*g) <= SHARP_AVAILABLE
-                cond_cabo   = (hP*p + hM*m + hG*g) <= HANDLE_AVAILABLE
-                cond_mont   = (tP*p + tM*m + tG*g) <= ASSEMBLY_AVAILABLE
-
-                if cond_corte and cond_model and cond_afia and cond_cabo and cond_mont:
-                    feasible_points.append((p, m, g))
+# A região é desenhada pela sua casca: vértices e faces exatos do poliedro
+# A x <= b (x >= 0), triangulados, no lugar de uma nuvem de 31^3 pontos.
 
-feasible_points = np.array(feasible_points)
+# Matriz de restrições (uma linha por máquina + chapas) e disponibilidades,
+# direto do modelo carregado
+A, b = lp.A, lp.b
 
 fig = plt.figure(figsize=(10, 7))
 ax = fig.add_subplot(111, projection='3d')
 
-# Se houver pontos factíveis, plotá-los em cinza
-if len(feasible_points) > 0:
-    ax.scatter(
-        feasible_points[:, 0],
-        feasible_points[:, 1],
-        feasible_points[:, 2],
-        s=5,
-        color='gray',
-        alpha=0.3,
-        label='Região Factível (amostrada)'
-    )
+# Desenha a região factível (se não for vazia) em cinza
+draw_hull(ax, A, b, color='gray', alpha=0.3, label='Região Factível')
 
 # Destaca a solução ótima em vermelho
 ax.scatter(
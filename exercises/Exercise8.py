@@ -1,7 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 from mpl_toolkits.mplot3d import Axes3D  # Módulo para gráficos 3D (caso queira usar)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -45,43 +47,20 @@ from mpl_toolkits.mplot3d import Axes3D  # Módulo para gráficos 3D (caso queir
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximizar)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exemplo_08", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise8.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: x1, x2.
+model, (x1, x2) = load_model(Path(__file__).with_name('Exercise8.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# x1: quantidade a produzir de P1
-# x2: quantidade a produzir de P2
-x1 = pulp.LpVariable('x1', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('x2', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# Max Z = 1900*x1 + 2100*x2
-model += 1900 * x1 + 2100 * x2, "Receita"
-
-# =============================================================================
-# 4) Adicionar as restrições
-# -----------------------------------------------------------------------------
-# Forja: 4*x1 + 2*x2 <= 20
-model += 4 * x1 + 2 * x2 <= 20, "Restricao_Forja"
-
-# Polimento: 2*x1 + 3*x2 <= 10
-model += 2 * x1 + 3 * x2 <= 10, "Restricao_Polimento"
-
-# Matéria-prima: 100*x1 + 200*x2 <= 500
-model += 100 * x1 + 200 * x2 <= 500, "Restricao_MateriaPrima"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da solução:", pulp.LpStatus[model.status])
 print("x1 (P1) =", x1.varValue)
@@ -89,7 +68,7 @@ print("x2 (P2) =", x2.varValue)
 print("Receita máxima = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para o gráfico, definimos um intervalo para x1 e calculamos os limites de x2
 # com base em cada restrição. Em seguida, preenchemos a região factível.
@@ -140,7 +119,7 @@ plt.legend()
 plt.grid(True)
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 2D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
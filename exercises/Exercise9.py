@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -35,46 +38,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Minimização)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exemplo_09", pulp.LpMinimize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# Exercise9.toml, ao lado deste script. load_model() lê o arquivo e to_pulp()
+# monta o pulp.LpProblem, com as variáveis na ordem do arquivo: xG
+# (Onibus_Grande), xP (Onibus_Pequeno).
+model, (xG, xP) = load_model(Path(__file__).with_name('Exercise9.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# xG: número de ônibus grandes a serem usados (tipo inteiro)
-# xP: número de ônibus pequenos a serem usados (tipo inteiro)
-xG = pulp.LpVariable('Onibus_Grande', lowBound=0, cat='Integer')
-xP = pulp.LpVariable('Onibus_Pequeno', lowBound=0, cat='Integer')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# Min Z = 190 * xG + 140 * xP
-model += 190 * xG + 140 * xP, "Custo_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# (1) Capacidade: 60*xG + 40*xP >= 600 (garante o transporte de pelo menos 600 funcionários)
-model += 60 * xG + 40 * xP >= 600, "Capacidade_Total"
-
-# (2) Limite de ônibus grandes: xG <= 8
-model += xG <= 8, "Max_Onibus_Grandes"
-
-# (3) Limite de ônibus pequenos: xP <= 12
-model += xP <= 12, "Max_Onibus_Pequenos"
-
-# (4) Limite de motoristas: xG + xP <= 13
-model += xG + xP <= 13, "Max_Motoristas"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("xG (Ônibus Grandes) =", xG.varValue)
@@ -82,7 +60,7 @@ print("xP (Ônibus Pequenos) =", xP.varValue)
 print("Custo Mínimo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Como as variáveis são inteiras, a região factível real é discreta, mas para visualização
 # utilizamos uma aproximação contínua das restrições.
@@ -106,25 +84,7 @@ xP_motoristas = 13 - xG_vals
 #   - xG <= 8 e xP <= 12
 #   - xG >= 0, xP >= 0
 #
-# Para preenchimento, para cada xG calculamos os limites inferiores e superiores para xP:
-xP_feasible_min = np.maximum(15 - 1.5 * xG_vals, 0)  # xP deve ser maior ou igual a essa fronteira e não negativo
-xP_feasible_max = np.minimum(13 - xG_vals, 12)  # xP deve ser menor ou igual a essa fronteira e não ultrapassar 12
-
-# Montar o polígono da região factível
-feasible_upper = []
-feasible_lower = []
-for i, xg in enumerate(xG_vals):
-    lower = xP_feasible_min[i]
-    upper = xP_feasible_max[i]
-    if lower <= upper:
-        feasible_lower.append(lower)
-        feasible_upper.append(upper)
-    else:
-        feasible_lower.append(np.nan)
-        feasible_upper.append(np.nan)
-
-feasible_lower = np.array(feasible_lower)
-feasible_upper = np.array(feasible_upper)
+# O polígono da região (relaxação contínua) sai direto dessas restrições do modelo.
 
 # Criação da figura
 plt.figure(figsize=(8, 6))
@@ -136,7 +96,7 @@ plt.axvline(x=8, color='red', label='xG = 8')
 plt.axhline(y=12, color='orange', label='xP = 12')
 
 # Preencher a região factível
-plt.fill_between(xG_vals, feasible_lower, feasible_upper, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 8.5, 0, 12.5), label='Região Factível')
 
 # Marcar a solução ótima encontrada
 plt.scatter(xG.varValue, xP.varValue, color='black', zorder=5, label='Solução Ótima')
@@ -151,7 +111,7 @@ plt.legend()
 plt.grid(True)
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 2D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
@@ -0,0 +1,21 @@
+from .sampling import as_upper_system, feasible_grid
+from .vertices import Polytope, enumerate_vertices, facet_structure, polytope, with_nonnegativity
+from .models import LinearModel, clear_model_cache, dump_model, from_pulp, load_model, parse_model
+from .simplex import StandardForm, standard_form, tableau_simplex
+from .solvers import BACKENDS, Solution, solve
+from .revised import BasisFactor, SimplexResult, lu_factor, lu_solve, revised_simplex
+from .batched import BatchSolution, solve_batch, solve_scenarios
+from .parametric import ParametricResult, rhs_sweep
+from .sensitivity import ConstraintRange, SensitivityReport, VariableRange, sensitivity
+from .cpm import ActivityNetwork, Schedule, cpm, topological_levels
+from .mermaid import MermaidChart, check_chart, mermaid_lines, read_mermaid, write_mermaid
+from .pert import PertSimulation, pert_estimates, sample_durations, simulate
+from .crashing import CrashCurve, crash_curve, crash_model
+from .spreadsheets import ActivityTable, clear_workbook_cache, read_activity_boxes, read_activity_table, read_lp_sheets
+from .branch import branch_and_bound
+from .enumeration import EnumerationResult, enumerate_plans
+from .presolve import PresolveResult, presolve
+from .sparse import SparseModel
+from .builder import ModelBuilder, add_pulp_constraints
+from .regions import boundary_segments, draw_boundaries, draw_model_region, draw_region, feasible_polygon, integer_points, model_system
+from .hull import HullMesh, draw_hull, hull_mesh
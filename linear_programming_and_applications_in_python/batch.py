@@ -0,0 +1,113 @@
+import argparse  # Interface de linha de comando
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor  # Resolução paralela dos modelos
+from pathlib import Path
+
+from .models import load_model
+from .solvers import BACKENDS
+
+# =============================================================================
+# RESOLUÇÃO EM LOTE DOS MODELOS DO REPOSITÓRIO
+# -----------------------------------------------------------------------------
+# Em vez de rodar cada script (que importa o matplotlib, monta a figura e
+# bloqueia em plt.show()), este módulo encontra os arquivos de modelo .toml
+# de exercises/, prova-01/ e prova-02/, resolve todos sem interface gráfica
+# num pool de processos e imprime uma única tabela com status, valor objetivo
+# e valores das variáveis.
+#
+# Uso:
+#   python -m linear_programming_and_applications_in_python.batch
+#   python -m linear_programming_and_applications_in_python.batch prova-01 -j 4
+#   python -m linear_programming_and_applications_in_python.batch -b numpy
+# =============================================================================
+
+DEFAULT_FOLDERS = ('exercises', 'prova-01', 'prova-02')
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def discover_models(folders=DEFAULT_FOLDERS, root=ROOT):
+    """Lista os arquivos de modelo (.toml) das pastas indicadas, em ordem."""
+    paths = []
+    for folder in folders:
+        base = Path(folder) if Path(folder).is_absolute() else Path(root) / folder
+        if base.is_file():
+            paths.append(base)
+        else:
+            paths.extend(sorted(base.rglob('*.toml')))
+    return paths
+
+
+def solve_model(path, backend='cbc'):
+    """Resolve um arquivo de modelo e retorna uma linha da tabela."""
+    start = time.perf_counter()
+    model = load_model(path)
+    if backend in ('numpy', 'revised') and model.integer.any():
+        backend = 'bnb'  # simplex puro só resolve modelos contínuos
+    solution = model.solve(backend)
+    return {
+        'path': str(path),
+        'name': model.name,
+        'status': solution.status,
+        'objective': solution.objective,
+        'values': {k: float(v) for k, v in solution.values.items()},
+        'backend': solution.backend,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def run_batch(paths, jobs=None, backend='cbc'):
+    """Resolve todos os modelos, em paralelo quando `jobs` > 1."""
+    paths = list(paths)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) <= 1:
+        return [solve_model(p, backend) for p in paths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(solve_model, paths, [backend] * len(paths)))
+
+
+def _fmt(value):
+    if value is None:
+        return '-'
+    return f"{value:.6g}"
+
+
+def format_table(results, root=ROOT):
+    """Monta a tabela de resultados em texto."""
+    header = ('Modelo', 'Status', 'Objetivo', 'Variáveis')
+    rows = []
+    for r in results:
+        try:
+            label = str(Path(r['path']).relative_to(root))
+        except ValueError:
+            label = r['path']
+        values = ', '.join(f"{k}={_fmt(v)}" for k, v in r['values'].items())
+        rows.append((label, r['status'], _fmt(r['objective']), values))
+
+    widths = [max(len(str(row[i])) for row in (header, *rows)) for i in range(3)]
+    lines = ['  '.join(h.ljust(w) for h, w in zip(header[:3], widths)) + '  ' + header[3]]
+    lines.append('-' * len(lines[0]))
+    for row in rows:
+        lines.append('  '.join(str(c).ljust(w) for c, w in zip(row[:3], widths)) + '  ' + row[3])
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve em lote os modelos de PL do repositório.")
+    parser.add_argument('folders', nargs='*', default=list(DEFAULT_FOLDERS),
+                        help="pastas (ou arquivos .toml) a resolver")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="número de processos (padrão: núcleos disponíveis)")
+    parser.add_argument('-b', '--backend', default='cbc', choices=sorted(BACKENDS),
+                        help="backend de resolução (padrão: cbc)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_batch(discover_models(args.folders), jobs=args.jobs, backend=args.backend)
+    print(format_table(results))
+    print(f"\n{len(results)} modelos resolvidos em {time.perf_counter() - start:.2f} s")
+    return 0 if all(r['status'] == 'Optimal' for r in results) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
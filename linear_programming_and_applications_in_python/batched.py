@@ -0,0 +1,215 @@
+from dataclasses import dataclass  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .simplex import TOL
+
+# =============================================================================
+# SIMPLEX EM LOTE: MUITOS PROBLEMAS PEQUENOS DE UMA SÓ VEZ
+# -----------------------------------------------------------------------------
+# Para K problemas com o mesmo formato (m restrições, n variáveis), como os
+# cenários de preço e capacidade do modelo de ternos/vestidos da prova-01/q1,
+# montamos K tableaus empilhados num único array (K, m+1, colunas) e fazemos
+# todos pivotarem juntos: a cada iteração, a escolha da coluna que entra, o
+# teste da razão e o pivô são operações NumPy sobre o lote inteiro. Problemas
+# que já terminaram simplesmente saem do conjunto ativo.
+#
+# Forma aceita (mesmos sentidos para todo o lote):
+#   min/max c_k @ x   sujeito a   A_k x (senses) b_k,   x >= 0
+# =============================================================================
+
+STATUS = np.array(['Optimal', 'Infeasible', 'Unbounded', 'Not Solved'])
+OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED = range(4)
+
+
+@dataclass
+class BatchSolution:
+    """Resultado de solve_batch; cada campo tem o lote no primeiro eixo."""
+    status: np.ndarray       # textos no vocabulário do pulp ('Optimal', ...)
+    objective: np.ndarray    # nan quando não ótimo
+    x: np.ndarray            # (K, n), nan quando não ótimo
+    iterations: np.ndarray   # iterações (fases 1 + 2) de cada problema
+
+    @property
+    def optimal(self):
+        return self.status == 'Optimal'
+
+
+def _pivot(T, idx, r, s):
+    # Pivô simultâneo nos tableaus T[idx], linha r[k] e coluna s[k]
+    k = np.arange(len(idx))
+    tab = T[idx]
+    row = tab[k, r] / tab[k, r, s][:, None]
+    col = tab[k, :, s].copy()
+    col[k, r] = 0.0
+    tab -= col[:, :, None] * row[:, None, :]
+    tab[k, r] = row
+    T[idx] = tab
+
+
+def _iterate(T, basis, active, allowed, is_art, status, iterations, max_iter, tol):
+    # Iterações em lote até todos os problemas ativos pararem
+    m = basis.shape[1]
+    big = np.iinfo(np.intp).max
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            return
+        tab = T[idx]
+        d = np.where(allowed[idx], tab[:, -1, :-1], np.inf)
+        s = np.argmin(d, axis=1)
+        k = np.arange(len(idx))
+
+        done = d[k, s] >= -tol
+        active[idx[done]] = False
+        keep = ~done
+        idx, s, tab, k = idx[keep], s[keep], tab[keep], np.arange(int(keep.sum()))
+        if len(idx) == 0:
+            return
+
+        column = tab[k, :m, s]
+        rhs = tab[:, :m, -1]
+        positive = column > tol
+        ratios = np.where(positive, rhs / np.where(positive, column, 1.0), np.inf)
+        # Artificial básica em nível zero sai com razão 0 (qualquer sinal),
+        # para nunca voltar a ficar positiva na fase 2.
+        art_rows = is_art[basis[idx]] & (np.abs(column) > tol) & (rhs <= tol)
+        ratios = np.where(art_rows, 0.0, ratios)
+
+        best = ratios.min(axis=1)
+        unbounded = ~np.isfinite(best)
+        status[idx[unbounded]] = UNBOUNDED
+        active[idx[unbounded]] = False
+        go = ~unbounded
+        idx, s, ratios, best = idx[go], s[go], ratios[go], best[go]
+        if len(idx) == 0:
+            continue
+
+        ties = ratios <= (best + tol * (1.0 + np.abs(best)))[:, None]
+        r = np.argmin(np.where(ties, basis[idx], big), axis=1)
+        _pivot(T, idx, r, s)
+        basis[idx, r] = s
+        iterations[idx] += 1
+    status[active] = NOT_SOLVED
+    active[:] = False
+
+
+def _solve_chunk(c, A, b, senses, maximize, max_iter, tol):
+    K, m, n = A.shape
+    sign = -1.0 if maximize else 1.0
+
+    # Folgas (+1) e excessos (-1); linhas com b < 0 são multiplicadas por -1
+    slack_sign = np.where(senses == '>=', -1.0, 1.0) * (senses != '=')
+    flip = np.where(b < 0, -1.0, 1.0)
+    rhs = b * flip
+
+    n_slack = int((senses != '=').sum())
+    slack_rows = np.flatnonzero(senses != '=')
+    N = n + n_slack
+    W = N + m + 1  # colunas: variáveis, folgas, artificiais (uma por linha), rhs
+
+    T = np.zeros((K, m + 1, W))
+    T[:, :m, :n] = A * flip[:, :, None]
+    T[:, slack_rows, n + np.arange(n_slack)] = slack_sign[slack_rows] * flip[:, slack_rows]
+    T[:, :m, -1] = rhs
+
+    # Base inicial: folga quando ela tem +1 na linha, artificial caso contrário
+    slack_col = np.full(m, -1)
+    slack_col[slack_rows] = n + np.arange(n_slack)
+    slack_ok = (slack_col >= 0) & (slack_sign * flip > 0)
+    basis = np.where(slack_ok, slack_col, N + np.arange(m))
+    needs_art = ~slack_ok
+    T[:, :m, N:N + m] = np.eye(m) * needs_art[:, :, None]
+
+    is_art = np.zeros(W - 1, dtype=bool)
+    is_art[N:] = True
+    status = np.full(K, OPTIMAL)
+    iterations = np.zeros(K, dtype=np.intp)
+
+    # Fase 1 (apenas onde há artificiais): min soma das artificiais
+    phase1 = needs_art.any(axis=1)
+    if phase1.any():
+        T[:, -1, N:N + m] = needs_art
+        T[:, -1] -= np.einsum('km,kmw->kw', needs_art.astype(float), T[:, :m])
+        allowed = np.broadcast_to(~is_art, (K, W - 1)).copy()
+        allowed[:, N:] = needs_art
+        _iterate(T, basis, phase1.copy(), allowed, is_art, status, iterations, max_iter, tol)
+        infeasible = phase1 & (-T[:, -1, -1] > tol * (1.0 + np.abs(rhs).max(axis=1)))
+        status[infeasible] = INFEASIBLE
+
+    # Fase 2: custos reduzidos do objetivo original, artificiais proibidas
+    run = status == OPTIMAL
+    cost = np.zeros((K, W - 1))
+    cost[:, :n] = sign * c
+    T[:, -1, :-1] = cost
+    T[:, -1, -1] = 0.0
+    c_B = np.take_along_axis(cost, basis, axis=1)
+    T[:, -1] -= np.einsum('km,kmw->kw', c_B, T[:, :m])
+    allowed = np.broadcast_to(~is_art, (K, W - 1))
+    _iterate(T, basis, run.copy(), allowed, is_art, status, iterations, max_iter, tol)
+
+    x = np.zeros((K, W - 1))
+    np.put_along_axis(x, basis, T[:, :m, -1], axis=1)
+    x = x[:, :n]
+    objective = np.einsum('kn,kn->k', c, x)
+    ok = status == OPTIMAL
+    x[~ok] = np.nan
+    objective[~ok] = np.nan
+    return status, objective, x, iterations
+
+
+def solve_batch(c, A, b, senses=None, maximize=False, max_iter=1_000, tol=TOL, chunk_size=100_000):
+    """Resolve K problemas de mesmo formato em lote.
+
+    c : (K, n) ou (n,);  A : (K, m, n) ou (m, n);  b : (K, m) ou (m,).
+    Entradas sem o eixo do lote são repetidas para todos os problemas.
+    `senses` (m,) vale para todo o lote (padrão: todas '<=').
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    K = max(c.shape[0] if c.ndim == 2 else 1,
+            A.shape[0] if A.ndim == 3 else 1,
+            b.shape[0] if b.ndim == 2 else 1)
+    m, n = A.shape[-2:]
+    senses = np.asarray(['<='] * m if senses is None else senses)
+
+    status = np.empty(K, dtype=np.intp)
+    objective = np.empty(K)
+    x = np.empty((K, n))
+    iterations = np.empty(K, dtype=np.intp)
+    for start in range(0, K, chunk_size):
+        sl = slice(start, min(start + chunk_size, K))
+        chunk = _solve_chunk(
+            np.broadcast_to(c, (K, n))[sl],
+            np.broadcast_to(A, (K, m, n))[sl],
+            np.broadcast_to(b, (K, m))[sl],
+            senses, maximize, max_iter, tol,
+        )
+        status[sl], objective[sl], x[sl], iterations[sl] = chunk
+    return BatchSolution(status=STATUS[status], objective=objective, x=x, iterations=iterations)
+
+
+def solve_scenarios(model, objective=None, rhs=None, **options):
+    """Resolve cenários de um LinearModel contínuo variando c e/ou b.
+
+    `objective` tem shape (K, n) e `rhs` shape (K, m); o que não for dado
+    vem do próprio modelo. Limites superiores finitos viram linhas '<='.
+    """
+    if np.any(model.integer):
+        raise ValueError(f"{model.name}: solve_scenarios resolve apenas modelos contínuos")
+    if np.any(model.lower != 0):
+        raise ValueError(f"{model.name}: solve_scenarios supõe limites inferiores nulos")
+    c = model.objective if objective is None else np.asarray(objective, dtype=float)
+    b = model.b if rhs is None else np.asarray(rhs, dtype=float)
+    A = np.asarray(model.A)
+    senses = list(model.senses)
+
+    bounded = np.flatnonzero(np.isfinite(model.upper))
+    if len(bounded):
+        rows = np.eye(len(model.variables))[bounded]
+        A = np.vstack([A, rows])
+        senses += ['<='] * len(bounded)
+        extra = model.upper[bounded]
+        b = np.concatenate([b, np.broadcast_to(extra, b.shape[:-1] + extra.shape)], axis=-1)
+    return solve_batch(c, A, b, senses=senses, maximize=model.maximize, **options)
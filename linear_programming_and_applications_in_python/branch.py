@@ -0,0 +1,138 @@
+import heapq  # Fila de nós pelo limitante (melhor primeiro)
+import math
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .revised import revised_simplex
+
+# =============================================================================
+# BRANCH-AND-BOUND PARA PROGRAMAÇÃO INTEIRA
+# -----------------------------------------------------------------------------
+# Os modelos com cat='Integer' (ônibus do Exercise9 e da prova-02/q9) são
+# resolvidos aqui sem o CBC e sem enumerar todos os pares (x, y), como faz
+# prova-04/exercise10solution2.py:
+#
+#   1. resolve a relaxação linear do nó (simplex revisado);
+#   2. se o limitante do nó não supera a melhor solução inteira já
+#      encontrada (incumbente), o nó é podado;
+#   3. se a solução é inteira, vira a nova incumbente;
+#   4. senão, ramifica na variável mais fracionária x_j = v:
+#         filho 1:  x_j <= floor(v)        filho 2:  x_j >= ceil(v)
+#
+# Cada ramificação é uma linha a mais na forma padrão, com uma folga nova
+# (ou só o lado direito da linha já existente, se a variável já foi
+# ramificada no mesmo sentido). A base ótima do pai mais essa folga continua
+# dual factível no filho, então o simplex dual parte dela e costuma precisar
+# de poucos pivôs. Os nós são explorados pelo melhor limitante.
+#
+# Exemplo:
+#   model = load_model('exercises/Exercise9.toml')
+#   sol = branch_and_bound(model)      (ou model.solve('bnb'))
+#   sol.values, sol.extra['nodes']
+# =============================================================================
+
+INT_TOL = 1e-6  # tolerância de integralidade
+
+
+def _node_arrays(sf, cuts, columns):
+    # Forma padrão do nó: linhas do modelo + uma linha por (variável, sentido)
+    m, N = sf.A.shape
+    k = len(cuts)
+    A = np.zeros((m + k, N + k))
+    A[:m, :N] = sf.A
+    b = np.concatenate([sf.b, np.zeros(k)])
+    for r, ((j, sense), value) in enumerate(cuts.items()):
+        A[m + r, columns[j]] = 1.0
+        if j in sf.free:
+            A[m + r, sf.n + int(np.flatnonzero(sf.free == j)[0])] = -1.0
+        A[m + r, N + r] = 1.0 if sense == '<=' else -1.0
+        b[m + r] = value - sf.lower[j]
+    return A, b
+
+
+def branch_and_bound(model, max_nodes=100_000, max_iter=10_000, tol=INT_TOL):
+    """Resolve um modelo inteiro (ou misto) por branch-and-bound.
+
+    Retorna um solvers.Solution com backend 'bnb'; `iterations` soma os pivôs
+    de todas as relaxações e `extra` traz nós explorados e podados.
+    """
+    from .solvers import Solution
+
+    sf = model.standard
+    integer = np.flatnonzero(model.integer)
+    columns = np.arange(sf.n)
+    c = sf.c
+    # Com custos inteiros nas variáveis inteiras (e nenhuma contínua), o
+    # objetivo de qualquer solução inteira é inteiro: o limitante pode ser
+    # arredondado para cima.
+    integral_objective = (len(integer) == sf.n and not len(sf.free)
+                          and np.all(np.abs(model.objective - np.round(model.objective)) <= tol)
+                          and abs(sf.offset - round(sf.offset)) <= tol)
+
+    best_x, best_value = None, math.inf     # incumbente (na forma padrão: min)
+    explored = pruned = iterations = 0
+    status = 'Optimal'
+    counter = 0
+    heap = [(-math.inf, counter, {}, None)]  # (limitante, desempate, cortes, base do pai)
+    while heap:
+        bound, _, cuts, basis = heapq.heappop(heap)
+        if bound >= best_value - tol * (1.0 + abs(best_value)):
+            pruned += 1
+            continue
+        if explored >= max_nodes:
+            status = 'Not Solved'
+            break
+        explored += 1
+
+        A, b = _node_arrays(sf, cuts, columns)
+        c_node = np.concatenate([c, np.zeros(len(cuts))])
+        result = revised_simplex(c_node, A, b, basis=basis, max_iter=max_iter)
+        iterations += result.iterations
+        if result.status == 'Unbounded' and explored == 1:
+            status = 'Unbounded'
+            break
+        if result.status != 'Optimal':
+            pruned += 1
+            continue
+        value = float(c_node @ result.z)
+        if integral_objective:
+            value = math.ceil(value + sf.offset - tol) - sf.offset
+        if value >= best_value - tol * (1.0 + abs(best_value)):
+            pruned += 1
+            continue
+
+        x = sf.recover(result.z[:sf.A.shape[1]])
+        fraction = np.abs(x[integer] - np.round(x[integer]))
+        if not len(integer) or fraction.max() <= tol:
+            best_x, best_value = x, value
+            continue
+
+        j = int(integer[np.argmax(fraction)])
+        for sense, limit in (('<=', math.floor(x[j])), ('>=', math.ceil(x[j]))):
+            child = dict(cuts)
+            if (j, sense) in child:
+                child_basis = result.basis.copy()
+            else:
+                # A folga da linha nova entra na base do pai
+                child_basis = np.append(result.basis, A.shape[1])
+            child[(j, sense)] = float(limit)
+            counter += 1
+            heapq.heappush(heap, (value, counter, child, child_basis))
+
+    if best_x is None:
+        if status == 'Optimal':
+            status = 'Infeasible'
+        x, objective = np.full(sf.n, np.nan), None
+    else:
+        x = best_x.copy()
+        x[integer] = np.round(x[integer])
+        objective = float(model.objective @ x)
+    return Solution(
+        status=status,
+        objective=objective,
+        x=x,
+        variables=model.variables,
+        iterations=iterations,
+        backend='bnb',
+        extra={'nodes': explored, 'pruned': pruned, 'open': len(heap)},
+    )
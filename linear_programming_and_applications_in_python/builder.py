@@ -0,0 +1,142 @@
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .models import SENSES
+from .sparse import SparseModel, _pulp_rows
+
+# =============================================================================
+# MONTAGEM DE MODELOS EM BLOCO (MATRIZ, LADO DIREITO, SENTIDOS, NOMES)
+# -----------------------------------------------------------------------------
+# Nos scripts cada restrição é escrita termo a termo:
+#
+#   model += cP*xP + cM*xM + cG*xG <= CUT_AVAILABLE, "Limite_Corte"
+#
+# e cada `*` e `+` cria um objeto do pulp. Aqui um bloco inteiro de linhas
+# (por exemplo a tabela de máquinas do Exercise7) entra numa só chamada, a
+# partir de arrays:
+#
+#   ModelBuilder          -> acumula variáveis e blocos de restrições como
+#                            arrays COO e gera LinearModel ou SparseModel;
+#   add_pulp_constraints  -> acrescenta as linhas a um pulp.LpProblem já
+#                            existente, uma LpConstraint por linha.
+#
+# Exemplo:
+#   builder = ModelBuilder('Exemplo_07', sense='max')
+#   builder.add_variables(['Facas_Padrao', 'Facas_Media', 'Facas_Grande'], objective=[3, 4, 4.7])
+#   builder.add_constraints(tempos, '<=', disponibilidade, names=maquinas)
+#   model = builder.build()
+# =============================================================================
+
+
+def _as_coo(matrix, columns):
+    # Aceita matriz densa (k x len(columns)) ou triplas (linhas, colunas, valores)
+    if isinstance(matrix, tuple) and len(matrix) == 3:
+        rows, cols, values = (np.asarray(a) for a in matrix)
+        return rows.astype(np.int64), columns[cols.astype(np.int64)], values.astype(float)
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[1] != len(columns):
+        raise ValueError(f"a matriz deveria ter {len(columns)} colunas")
+    rows, cols = np.nonzero(matrix)
+    return rows.astype(np.int64), columns[cols], matrix[rows, cols]
+
+
+def _senses(senses, k):
+    senses = np.asarray(senses, dtype='<U2').reshape(-1)
+    if len(senses) == 1:
+        senses = np.repeat(senses, k)
+    if len(senses) != k:
+        raise ValueError(f"esperados {k} sentidos de restrição")
+    bad = set(np.unique(senses).tolist()) - set(SENSES)
+    if bad:
+        raise ValueError(f"Sentidos de restrição inválidos: {sorted(bad)}")
+    return senses
+
+
+class ModelBuilder:
+    """Acumula variáveis e blocos de restrições e gera o modelo de uma vez."""
+
+    def __init__(self, name='Modelo', sense='max', objective_name='Objetivo'):
+        self.name = name
+        self.sense = sense
+        self.objective_name = objective_name
+        self._variables = []
+        self._columns = []      # (objetivo, lower, upper, integer) por bloco
+        self._rows = []         # (linhas, colunas, valores) por bloco, linhas já deslocadas
+        self._senses = []
+        self._rhs = []
+        self._names = []
+        self.n = 0
+        self.m = 0
+
+    def add_variables(self, names, objective=0.0, lower=0.0, upper=np.inf, integer=False):
+        """Acrescenta variáveis; retorna os índices das colunas criadas."""
+        names = list(names)
+        k = len(names)
+        self._variables.extend(names)
+        self._columns.append(tuple(np.broadcast_to(np.asarray(v, dtype=t), (k,))
+                                   for v, t in ((objective, float), (lower, float), (upper, float),
+                                                (integer, bool))))
+        columns = np.arange(self.n, self.n + k)
+        self.n += k
+        return columns
+
+    def add_constraints(self, matrix, senses, rhs, names=None, columns=None):
+        """Acrescenta um bloco de linhas; retorna os índices das linhas criadas.
+
+        `matrix` é densa (uma coluna por variável em `columns`, padrão todas)
+        ou uma tripla COO (linhas do bloco, posições em `columns`, valores).
+        """
+        columns = np.arange(self.n) if columns is None else np.asarray(columns, dtype=np.int64)
+        rhs = np.asarray(rhs, dtype=float).reshape(-1)
+        k = len(rhs)
+        rows, cols, values = _as_coo(matrix, columns)
+        if len(rows) and (rows.min() < 0 or rows.max() >= k):
+            raise ValueError(f"linhas fora do bloco de {k} restrições")
+        names = [f"R{self.m + i + 1}" for i in range(k)] if names is None else list(names)
+        if len(names) != k:
+            raise ValueError(f"esperados {k} nomes de restrição")
+        self._senses.append(_senses(senses, k))
+        self._rows.append((rows + self.m, cols, values))
+        self._rhs.append(rhs)
+        self._names.extend(names)
+        created = np.arange(self.m, self.m + k)
+        self.m += k
+        return created
+
+    def build_sparse(self):
+        """SparseModel com tudo o que foi acrescentado."""
+        def cat(parts, dtype):
+            return np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype)
+
+        objective, lower, upper, integer = (cat([c[k] for c in self._columns], t)
+                                            for k, t in enumerate((float, float, float, bool)))
+        return SparseModel.from_coo(
+            cat([r[0] for r in self._rows], np.int64),
+            cat([r[1] for r in self._rows], np.int64),
+            cat([r[2] for r in self._rows], float),
+            objective, cat(self._senses, '<U2'), cat(self._rhs, float),
+            sense=self.sense, name=self.name, variables=self._variables,
+            constraint_names=self._names, lower=lower, upper=upper, integer=integer,
+            objective_name=self.objective_name,
+        )
+
+    def build(self):
+        """LinearModel (matriz densa) com tudo o que foi acrescentado."""
+        return self.build_sparse().to_dense()
+
+
+def add_pulp_constraints(problem, xs, matrix, senses, rhs, names=None):
+    """Acrescenta as linhas `matrix @ xs (senses) rhs` a um pulp.LpProblem em uma chamada.
+
+    Sem `names`, as linhas continuam a numeração R<k> a partir das restrições
+    que o problema já tem, de modo que chamadas seguidas não colidem.
+    """
+    columns = np.arange(len(xs))
+    rhs = np.asarray(rhs, dtype=float).reshape(-1)
+    rows, cols, values = _as_coo(matrix, columns)
+    order = np.argsort(rows, kind='stable')
+    ptr = np.zeros(len(rhs) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(rhs)), out=ptr[1:])
+    offset = len(problem.constraints)
+    names = [f"R{offset + i + 1}" for i in range(len(rhs))] if names is None else list(names)
+    _pulp_rows(problem, xs, ptr, cols[order], values[order], _senses(senses, len(rhs)), rhs, names)
+    return problem
@@ -0,0 +1,412 @@
+import heapq  # Fila por posição topológica na atualização incremental
+from dataclasses import dataclass  # Estruturas da rede e do cronograma
+from functools import cached_property
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+# =============================================================================
+# CPM (MÉTODO DO CAMINHO CRÍTICO) SOBRE ADJACÊNCIA EM ARRAYS
+# -----------------------------------------------------------------------------
+# Reproduz as contas feitas à mão nos diagramas da prova-05 (Aula 05):
+#
+#   ida   (forward):  ES_j = max(EF_i, i predecessora de j),  EF_j = ES_j + d_j
+#   volta (backward): LF_i = min(LS_j, j sucessora de i),     LS_i = LF_i - d_i
+#   folga total  FT_i = LS_i - ES_i
+#   folga livre  FL_i = min(ES_j, j sucessora de i) - EF_i
+#
+# A rede é guardada em formato CSR (ponteiros + índices) para predecessoras e
+# sucessoras. A ordem topológica é obtida por níveis (algoritmo de Kahn sobre
+# a fronteira inteira de uma vez) e as duas passagens processam um nível por
+# vez com reduções NumPy; o custo total é O(atividades + dependências).
+# Redes muito "profundas" (poucas atividades por nível) usam uma varredura
+# sequencial simples sobre os mesmos arrays, que também é linear.
+#
+# Exemplo (prova-05/q1):
+#   network = ActivityNetwork.from_table([
+#       ('LO', 5, []), ('OA', 21, ['LO']), ('ME', 1, ['LO']), ('RTF', 6, ['LO']),
+#       ('PAI', 24, ['OA']), ('PAM', 10, ['OA']), ('II', 9, ['ME', 'RTF', 'PAI']),
+#       ('IM', 3, ['PAM', 'II']), ('M', 2, ['IM']),
+#   ])
+#   schedule = cpm(network)
+#   schedule.duration       -> 64.0
+#   schedule.critical_path  -> ['LO', 'OA', 'PAI', 'II', 'IM', 'M']
+#
+# Mudanças de uma duração (PAI de 24 para 26 semanas, por exemplo) não exigem
+# refazer as passagens: Schedule.update_duration propaga os novos ES/EF só
+# pelas sucessoras afetadas e os novos LS/LF só pelas predecessoras afetadas,
+# parando onde os valores deixam de mudar.
+# =============================================================================
+
+TOL = 1e-9
+CONE_LIMIT = 1 / 100  # fração da rede acima da qual a atualização refaz o CPM inteiro
+NARROW = 64  # níveis com menos atividades que isso contam como "estreitos"
+
+
+def _csr(n, src, dst):
+    # Agrupa as arestas src -> dst por src: (ponteiros, destinos)
+    order = np.argsort(src, kind='stable')
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=ptr[1:])
+    return ptr, dst[order].astype(np.int64)
+
+
+def _gather(ptr, nodes):
+    # Índices das arestas dos nós `nodes` (segmentos CSR concatenados)
+    starts = ptr[nodes]
+    counts = ptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), counts
+    offsets = np.cumsum(counts) - counts
+    idx = np.arange(total, dtype=np.int64) - np.repeat(offsets - starts, counts)
+    return idx, counts
+
+
+def _segment_reduce(ufunc, values, counts, empty):
+    # Reduz `values` por segmentos de tamanho `counts` (vazios -> empty)
+    out = np.full(len(counts), empty, dtype=float)
+    filled = counts > 0
+    if filled.any():
+        offsets = (np.cumsum(counts) - counts)[filled]
+        out[filled] = ufunc.reduceat(values, offsets)
+    return out
+
+
+@dataclass
+class ActivityNetwork:
+    """Rede de atividades (atividade no nó) com adjacência em CSR."""
+    names: tuple
+    duration: np.ndarray
+    pred_ptr: np.ndarray
+    pred_idx: np.ndarray
+    succ_ptr: np.ndarray
+    succ_idx: np.ndarray
+
+    @property
+    def size(self):
+        return len(self.duration)
+
+    @property
+    def edges(self):
+        """Arestas (origem, destino) como dois arrays de índices."""
+        counts = np.diff(self.succ_ptr)
+        return np.repeat(np.arange(self.size), counts), self.succ_idx
+
+    def index(self, name):
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(f"atividade desconhecida: {name!r}") from None
+
+    def predecessors(self, i):
+        return self.pred_idx[self.pred_ptr[i]:self.pred_ptr[i + 1]]
+
+    def successors(self, i):
+        return self.succ_idx[self.succ_ptr[i]:self.succ_ptr[i + 1]]
+
+    @classmethod
+    def from_edges(cls, names, duration, src, dst):
+        """Monta a rede a partir das arestas src[k] -> dst[k] (índices)."""
+        duration = np.asarray(duration, dtype=float)
+        n = len(duration)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if len(src) and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+            raise ValueError("aresta com índice de atividade fora da rede")
+        if np.any(duration < 0):
+            raise ValueError("durações devem ser não negativas")
+        succ_ptr, succ_idx = _csr(n, src, dst)
+        pred_ptr, pred_idx = _csr(n, dst, src)
+        return cls(tuple(names), duration, pred_ptr, pred_idx, succ_ptr, succ_idx)
+
+    @classmethod
+    def from_table(cls, rows):
+        """Monta a rede de linhas (nome, duração, [predecessoras])."""
+        rows = list(rows)
+        names = [r[0] for r in rows]
+        position = {name: i for i, name in enumerate(names)}
+        if len(position) != len(names):
+            raise ValueError("nomes de atividades repetidos")
+        src, dst = [], []
+        for j, (name, _, preds) in enumerate(rows):
+            for p in preds:
+                if p not in position:
+                    raise ValueError(f"{name}: predecessora desconhecida {p!r}")
+                src.append(position[p])
+                dst.append(j)
+        return cls.from_edges(names, [r[1] for r in rows], src, dst)
+
+
+def _kahn_sequential(network, indegree, frontier):
+    # Continuação do algoritmo de Kahn nó a nó, para redes profundas
+    succ_ptr, succ_idx = network.succ_ptr.tolist(), network.succ_idx.tolist()
+    indegree = indegree.tolist()
+    stack = frontier.tolist()
+    order = []
+    while stack:
+        i = stack.pop()
+        order.append(i)
+        for j in succ_idx[succ_ptr[i]:succ_ptr[i + 1]]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                stack.append(j)
+    return np.array(order, dtype=np.int64)
+
+
+def topological_levels(network):
+    """Ordem topológica por níveis: retorna (order, level_ptr).
+
+    order[level_ptr[k]:level_ptr[k + 1]] são as atividades do nível k (todas
+    as predecessoras estão em níveis anteriores). Quando a rede se estreita
+    por muitos níveis seguidos, o restante sai nó a nó, um nível por nó.
+    """
+    n = network.size
+    indegree = np.diff(network.pred_ptr).copy()
+    frontier = np.flatnonzero(indegree == 0)
+    levels, sizes = [], []
+    narrow = 0
+    while len(frontier):
+        narrow = narrow + 1 if len(frontier) < NARROW else 0
+        if narrow > NARROW:
+            tail = _kahn_sequential(network, indegree, frontier)
+            levels.append(tail)
+            sizes.extend([1] * len(tail))
+            break
+        levels.append(frontier)
+        sizes.append(len(frontier))
+        idx, _ = _gather(network.succ_ptr, frontier)
+        succ = network.succ_idx[idx]
+        np.subtract.at(indegree, succ, 1)
+        candidates = np.unique(succ)
+        frontier = candidates[indegree[candidates] == 0]
+    order = np.concatenate(levels) if levels else np.empty(0, dtype=np.int64)
+    if len(order) != n:
+        raise ValueError("a rede tem ciclo de dependências")
+    level_ptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=level_ptr[1:])
+    return order, level_ptr
+
+
+@dataclass
+class Schedule:
+    """Resultado do CPM; arrays indexados pela atividade."""
+    network: ActivityNetwork
+    order: np.ndarray
+    es: np.ndarray
+    ef: np.ndarray
+    ls: np.ndarray
+    lf: np.ndarray
+    total_float: np.ndarray
+    free_float: np.ndarray
+    duration: float
+
+    @property
+    def critical(self):
+        return self.total_float <= TOL * (1.0 + abs(self.duration))
+
+    @property
+    def critical_path(self):
+        """Um caminho crítico, do início ao fim do projeto (nomes)."""
+        net = self.network
+        critical = self.critical
+        tol = TOL * (1.0 + abs(self.duration))
+        starts = [i for i in np.flatnonzero(critical) if self.es[i] <= tol]
+        if not starts:
+            return []
+        path = [int(starts[0])]
+        while True:
+            nxt = [j for j in net.successors(path[-1])
+                   if critical[j] and abs(self.es[j] - self.ef[path[-1]]) <= tol]
+            if not nxt:
+                break
+            path.append(int(nxt[0]))
+        return [net.names[i] for i in path]
+
+    def row(self, name):
+        """Dicionário com os tempos de uma atividade."""
+        i = self.network.index(name)
+        return {
+            'name': name, 'duration': float(self.network.duration[i]),
+            'es': float(self.es[i]), 'ef': float(self.ef[i]),
+            'ls': float(self.ls[i]), 'lf': float(self.lf[i]),
+            'total_float': float(self.total_float[i]), 'free_float': float(self.free_float[i]),
+        }
+
+    def table(self):
+        """Linhas (atividade, d, ES, EF, LS, LF, FT, FL, crítica) em ordem topológica."""
+        net = self.network
+        critical = self.critical
+        return [
+            (net.names[i], net.duration[i], self.es[i], self.ef[i], self.ls[i], self.lf[i],
+             self.total_float[i], self.free_float[i], bool(critical[i]))
+            for i in self.order
+        ]
+
+    @cached_property
+    def rank(self):
+        """Posição de cada atividade na ordem topológica."""
+        rank = np.empty(len(self.order), dtype=np.int64)
+        rank[self.order] = np.arange(len(self.order))
+        return rank
+
+    def update_duration(self, activity, duration):
+        """Altera a duração de uma atividade e atualiza o cronograma no lugar.
+
+        Só as atividades cujos tempos mudam são recalculadas (o "cone" a
+        jusante para ES/EF e a montante para LS/LF). Se o prazo do projeto
+        mudar, LS/LF de todas as atividades se deslocam pelo mesmo valor, numa
+        única operação vetorial. Se o cone passar de CONE_LIMIT da rede, é
+        mais barato refazer as passagens vetorizadas do zero, e é o que se
+        faz. Retorna o número de atividades recalculadas.
+        """
+        net = self.network
+        j = net.index(activity) if isinstance(activity, str) else int(activity)
+        if duration < 0:
+            raise ValueError("durações devem ser não negativas")
+        old_duration = float(net.duration[j])
+        if duration == old_duration:
+            return 0
+        was_critical = self.total_float[j] <= TOL * (1.0 + abs(self.duration))
+        net.duration[j] = duration
+        rank = self.rank
+        d = net.duration
+        T_old = self.duration
+        limit = max(1024, int(CONE_LIMIT * net.size))
+
+        # A montante: LS_i = min(LS das sucessoras, ou T) - d_i, com T antigo
+        touched_late = []
+        heap = [(-rank[j], j)]
+        queued = {j}
+        while heap:
+            _, i = heapq.heappop(heap)
+            succ = net.successors(i)
+            finish = float(self.ls[succ].min()) if len(succ) else T_old
+            if i != j and finish - d[i] == self.ls[i]:
+                continue
+            self.ls[i] = finish - d[i]
+            self.lf[i] = finish
+            touched_late.append(i)
+            if len(touched_late) > limit:
+                return self._recompute()
+            for p in net.predecessors(i).tolist():
+                if p not in queued:
+                    queued.add(p)
+                    heapq.heappush(heap, (-rank[p], p))
+
+        # A jusante: ES_k = max(EF das predecessoras)
+        touched_early = []
+        heap = [(rank[j], j)]
+        queued = {j}
+        while heap:
+            _, k = heapq.heappop(heap)
+            preds = net.predecessors(k)
+            start = float(self.ef[preds].max()) if len(preds) else 0.0
+            if k != j and start == self.es[k]:
+                continue
+            self.es[k] = start
+            self.ef[k] = start + d[k]
+            touched_early.append(k)
+            if len(touched_early) > limit:
+                return self._recompute()
+            for s in net.successors(k).tolist():
+                if s not in queued:
+                    queued.add(s)
+                    heapq.heappush(heap, (rank[s], s))
+
+        # Novo prazo: só pode cair se a atividade era crítica e encurtou
+        if duration < old_duration and was_critical:
+            T = float(self.ef.max(initial=0.0))
+        else:
+            T = max(T_old, float(self.ef[touched_early].max()))
+        shift = T - T_old
+        self.duration = T
+
+        if shift:
+            self.ls += shift
+            self.lf += shift
+            self.total_float = self.ls - self.es
+            sinks = np.flatnonzero(np.diff(net.succ_ptr) == 0)
+            self.free_float[sinks] = T - self.ef[sinks]
+        else:
+            changed = touched_late + touched_early
+            self.total_float[changed] = self.ls[changed] - self.es[changed]
+
+        # Folga livre: atividades com EF novo e predecessoras das com ES novo
+        refresh = set(touched_early)
+        for k in touched_early:
+            refresh.update(net.predecessors(k).tolist())
+        for i in refresh:
+            succ = net.successors(i)
+            next_start = float(self.es[succ].min()) if len(succ) else T
+            self.free_float[i] = next_start - self.ef[i]
+        return len(set(touched_late) | set(touched_early))
+
+    def _recompute(self):
+        fresh = cpm(self.network)
+        for name in ('es', 'ef', 'ls', 'lf', 'total_float', 'free_float', 'duration'):
+            setattr(self, name, getattr(fresh, name))
+        return self.network.size
+
+
+def _passes_levels(net, order, level_ptr):
+    n = net.size
+    d = net.duration
+    es = np.zeros(n)
+    for k in range(1, len(level_ptr) - 1):
+        nodes = order[level_ptr[k]:level_ptr[k + 1]]
+        idx, counts = _gather(net.pred_ptr, nodes)
+        es[nodes] = _segment_reduce(np.maximum, es[net.pred_idx[idx]] + d[net.pred_idx[idx]], counts, 0.0)
+    ef = es + d
+    T = float(ef.max(initial=0.0))
+
+    lf = np.full(n, T)
+    for k in range(len(level_ptr) - 2, -1, -1):
+        nodes = order[level_ptr[k]:level_ptr[k + 1]]
+        idx, counts = _gather(net.succ_ptr, nodes)
+        succ = net.succ_idx[idx]
+        lf[nodes] = _segment_reduce(np.minimum, lf[succ] - d[succ], counts, T)
+    return es, ef, lf, T
+
+
+def _passes_sequential(net, order):
+    n = net.size
+    d = net.duration.tolist()
+    pred_ptr, pred_idx = net.pred_ptr.tolist(), net.pred_idx.tolist()
+    succ_ptr, succ_idx = net.succ_ptr.tolist(), net.succ_idx.tolist()
+    order = order.tolist()
+    ef = [0.0] * n
+    for j in order:
+        start = 0.0
+        for p in pred_idx[pred_ptr[j]:pred_ptr[j + 1]]:
+            if ef[p] > start:
+                start = ef[p]
+        ef[j] = start + d[j]
+    T = max(ef, default=0.0)
+    ls = [0.0] * n
+    for i in reversed(order):
+        finish = T
+        for s in succ_idx[succ_ptr[i]:succ_ptr[i + 1]]:
+            if ls[s] < finish:
+                finish = ls[s]
+        ls[i] = finish - d[i]
+    ef = np.array(ef)
+    return ef - net.duration, ef, np.array(ls) + net.duration, T
+
+
+def cpm(network):
+    """Passagens de ida e volta do CPM; retorna o Schedule."""
+    order, level_ptr = topological_levels(network)
+    levels = len(level_ptr) - 1
+    if levels and network.size / levels < NARROW:
+        es, ef, lf, T = _passes_sequential(network, order)
+    else:
+        es, ef, lf, T = _passes_levels(network, order, level_ptr)
+    ls = lf - network.duration
+
+    # Folga livre: menor ES das sucessoras (ou o fim do projeto) menos EF
+    _, counts = _gather(network.succ_ptr, np.arange(network.size))
+    next_start = _segment_reduce(np.minimum, es[network.succ_idx], counts, T)
+    return Schedule(
+        network=network, order=order, es=es, ef=ef, ls=ls, lf=lf,
+        total_float=ls - es, free_float=next_start - ef, duration=T,
+    )
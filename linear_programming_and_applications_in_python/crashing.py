@@ -0,0 +1,125 @@
+from dataclasses import dataclass, replace  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .cpm import cpm
+from .models import parse_model
+from .parametric import rhs_sweep
+
+# =============================================================================
+# COMPRESSÃO (CRASHING) DE PROJETOS: CURVA TEMPO x CUSTO POR PL
+# -----------------------------------------------------------------------------
+# Encurtar o projeto da prova-05/q1 (64 semanas) ou da q4 (16 dias) é um PL
+# do mesmo tipo dos exercícios com pulp. Para cada atividade i:
+#
+#   S_i  = início da atividade          (S_i >= 0)
+#   R_i  = redução da duração           (0 <= R_i <= redução máxima_i)
+#   T    = término do projeto
+#
+#   min  soma c_i R_i                          (custo de compressão)
+#   s.a. S_j - S_i + R_i >= d_i               (i predecessora de j)
+#        T   - S_i + R_i >= d_i               (i sem sucessoras)
+#        T <= prazo                           (restrição "Prazo")
+#
+# A curva tempo x custo sai de uma única varredura paramétrica do lado
+# direito de "Prazo" (parametric.rhs_sweep), do prazo normal até o menor
+# prazo possível: cada passo parte da base ótima do anterior.
+#
+# Exemplo:
+#   curve = crash_curve(network, max_reduction, cost_per_unit)
+#   curve.cost_at(60)   -> menor custo para terminar em 60 semanas
+# =============================================================================
+
+
+@dataclass
+class CrashCurve:
+    """Curva tempo x custo; `reduction` tem uma linha por prazo."""
+    names: tuple
+    deadlines: np.ndarray
+    cost: np.ndarray
+    reduction: np.ndarray
+    breakpoints: list        # prazos em que a base ótima muda (vértices da curva)
+
+    def cost_at(self, deadline):
+        """Custo mínimo para o prazo dado (a curva é linear por partes)."""
+        order = np.argsort(self.deadlines)
+        return float(np.interp(deadline, self.deadlines[order], self.cost[order]))
+
+    def plan(self, deadline):
+        """Reduções de cada atividade no prazo da curva mais próximo."""
+        k = int(np.argmin(np.abs(self.deadlines - deadline)))
+        return dict(zip(self.names, self.reduction[k].tolist()))
+
+
+def crash_model(network, max_reduction, cost_per_unit, deadline=None):
+    """Monta o PL de compressão da rede como LinearModel."""
+    n = network.size
+    limit = np.broadcast_to(np.asarray(max_reduction, dtype=float), (n,))
+    cost = np.broadcast_to(np.asarray(cost_per_unit, dtype=float), (n,))
+    if np.any(limit < 0) or np.any(limit > network.duration):
+        raise ValueError("a redução máxima deve ficar entre 0 e a duração de cada atividade")
+    if deadline is None:
+        deadline = cpm(network).duration
+
+    names = [str(name) for name in network.names]
+    N = 2 * n + 1  # S_i, R_i, T
+    rows, rhs, row_names = [], [], []
+    src, dst = network.edges
+    for i, j in zip(src.tolist(), dst.tolist()):
+        row = np.zeros(N)
+        row[j], row[i], row[n + i] = 1.0, -1.0, 1.0
+        rows.append(row)
+        rhs.append(network.duration[i])
+        row_names.append(f"Prec_{names[i]}_{names[j]}")
+    for i in np.flatnonzero(np.diff(network.succ_ptr) == 0).tolist():
+        row = np.zeros(N)
+        row[-1], row[i], row[n + i] = 1.0, -1.0, 1.0
+        rows.append(row)
+        rhs.append(network.duration[i])
+        row_names.append(f"Fim_{names[i]}")
+    row = np.zeros(N)
+    row[-1] = 1.0
+    rows.append(row)
+    rhs.append(deadline)
+    row_names.append("Prazo")
+
+    return parse_model({
+        'name': 'Compressao_Projeto',
+        'sense': 'min',
+        'objective_name': 'Custo_Compressao',
+        'variables': {
+            'names': [f"S_{x}" for x in names] + [f"R_{x}" for x in names] + ['T'],
+            'objective': [0.0] * n + cost.tolist() + [0.0],
+            'upper': [np.inf] * n + limit.tolist() + [np.inf],
+        },
+        'constraints': {
+            'names': row_names,
+            'senses': ['>='] * (len(rows) - 1) + ['<='],
+            'rhs': rhs,
+            'matrix': np.array(rows).tolist(),
+        },
+    })
+
+
+def crash_curve(network, max_reduction, cost_per_unit, step=1.0, deadlines=None):
+    """Curva tempo x custo do prazo normal até o menor prazo possível.
+
+    `deadlines` (opcional) substitui a grade de `step` em `step` unidades.
+    """
+    normal = cpm(network).duration
+    fastest = cpm(replace(network, duration=network.duration - max_reduction)).duration
+    if deadlines is None:
+        deadlines = np.arange(normal, fastest, -step)
+        deadlines = np.append(deadlines, fastest)
+    deadlines = np.asarray(deadlines, dtype=float)
+
+    model = crash_model(network, max_reduction, cost_per_unit, deadline=normal)
+    sweep = rhs_sweep(model, ['Prazo'], deadlines)
+    n = network.size
+    return CrashCurve(
+        names=network.names,
+        deadlines=deadlines,
+        cost=sweep.objective,
+        reduction=sweep.x[:, n:2 * n],
+        breakpoints=[bp['value'] for bp in sweep.breakpoints],
+    )
@@ -0,0 +1,142 @@
+import math
+from dataclasses import dataclass  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+# =============================================================================
+# ENUMERAÇÃO EXAUSTIVA DE PLANOS INTEIROS (VETORIZADA, EM BLOCOS)
+# -----------------------------------------------------------------------------
+# prova-04/exercise10solution2.py monta a lista de todos os pares (x, y) com
+# dois `for` e depois percorre a lista de novo para calcular o lucro. Quando
+# a grade é pequena o bastante para a enumeração ser a ferramenta certa, este
+# módulo faz o mesmo para qualquer modelo com limites finitos, sem laço
+# Python por ponto:
+#
+#   - as últimas variáveis formam um bloco "interno" cujas contribuições
+#     (A_j x_j e c_j x_j) são calculadas uma única vez;
+#   - as primeiras variáveis são percorridas em lotes, e cada lote soma sua
+#     contribuição ao bloco interno por broadcasting (lote x bloco);
+#   - de cada lote ficam só os k melhores planos factíveis.
+#
+# A memória fica limitada por `chunk_size` pontos por vez, então 10^8 pontos
+# candidatos são avaliados sem nunca existirem todos ao mesmo tempo.
+# Todas as variáveis percorrem os inteiros entre `lower` e `upper`.
+#
+# Exemplo:
+#   model = load_model('prova-04/exercise10.toml')
+#   result = enumerate_plans(model, top=3)
+#   result.plans        -> os 3 melhores planos (panelas, frigideiras)
+# =============================================================================
+
+CHUNK = 1_000_000  # pontos avaliados por bloco
+TOL = 1e-9
+
+
+@dataclass
+class EnumerationResult:
+    """Melhores planos inteiros, do melhor para o pior."""
+    variables: tuple
+    plans: np.ndarray        # (k, n) valores das variáveis
+    objective: np.ndarray    # (k,) valor objetivo de cada plano
+    feasible: int            # pontos factíveis encontrados
+    evaluated: int           # pontos avaliados (tamanho da grade)
+
+    def values(self, k=0):
+        """k-ésimo melhor plano por nome."""
+        return dict(zip(self.variables, self.plans[k].tolist()))
+
+
+def _grid(model):
+    lower = np.ceil(model.lower - TOL)
+    upper = np.floor(model.upper + TOL)
+    if not (np.all(np.isfinite(lower)) and np.all(np.isfinite(upper))):
+        raise ValueError(f"{model.name}: a enumeração exige limites inferiores e superiores finitos")
+    return [np.arange(lo, up + 1) + 0.0 for lo, up in zip(lower, upper)]  # + 0.0: sem -0.0
+
+
+def _contributions(model, axes):
+    # Objetivo e lado esquerdo somados sobre o produto cartesiano de `axes`
+    # (índices das variáveis), ordem C: a última variável varia mais rápido
+    m = model.A.shape[0]
+    obj = np.zeros(1)
+    lhs = np.zeros((m, 1))
+    for j, values in axes:
+        obj = (obj[:, None] + model.objective[j] * values[None, :]).ravel()
+        lhs = (lhs[:, :, None] + model.A[:, j, None, None] * values[None, None, :]).reshape(m, len(obj))
+    return obj, lhs
+
+
+def _feasible(lhs, model):
+    # lhs (m, ...) -> máscara (...); sem restrições (m = 0), todos os pontos
+    ok = np.ones(lhs.shape[1:], dtype=bool)
+    if not len(model.senses):
+        return ok
+    scale = TOL * (1.0 + np.abs(model.b))
+    for i, sense in enumerate(model.senses):
+        if sense == '<=':
+            ok &= lhs[i] <= model.b[i] + scale[i]
+        elif sense == '>=':
+            ok &= lhs[i] >= model.b[i] - scale[i]
+        else:
+            ok &= np.abs(lhs[i] - model.b[i]) <= scale[i]
+    return ok
+
+
+def enumerate_plans(model, top=1, chunk_size=CHUNK):
+    """Avalia todos os pontos inteiros da caixa de limites e devolve os `top` melhores."""
+    grid = _grid(model)
+    n = len(grid)
+    sizes = [len(g) for g in grid]
+    total = math.prod(sizes)
+    sign = -1.0 if model.maximize else 1.0  # ordena sempre por sign * objetivo
+
+    # Bloco interno: maior sufixo de variáveis que cabe em um bloco
+    split = n
+    while split > 0 and math.prod(sizes[split - 1:]) <= chunk_size:
+        split -= 1
+    inner_obj, inner_lhs = _contributions(model, [(j, grid[j]) for j in range(split, n)])
+    inner = len(inner_obj)
+    outer_shape = sizes[:split]
+    outer_total = math.prod(outer_shape)
+    batch = max(1, chunk_size // inner)
+
+    best_key = np.empty(0)
+    best_index = np.empty(0, dtype=np.int64)
+    feasible = 0
+    for start in range(0, outer_total, batch):
+        stop = min(start + batch, outer_total)
+        positions = np.unravel_index(np.arange(start, stop), outer_shape) if split else ()
+        obj = np.zeros(stop - start)
+        lhs = np.zeros((model.A.shape[0], stop - start))
+        for j, pos in enumerate(positions):
+            values = grid[j][pos]
+            obj += model.objective[j] * values
+            lhs += model.A[:, j, None] * values[None, :]
+        ok = _feasible(lhs[:, :, None] + inner_lhs[:, None, :], model)
+        count = int(ok.sum())
+        if not count:
+            continue
+        feasible += count
+        flat = np.flatnonzero(ok.ravel())
+        key = sign * (obj[:, None] + inner_obj[None, :]).ravel()[flat]
+        if len(key) > top:
+            # Mantém os empates com o corte: o desempate é pelo índice, no final
+            keep = np.flatnonzero(key <= np.partition(key, top - 1)[top - 1])
+            key, flat = key[keep], flat[keep]
+        best_key = np.concatenate([best_key, key])
+        best_index = np.concatenate([best_index, flat + start * inner])
+        if len(best_key) > top:
+            order = np.lexsort((best_index, best_key))[:top]
+            best_key, best_index = best_key[order], best_index[order]
+
+    order = np.lexsort((best_index, best_key))
+    best_key, best_index = best_key[order], best_index[order]
+    positions = np.unravel_index(best_index, sizes) if len(best_index) else [np.empty(0, np.int64)] * n
+    plans = np.column_stack([grid[j][pos] for j, pos in enumerate(positions)]) if n else np.empty((0, 0))
+    return EnumerationResult(
+        variables=model.variables,
+        plans=plans.reshape(len(best_index), n),
+        objective=sign * best_key,
+        feasible=feasible,
+        evaluated=total,
+    )
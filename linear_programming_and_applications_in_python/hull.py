@@ -0,0 +1,100 @@
+from dataclasses import dataclass  # Estrutura simples para agrupar o resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .sampling import as_upper_system
+from .vertices import polytope
+
+# =============================================================================
+# MALHA TRIANGULADA DA REGIÃO FACTÍVEL EM 3D
+# -----------------------------------------------------------------------------
+# Os gráficos 3D (Exercise4-7) desenhavam a região como uma nuvem de
+# ax.scatter com milhares de pontos de uma grade (30^3 no Exercise7). Aqui a
+# região é desenhada pela sua casca: os vértices e as facetas vêm exatos de
+# vertices.polytope, e cada faceta (já ordenada ao longo do contorno) vira um
+# leque de triângulos a partir do primeiro vértice:
+#
+#   faceta v0 v1 v2 v3 v4  ->  (v0 v1 v2), (v0 v2 v3), (v0 v3 v4)
+#
+# Os triângulos são orientados para fora (normal no sentido da linha a_i de
+# A x <= b). Uma figura passa a ter algumas dezenas de faces, desenhadas como
+# uma Poly3DCollection, com o contorno das facetas por cima.
+#
+# Exemplo:
+#   mesh = hull_mesh(A, b)                    (x >= 0 incluído por padrão)
+#   mesh.vertices, mesh.triangles, mesh.volume
+#   draw_hull(ax, A, b, senses, label='Região Factível')
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class HullMesh:
+    """Casca triangulada do poliedro {x : A x <= b} em 3D."""
+    vertices: np.ndarray      # (k, 3)
+    triangles: np.ndarray     # (t, 3) índices em `vertices`, orientados para fora
+    facets: dict              # linha de A -> vértices da faceta, em ordem
+
+    def faces(self):
+        """Triângulos como coordenadas (t, 3, 3), prontos para Poly3DCollection."""
+        return self.vertices[self.triangles]
+
+    def edges(self):
+        """Contorno de cada faceta como segmentos (e, 2, 3), sem as diagonais do leque."""
+        pairs = [(idx[k], idx[(k + 1) % len(idx)]) for idx in self.facets.values() for k in range(len(idx))]
+        return self.vertices[np.array(pairs, dtype=np.int64).reshape(-1, 2)]
+
+    @property
+    def volume(self):
+        """Volume pelo teorema da divergência (soma dos tetraedros com a origem)."""
+        T = self.faces()
+        return float(np.einsum('ij,ij->i', T[:, 0], np.cross(T[:, 1], T[:, 2])).sum() / 6.0)
+
+
+def hull_mesh(A, b, senses=None, nonnegative=True, box=None):
+    """Vértices, facetas e triângulos da região factível (sem triângulos se for vazia).
+
+    `box` (xmin, xmax, ymin, ymax, zmin, zmax) recorta regiões ilimitadas.
+    """
+    A, b = as_upper_system(A, b, senses)
+    if A.shape[1] != 3:
+        raise ValueError("hull_mesh trabalha com 3 variáveis")
+    if box is not None:
+        lo, hi = np.array(box[::2], dtype=float), np.array(box[1::2], dtype=float)
+        A, b = np.vstack([A, -np.eye(3), np.eye(3)]), np.concatenate([b, -lo, hi])
+    region = polytope(A, b, nonnegative=nonnegative)
+    V = region.vertices
+    triangles = []
+    for i, idx in region.facets.items():
+        fan = np.array([(idx[0], idx[k], idx[k + 1]) for k in range(1, len(idx) - 1)], dtype=np.int64)
+        if not len(fan):
+            continue
+        T = V[fan]
+        outward = np.cross(T[:, 1] - T[:, 0], T[:, 2] - T[:, 0]) @ region.A[i] >= 0
+        fan[~outward] = fan[~outward][:, ::-1]
+        triangles.append(fan)
+    triangles = np.concatenate(triangles) if triangles else np.empty((0, 3), dtype=np.int64)
+    return HullMesh(vertices=V, triangles=triangles, facets=region.facets)
+
+
+def draw_hull(ax, A, b, senses=None, nonnegative=True, box=None, edgecolor='k', **style):
+    """Desenha a região factível 3D como casca triangulada num eixo projection='3d'.
+
+    Os triângulos recebem `style` (padrão: cinza, alpha 0.3); o contorno das
+    facetas é desenhado com `edgecolor` (None para omitir). Ajusta os limites
+    do eixo à região e retorna a Poly3DCollection (ou None se vazia).
+    """
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+
+    mesh = hull_mesh(A, b, senses, nonnegative, box)
+    if not len(mesh.triangles):
+        return None
+    style.setdefault('facecolor', style.pop('color', 'gray'))
+    style.setdefault('alpha', 0.3)
+    had_data = ax.has_data()
+    surface = Poly3DCollection(mesh.faces(), edgecolor='none', **style)
+    ax.add_collection3d(surface)
+    if edgecolor is not None:
+        ax.add_collection3d(Line3DCollection(mesh.edges(), colors=edgecolor, linewidths=0.6))
+    V = mesh.vertices
+    ax.auto_scale_xyz(V[:, 0], V[:, 1], V[:, 2], had_data=had_data)
+    return surface
@@ -0,0 +1,189 @@
+import os
+import re
+from contextlib import nullcontext
+from dataclasses import dataclass  # Estrutura do diagrama lido
+from itertools import islice
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .cpm import ActivityNetwork, cpm
+
+# =============================================================================
+# DIAGRAMAS MERMAID DAS REDES PERT/CPM (PROVA-05)
+# -----------------------------------------------------------------------------
+# Gera o mesmo formato dos arquivos prova-05/q*/Q*.txt a partir de um
+# cpm.Schedule: nós de início e fim em subgraphs, uma linha por atividade com
+# duração e folgas (classe :::critica ou :::normal) e uma linha por
+# dependência. As linhas são produzidas por um gerador e gravadas em blocos,
+# sem montar o texto inteiro na memória.
+#
+# O caminho inverso (read_mermaid) lê esses arquivos linha a linha de volta
+# para uma ActivityNetwork, guardando as folgas e a duração anotadas à mão
+# para conferência com o CPM (check_chart).
+#
+# Exemplo:
+#   write_mermaid(cpm(network), 'prova-05/q1/Q1.txt')
+#   write_mermaid(schedule, 'Q4.txt', unit=('dia', 'dias'), labels=('TF', 'FL'), separator='│')
+#   chart = read_mermaid('prova-05/q2/Q2.txt')
+#   check_chart(chart)  -> divergências entre o diagrama e o CPM
+# =============================================================================
+
+CLASS_DEFS = (
+    "  classDef critica  fill:#fde2e2,stroke:#e57070,stroke-width:1.5px,rx:6,ry:6,font-family:Arial,font-size:12px;",
+    "  classDef normal   fill:#f7f7f7,stroke:#bbb,       stroke-width:0.8px,rx:4,ry:4,font-family:Arial,font-size:11px;",
+    "  classDef startend fill:#fff8dc,stroke:#ccc,      stroke-width:1px,rx:10,ry:10,font-family:Arial,font-size:12px,bold;",
+)
+LINK_STYLE = "  linkStyle default stroke:#999,stroke-width:1px,stroke-dasharray:2 2;"
+CHUNK = 10_000  # linhas gravadas por bloco
+
+_INVALID_ID = re.compile(r'[^0-9A-Za-z_]')
+_NODE = re.compile(r'^\s*(\w+)\(\[(.*?)\]\)')
+_END = re.compile(r'^\s*fim\(\("\s*([-+\d.eE]+)')
+_AMOUNT = re.compile(r'^\s*([-+\d.eE]+)')
+_FLOATS = re.compile(r'(?:FT|TF)\s*=\s*([-+\d.eE]+)\W+FL\s*=\s*([-+\d.eE]+)')
+
+
+def _node_id(name):
+    # Identificador Mermaid válido (o nome original continua no rótulo)
+    node = _INVALID_ID.sub('_', str(name))
+    return node if node not in ('inicio', 'fim', 'end') else f"{node}_"
+
+
+def _number(value):
+    return f"{value:g}"
+
+
+def _unit(value, unit):
+    singular, plural = (unit, unit) if isinstance(unit, str) else unit
+    return f"{_number(value)} {singular if value == 1 else plural}"
+
+
+def mermaid_lines(schedule, unit='sem', labels=('FT', 'FL'), separator='/', theme=None):
+    """Gera, linha a linha, o flowchart Mermaid do cronograma."""
+    net = schedule.network
+    critical = schedule.critical.tolist()
+    ids = [_node_id(name) for name in net.names]
+
+    if theme:
+        yield from ('---', 'config:', f"  theme: {theme}", '---')
+    yield 'flowchart LR'
+    yield '  subgraph Inicio["Início"]'
+    yield '    direction TB'
+    yield f'    inicio(("{_unit(0, unit)}")):::startend'
+    yield '  end'
+    yield '  subgraph Fim["Fim"]'
+    yield '    direction TB'
+    yield f'    fim(("{_unit(schedule.duration, unit)}")):::startend'
+    yield '  end'
+    yield from CLASS_DEFS
+
+    ft, fl = labels
+    duration = net.duration.tolist()
+    total, free = schedule.total_float.tolist(), schedule.free_float.tolist()
+    for i in schedule.order.tolist():
+        klass = 'critica' if critical[i] else 'normal'
+        yield (f"  {ids[i]}([{net.names[i]}<br/>{_unit(duration[i], unit)}<br/>"
+               f"{ft}={_number(total[i])}{separator}{fl}={_number(free[i])}]):::{klass}")
+    yield LINK_STYLE
+
+    has_pred = np.diff(net.pred_ptr) > 0
+    has_succ = np.diff(net.succ_ptr) > 0
+    for i in np.flatnonzero(~has_pred).tolist():
+        yield f"  inicio --> {ids[i]}"
+    src, dst = net.edges
+    for i, j in zip(src.tolist(), dst.tolist()):
+        yield f"  {ids[i]} --> {ids[j]}"
+    for i in np.flatnonzero(~has_succ).tolist():
+        yield f"  {ids[i]} --> fim"
+
+
+def write_mermaid(schedule, target, **options):
+    """Grava o diagrama em `target` (caminho ou arquivo aberto) em blocos."""
+    if isinstance(target, (str, os.PathLike)):
+        opened = open(target, 'w', encoding='utf-8')
+    else:
+        opened = nullcontext(target)
+    lines = mermaid_lines(schedule, **options)
+    with opened as fh:
+        while chunk := list(islice(lines, CHUNK)):
+            fh.write('\n'.join(chunk))
+            fh.write('\n')
+
+
+@dataclass
+class MermaidChart:
+    """Rede lida de um diagrama, com os valores anotados nele (nan se ausentes)."""
+    network: ActivityNetwork
+    total_float: np.ndarray
+    free_float: np.ndarray
+    duration: float
+    critical: np.ndarray
+
+
+def read_mermaid(source):
+    """Lê um flowchart Mermaid de rede PERT/CPM (caminho ou linhas de texto).
+
+    Nós no formato `ID([NOME<br/>5 sem<br/>FT=0/FL=0]):::classe` e arestas
+    `A --> B` (também encadeadas, `A --> B --> C`); as arestas que saem de
+    `inicio` ou chegam a `fim` só marcam o começo e o fim do projeto.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8') as fh:
+            return read_mermaid(fh)
+
+    position = {}
+    names, duration, total, free, critical = [], [], [], [], []
+    src, dst = [], []
+    end = np.nan
+    for line in source:
+        if '-->' in line:
+            chain = [part.strip() for part in line.split('-->')]
+            for a, b in zip(chain, chain[1:]):
+                if a != 'inicio' and b != 'fim':
+                    src.append(a)
+                    dst.append(b)
+            continue
+        node = _NODE.match(line)
+        if node:
+            parts = node.group(2).split('<br/>')
+            amount = _AMOUNT.match(parts[1]) if len(parts) > 1 else None
+            if amount is None:
+                raise ValueError(f"nó sem duração: {line.strip()!r}")
+            floats = _FLOATS.search(node.group(2))
+            position[node.group(1)] = len(names)
+            names.append(parts[0].strip())
+            duration.append(float(amount.group(1)))
+            total.append(float(floats.group(1)) if floats else np.nan)
+            free.append(float(floats.group(2)) if floats else np.nan)
+            critical.append(line.rstrip().endswith(':::critica'))
+            continue
+        finish = _END.match(line)
+        if finish:
+            end = float(finish.group(1))
+
+    try:
+        src_idx = np.fromiter((position[a] for a in src), dtype=np.int64, count=len(src))
+        dst_idx = np.fromiter((position[b] for b in dst), dtype=np.int64, count=len(dst))
+    except KeyError as exc:
+        raise ValueError(f"aresta para nó não declarado: {exc.args[0]!r}") from None
+    return MermaidChart(
+        network=ActivityNetwork.from_edges(names, duration, src_idx, dst_idx),
+        total_float=np.array(total), free_float=np.array(free),
+        duration=end, critical=np.array(critical, dtype=bool),
+    )
+
+
+def check_chart(chart, tol=1e-9):
+    """Recalcula o CPM e lista as divergências com os valores do diagrama."""
+    schedule = cpm(chart.network)
+    names = chart.network.names
+    issues = []
+    if np.isfinite(chart.duration) and abs(chart.duration - schedule.duration) > tol:
+        issues.append(('fim', 'duração', chart.duration, schedule.duration))
+    for label, drawn, computed in (('FT', chart.total_float, schedule.total_float),
+                                   ('FL', chart.free_float, schedule.free_float)):
+        for i in np.flatnonzero(np.isfinite(drawn) & (np.abs(drawn - computed) > tol)):
+            issues.append((names[i], label, float(drawn[i]), float(computed[i])))
+    for i in np.flatnonzero(chart.critical != schedule.critical):
+        issues.append((names[i], 'crítica', bool(chart.critical[i]), bool(schedule.critical[i])))
+    return issues
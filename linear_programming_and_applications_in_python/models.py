@@ -0,0 +1,282 @@
+import hashlib  # Hash do conteúdo do arquivo (chave do cache)
+import tomllib  # Leitura do formato declarativo (TOML, biblioteca padrão)
+from dataclasses import dataclass  # Estrutura imutável para o modelo lido
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+# =============================================================================
+# FORMATO DECLARATIVO DE MODELOS DE PROGRAMAÇÃO LINEAR
+# -----------------------------------------------------------------------------
+# Cada modelo fica num arquivo .toml ao lado do script que o resolve, no
+# formato compacto "matriz de coeficientes + limites + sentidos + nomes". O
+# arquivo é a única fonte do modelo: o script monta o problema com
+#   model, xs = load_model(Path(__file__).with_name('Exercise7.toml')).to_pulp()
+# e exercícios repetidos (prova-02/q6, q7 e q10) leem o .toml de exercises/.
+#
+#   name = "Exemplo_07"
+#   sense = "max"                  # ou "min"
+#   objective_name = "Lucro"
+#
+#   [variables]
+#   names = ["Facas_Padrao", "Facas_Media", "Facas_Grande"]
+#   objective = [3.0, 4.0, 4.7]
+#   lower = [0, 0, 0]              # opcional (padrão 0)
+#   upper = [inf, inf, inf]        # opcional (padrão sem limite)
+#   integer = [false, false, false]  # opcional (padrão contínuas)
+#
+#   [constraints]
+#   names  = ["Limite_Corte", ...]
+#   senses = ["<=", ...]           # "<=", ">=" ou "="
+#   rhs    = [14400, ...]
+#   matrix = [
+#     [10, 10, 12],
+#     ...
+#   ]
+#
+# load_model() devolve um LinearModel, que monta o problema pulp, expõe os
+# arrays NumPy diretamente ou se resolve via model.solve(backend=...). O resultado do parse fica em cache, indexado pelo
+# SHA-256 do conteúdo: numa execução em lote, cada arquivo é interpretado uma
+# única vez, e uma edição no arquivo invalida a entrada automaticamente.
+# =============================================================================
+
+SENSES = ('<=', '>=', '=')
+
+
+@dataclass(frozen=True)
+class LinearModel:
+    """Modelo de PL em forma matricial: otimizar c @ x sujeito a A x (senses) b."""
+    name: str
+    sense: str
+    variables: tuple
+    objective: np.ndarray
+    constraint_names: tuple
+    A: np.ndarray
+    senses: tuple
+    b: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    integer: np.ndarray
+    objective_name: str = "Objetivo"
+
+    @property
+    def maximize(self):
+        return self.sense == 'max'
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+    @cached_property
+    def standard(self):
+        """Forma padrão (ver simplex.standard_form), calculada uma única vez."""
+        from .simplex import standard_form
+
+        c, A, b, senses, lower, upper = self.arrays()
+        return standard_form(c, A, b, senses, lower, upper, self.maximize)
+
+    def arrays(self):
+        """Retorna (c, A, b, senses, lower, upper) como arrays NumPy."""
+        return self.objective, self.A, self.b, np.array(self.senses), self.lower, self.upper
+
+    def to_pulp(self):
+        """Monta o pulp.LpProblem equivalente; retorna (problema, variáveis)."""
+        import pulp
+
+        problem = pulp.LpProblem(self.name, pulp.LpMaximize if self.maximize else pulp.LpMinimize)
+        xs = [
+            pulp.LpVariable(
+                name,
+                lowBound=None if np.isneginf(lo) else float(lo),
+                upBound=None if np.isposinf(up) else float(up),
+                cat='Integer' if is_int else 'Continuous',
+            )
+            for name, lo, up, is_int in zip(self.variables, self.lower, self.upper, self.integer)
+        ]
+        problem += _affine(self.objective, xs), self.objective_name
+        for name, row, sense, rhs in zip(self.constraint_names, self.A, self.senses, self.b):
+            expr = _affine(row, xs)
+            if sense == '<=':
+                problem += expr <= float(rhs), name
+            elif sense == '>=':
+                problem += expr >= float(rhs), name
+            else:
+                problem += expr == float(rhs), name
+        return problem, xs
+
+    def solve(self, backend='cbc', **options):
+        """Resolve o modelo; ver solvers.BACKENDS para os backends disponíveis."""
+        from .solvers import solve
+
+        return solve(self, backend, **options)
+
+    def sensitivity(self, basis=None):
+        """Preços-sombra, custos reduzidos e faixas (ver sensitivity.py)."""
+        from .sensitivity import sensitivity
+
+        return sensitivity(self, basis)
+
+
+def _affine(coefficients, xs):
+    import pulp
+
+    return pulp.LpAffineExpression(
+        [(x, float(a)) for x, a in zip(xs, coefficients) if a != 0]
+    )
+
+
+def _readonly(values, dtype=float):
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def parse_model(data):
+    """Valida o dicionário lido do TOML e constrói o LinearModel."""
+    variables = data['variables']
+    constraints = data.get('constraints', {})
+    names = tuple(variables['names'])
+    n = len(names)
+
+    sense = data.get('sense', 'max').lower()
+    if sense not in ('max', 'min'):
+        raise ValueError(f"Sentido do objetivo inválido: {sense!r}")
+
+    matrix = constraints.get('matrix', [])
+    A = _readonly(matrix).reshape(len(matrix), n)
+    senses = tuple(constraints.get('senses', ['<='] * len(A)))
+    bad = set(senses) - set(SENSES)
+    if bad:
+        raise ValueError(f"Sentidos de restrição inválidos: {sorted(bad)}")
+    row_names = tuple(constraints.get('names', [f"R{i + 1}" for i in range(len(A))]))
+
+    model = LinearModel(
+        name=data.get('name', 'Modelo'),
+        sense=sense,
+        variables=names,
+        objective=_readonly(variables['objective']),
+        constraint_names=row_names,
+        A=A,
+        senses=senses,
+        b=_readonly(constraints.get('rhs', [])),
+        lower=_readonly(variables.get('lower', [0.0] * n)),
+        upper=_readonly(variables.get('upper', [np.inf] * n)),
+        integer=_readonly(variables.get('integer', [False] * n), dtype=bool),
+        objective_name=data.get('objective_name', 'Objetivo'),
+    )
+    for field_name, size in (('objective', n), ('lower', n), ('upper', n), ('integer', n),
+                             ('b', len(A)), ('senses', len(A)), ('constraint_names', len(A))):
+        if len(getattr(model, field_name)) != size:
+            raise ValueError(f"{model.name}: '{field_name}' deveria ter {size} elementos")
+    return model
+
+
+_CACHE = {}
+
+
+def load_model(path):
+    """Lê um arquivo de modelo, reaproveitando o parse se o conteúdo não mudou."""
+    raw = Path(path).read_bytes()
+    key = hashlib.sha256(raw).hexdigest()
+    model = _CACHE.get(key)
+    if model is None:
+        model = parse_model(tomllib.loads(raw.decode('utf-8')))
+        _CACHE[key] = model
+    return model
+
+
+def clear_model_cache():
+    """Esvazia o cache de modelos lidos."""
+    _CACHE.clear()
+
+
+def from_pulp(problem):
+    """Converte um pulp.LpProblem já montado para LinearModel."""
+    import pulp
+
+    # Ordem de aparição (objetivo e depois restrições), como nos scripts;
+    # problem.variables() ordenaria por nome.
+    seen = {}
+    for expr in (problem.objective, *problem.constraints.values()):
+        for x in expr.keys():
+            seen.setdefault(x.name, x)
+    for x in problem.variables():
+        seen.setdefault(x.name, x)
+    xs = list(seen.values())
+    index = {x.name: j for j, x in enumerate(xs)}
+    c = np.zeros(len(xs))
+    for x, a in problem.objective.items():
+        c[index[x.name]] = a
+
+    sense_map = {pulp.LpConstraintLE: '<=', pulp.LpConstraintGE: '>=', pulp.LpConstraintEQ: '='}
+    names, rows, senses, rhs = [], [], [], []
+    for name, constraint in problem.constraints.items():
+        row = np.zeros(len(xs))
+        for x, a in constraint.items():
+            row[index[x.name]] = a
+        names.append(name)
+        rows.append(row)
+        senses.append(sense_map[constraint.sense])
+        rhs.append(-constraint.constant)
+
+    return LinearModel(
+        name=problem.name,
+        sense='max' if problem.sense == pulp.LpMaximize else 'min',
+        variables=tuple(x.name for x in xs),
+        objective=_readonly(c),
+        constraint_names=tuple(names),
+        A=_readonly(rows).reshape(len(rows), len(xs)),
+        senses=tuple(senses),
+        b=_readonly(rhs),
+        lower=_readonly([-np.inf if x.lowBound is None else x.lowBound for x in xs]),
+        upper=_readonly([np.inf if x.upBound is None else x.upBound for x in xs]),
+        integer=_readonly([x.cat == pulp.LpInteger for x in xs], dtype=bool),
+        objective_name=problem.objective.name or 'Objetivo',
+    )
+
+
+def _toml_value(value):
+    if isinstance(value, (bool, np.bool_)):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    value = float(value)
+    if np.isinf(value):
+        return 'inf' if value > 0 else '-inf'
+    return repr(int(value)) if value.is_integer() and abs(value) < 2 ** 53 else repr(value)
+
+
+def _toml_list(values):
+    return '[' + ', '.join(_toml_value(v) for v in values) + ']'
+
+
+def dump_model(model, header=None):
+    """Serializa um LinearModel no formato declarativo (texto TOML)."""
+    lines = [f"# {line}".rstrip() for line in (header or '').splitlines()]
+    lines += [
+        f"name = {_toml_value(model.name)}",
+        f"sense = {_toml_value(model.sense)}",
+        f"objective_name = {_toml_value(model.objective_name)}",
+        "",
+        "[variables]",
+        f"names = {_toml_list(model.variables)}",
+        f"objective = {_toml_list(model.objective)}",
+    ]
+    if np.any(model.lower != 0):
+        lines.append(f"lower = {_toml_list(model.lower)}")
+    if np.any(np.isfinite(model.upper)):
+        lines.append(f"upper = {_toml_list(model.upper)}")
+    if np.any(model.integer):
+        lines.append(f"integer = {_toml_list(model.integer)}")
+    lines += [
+        "",
+        "[constraints]",
+        f"names = {_toml_list(model.constraint_names)}",
+        f"senses = {_toml_list(model.senses)}",
+        f"rhs = {_toml_list(model.b)}",
+        "matrix = [",
+        *(f"  {_toml_list(row)}," for row in model.A),
+        "]",
+    ]
+    return '\n'.join(lines) + '\n'
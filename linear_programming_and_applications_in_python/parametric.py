@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .revised import BasisFactor, revised_simplex
+
+# =============================================================================
+# ANÁLISE PARAMÉTRICA DO LADO DIREITO (RHS) COM REINÍCIO A QUENTE
+# -----------------------------------------------------------------------------
+# Para perguntas como "como o lucro do Exercise7 muda quando as horas de corte
+# (CUT_AVAILABLE) variam?", varremos um ou mais valores de b e, a cada passo,
+# reaproveitamos a base ótima do passo anterior: mudar b não altera os custos
+# reduzidos, então a base continua dual factível e o simplex dual corrige a
+# factibilidade primal em poucos pivôs (muitas vezes nenhum).
+#
+# Quando a base muda entre dois passos, o ponto exato da troca (breakpoint) é
+# calculado pela faixa de validade da base antiga: com b(s) = b_0 + s Δb,
+# x_B(s) = B^-1 b_0 + s B^-1 Δb deixa de ser >= 0 no primeiro s em que algum
+# componente zera.
+#
+# Exemplo:
+#   model = load_model('exercises/Exercise7.toml')
+#   sweep = rhs_sweep(model, ['Limite_Corte'], np.arange(0, 20_001, 500))
+#   sweep.breakpoints  -> valores de Limite_Corte em que a base ótima muda
+# =============================================================================
+
+
+@dataclass
+class ParametricResult:
+    """Resultado de rhs_sweep; cada passo da varredura é uma linha."""
+    rows: tuple              # nomes das restrições variadas
+    values: np.ndarray       # (T, k) valores do lado direito de cada passo
+    status: np.ndarray       # (T,)
+    objective: np.ndarray    # (T,)
+    x: np.ndarray            # (T, n)
+    iterations: np.ndarray   # pivôs gastos em cada passo (reinício a quente)
+    bases: list = field(default_factory=list)
+    breakpoints: list = field(default_factory=list)
+
+    def table(self):
+        """Linhas (valores, status, objetivo) para impressão."""
+        return [(tuple(v), s, o) for v, s, o in zip(self.values, self.status, self.objective)]
+
+
+def _row_indices(model, rows):
+    names = list(model.constraint_names)
+    try:
+        return np.array([names.index(r) if isinstance(r, str) else int(r) for r in rows])
+    except ValueError as exc:
+        raise ValueError(f"{model.name}: restrição desconhecida ({exc})") from None
+
+
+def _standard_rhs(model, b):
+    # Mesma transformação de standard_form, mas mantendo os sinais de linha da
+    # forma padrão original: assim a base anterior continua valendo para o novo b.
+    sf = model.standard
+    rhs = sf.b.copy()
+    rhs[:sf.m_model] = (b - np.asarray(model.A) @ sf.lower) * sf.row_sign[:sf.m_model]
+    return rhs
+
+
+def _column_names(model):
+    # Nomes legíveis das colunas da forma padrão (variáveis, partes negativas
+    # de variáveis livres e folgas/excessos de cada linha)
+    sf = model.standard
+    names = list(model.variables) + [f"{model.variables[j]}-" for j in sf.free]
+    rows = list(model.constraint_names) + [
+        f"limite_{model.variables[j]}" for j in np.flatnonzero(np.isfinite(model.upper))]
+    names += [f"folga_{rows[i]}" for i in np.flatnonzero(sf.slack >= 0)]
+    return names
+
+
+def _breakpoint(model, basis, b_from, b_to, tol=1e-9):
+    # Maior s em [0, 1] para o qual a base continua primal factível
+    factor = BasisFactor(model.standard.A, basis)
+    x0 = factor.ftran(_standard_rhs(model, b_from))
+    dx = factor.ftran(_standard_rhs(model, b_to) - _standard_rhs(model, b_from))
+    falling = dx < -tol
+    if not falling.any():
+        return None
+    s = float(np.min(x0[falling] / -dx[falling]))
+    return min(max(s, 0.0), 1.0)
+
+
+def rhs_sweep(model, rows, values, max_iter=10_000):
+    """Varre valores do lado direito das restrições `rows` de um modelo contínuo.
+
+    rows : nomes (ou índices) das restrições cujo lado direito varia.
+    values : (T,) para uma restrição ou (T, k) para k restrições.
+    """
+    if np.any(model.integer):
+        raise ValueError(f"{model.name}: a análise paramétrica exige um modelo contínuo")
+    idx = _row_indices(model, rows)
+    values = np.asarray(values, dtype=float).reshape(len(values), -1)
+    if values.shape[1] != len(idx):
+        raise ValueError(f"esperados {len(idx)} valores por passo, recebidos {values.shape[1]}")
+
+    sf = model.standard
+    T = len(values)
+    status = np.empty(T, dtype=object)
+    objective = np.full(T, np.nan)
+    x = np.full((T, sf.n), np.nan)
+    iterations = np.zeros(T, dtype=np.intp)
+    bases, breakpoints = [], []
+    columns = _column_names(model)
+
+    basis = None
+    b_prev = None
+    for t, v in enumerate(values):
+        b = np.array(model.b, dtype=float)
+        b[idx] = v
+        result = revised_simplex(sf.c, sf.A, _standard_rhs(model, b), basis=basis, max_iter=max_iter)
+        status[t] = result.status
+        iterations[t] = result.iterations
+        if result.status != 'Optimal':
+            bases.append(None)
+            basis = None
+            b_prev = None
+            continue
+        objective[t] = sf.objective(result.z)
+        x[t] = sf.recover(result.z)
+        bases.append(result.basis.copy())
+
+        if basis is not None and set(basis) != set(result.basis):
+            s = _breakpoint(model, basis, b_prev, b)
+            at = values[t - 1] + (s if s is not None else 1.0) * (v - values[t - 1])
+            breakpoints.append({
+                'step': t,
+                'value': float(at[0]) if len(at) == 1 else at,
+                'leaving': [columns[j] for j in sorted(set(basis) - set(result.basis))],
+                'entering': [columns[j] for j in sorted(set(result.basis) - set(basis))],
+            })
+        basis = result.basis
+        b_prev = b
+
+    return ParametricResult(
+        rows=tuple(model.constraint_names[i] for i in idx), values=values, status=status,
+        objective=objective, x=x, iterations=iterations, bases=bases, breakpoints=breakpoints,
+    )
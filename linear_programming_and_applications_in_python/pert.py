@@ -0,0 +1,148 @@
+import os
+from concurrent.futures import ProcessPoolExecutor  # Divisão das amostras entre processos
+from dataclasses import dataclass  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .cpm import TOL, _gather, topological_levels
+
+# =============================================================================
+# PERT PROBABILÍSTICO POR SIMULAÇÃO DE MONTE CARLO
+# -----------------------------------------------------------------------------
+# Na Aula 05 cada atividade tem três estimativas de tempo: otimista (a), mais
+# provável (m) e pessimista (b). A fórmula clássica dá, para cada atividade,
+#
+#   média   t_e = (a + 4m + b) / 6        variância   ((b - a) / 6)^2
+#
+# e supõe que o caminho crítico das médias é o único que importa. A simulação
+# não precisa dessa hipótese: sorteamos as durações de todas as atividades
+# para S cenários de uma vez (matriz S x n, distribuição beta-PERT) e fazemos
+# as passagens do CPM com a matriz inteira, nível a nível da ordem
+# topológica. Saem a distribuição do prazo do projeto e o índice de
+# criticidade de cada atividade (fração dos cenários em que ela é crítica).
+#
+# Exemplo:
+#   sim = simulate(network, otimista, provavel, pessimista, samples=1_000_000)
+#   sim.probability(66)   -> P(projeto termina em até 66 semanas)
+#   sim.criticality       -> índice de criticidade por atividade
+# =============================================================================
+
+CHUNK = 100_000  # cenários por bloco (limita a memória a alguns MB por nível)
+
+
+def pert_estimates(optimistic, most_likely, pessimistic):
+    """Média e variância clássicas do PERT (Aula 05) para cada atividade."""
+    a = np.asarray(optimistic, dtype=float)
+    m = np.asarray(most_likely, dtype=float)
+    b = np.asarray(pessimistic, dtype=float)
+    if np.any(a > m) or np.any(m > b):
+        raise ValueError("as estimativas devem satisfazer otimista <= mais provável <= pessimista")
+    return (a + 4 * m + b) / 6, ((b - a) / 6) ** 2
+
+
+def sample_durations(rng, optimistic, most_likely, pessimistic, size, distribution='beta'):
+    """Sorteia uma matriz (size, n) de durações com distribuição beta-PERT ou triangular."""
+    a = np.asarray(optimistic, dtype=float)
+    m = np.asarray(most_likely, dtype=float)
+    b = np.asarray(pessimistic, dtype=float)
+    span = b - a
+    fixed = span <= 0
+    if distribution == 'triangular':
+        left = np.where(fixed, a - 1.0, a)
+        right = np.where(fixed, a + 1.0, b)
+        return np.where(fixed, a, rng.triangular(left, np.clip(m, left, right), right, (size, len(a))))
+    if distribution != 'beta':
+        raise ValueError(f"distribuição desconhecida: {distribution!r} (opções: 'beta', 'triangular')")
+    safe = np.where(fixed, 1.0, span)
+    alpha = 1 + 4 * (m - a) / safe
+    beta = 1 + 4 * (b - m) / safe
+    return a + span * rng.beta(alpha, beta, (size, len(a)))
+
+
+@dataclass
+class PertSimulation:
+    """Resultado de simulate(); `completion` tem um prazo por cenário."""
+    names: tuple
+    completion: np.ndarray
+    criticality: np.ndarray
+
+    @property
+    def mean(self):
+        return float(self.completion.mean())
+
+    @property
+    def std(self):
+        return float(self.completion.std(ddof=1))
+
+    def quantile(self, q):
+        return np.quantile(self.completion, q)
+
+    def probability(self, deadline):
+        """P(prazo do projeto <= deadline), estimada pelos cenários."""
+        return float(np.mean(self.completion <= deadline))
+
+    def criticality_index(self):
+        return dict(zip(self.names, self.criticality.tolist()))
+
+
+def _simulate_chunk(network, order, level_ptr, estimates, size, seed, distribution):
+    # Passagens de ida e volta do CPM para `size` cenários de uma vez
+    rng = np.random.default_rng(seed)
+    D = sample_durations(rng, *estimates, size, distribution)
+    n = network.size
+    levels = [order[level_ptr[k]:level_ptr[k + 1]] for k in range(len(level_ptr) - 1)]
+
+    EF = np.empty((size, n))
+    for k, nodes in enumerate(levels):
+        if k == 0:
+            EF[:, nodes] = D[:, nodes]
+            continue
+        idx, counts = _gather(network.pred_ptr, nodes)
+        preds = network.pred_idx[idx]
+        offsets = np.cumsum(counts) - counts
+        EF[:, nodes] = np.maximum.reduceat(EF[:, preds], offsets, axis=1) + D[:, nodes]
+    T = EF.max(axis=1)
+
+    LS = np.empty((size, n))
+    for nodes in reversed(levels):
+        idx, counts = _gather(network.succ_ptr, nodes)
+        lf = np.repeat(T[:, None], len(nodes), axis=1)
+        filled = counts > 0
+        if filled.any():
+            succ = network.succ_idx[idx]
+            offsets = (np.cumsum(counts) - counts)[filled]
+            lf[:, filled] = np.minimum.reduceat(LS[:, succ], offsets, axis=1)
+        LS[:, nodes] = lf - D[:, nodes]
+
+    ES = EF - D
+    critical = (LS - ES) <= TOL * (1.0 + T[:, None])
+    return T, critical.sum(axis=0)
+
+
+def simulate(network, optimistic, most_likely, pessimistic, samples=1_000_000, seed=0,
+             distribution='beta', jobs=1, chunk_size=CHUNK):
+    """Simula o prazo do projeto com durações aleatórias (três estimativas).
+
+    Os cenários são gerados em blocos de `chunk_size`, cada um com sua própria
+    semente derivada de `seed`; com `jobs` > 1 os blocos são divididos entre
+    processos e o resultado é o mesmo da execução em um processo só.
+    """
+    estimates = tuple(np.asarray(v, dtype=float) for v in (optimistic, most_likely, pessimistic))
+    pert_estimates(*estimates)  # valida a ordem a <= m <= b
+    if any(len(v) != network.size for v in estimates):
+        raise ValueError(f"esperadas {network.size} estimativas por tipo")
+    order, level_ptr = topological_levels(network)
+
+    sizes = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(network, order, level_ptr, estimates, size, s, distribution) for size, s in zip(sizes, seeds)]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(args) <= 1:
+        parts = [_simulate_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(args))) as pool:
+            parts = list(pool.map(_simulate_chunk, *zip(*args)))
+
+    completion = np.concatenate([T for T, _ in parts])
+    counts = np.sum([c for _, c in parts], axis=0)
+    return PertSimulation(names=network.names, completion=completion, criticality=counts / samples)
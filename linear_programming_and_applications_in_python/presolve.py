@@ -0,0 +1,170 @@
+import math
+from dataclasses import dataclass, field, replace  # Relatório e modelo reduzido
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .models import _readonly
+
+# =============================================================================
+# PRÉ-PROCESSAMENTO (PRESOLVE): LIMITES E RESTRIÇÕES REDUNDANTES
+# -----------------------------------------------------------------------------
+# Antes de qualquer backend, o modelo passa por reduções que não mudam o
+# conjunto de soluções ótimas:
+#
+#   1. linha singleton (um só coeficiente, como x1 <= 40 no Exercise1)
+#      -> vira limite da variável e sai da matriz;
+#   2. linha vazia -> sai (ou o modelo é infactível);
+#   3. linha redundante pelos limites: a maior atividade possível de A_i x
+#      dentro de [lower, upper] já respeita b_i;
+#   4. linha dominada: com x >= 0, se a_i <= t a_k coeficiente a coeficiente
+#      e t b_k <= b_i (t >= 0), toda solução da linha k satisfaz a linha i.
+#      Cobre linhas duplicadas e paralelas e casos como "Montagem" e "Cabo"
+#      na prova-02/q7 (mesmos coeficientes, exceto 22 <= 24).
+#
+# As passagens se repetem até nada mudar. As variáveis não saem do modelo,
+# então a solução do modelo reduzido vale para o original.
+#
+# Exemplo:
+#   reduced = presolve(load_model('exercises/Exercise7.toml'))
+#   print(reduced.summary())
+#   reduced.model.solve('revised')        (ou model.solve('revised', presolve=True))
+# =============================================================================
+
+TOL = 1e-9
+DOMINANCE_LIMIT = 2_000  # acima disso a comparação par a par (O(m^2 n)) é pulada
+MAX_PASSES = 10
+
+
+@dataclass
+class PresolveResult:
+    """Modelo reduzido e o registro das reduções."""
+    model: object
+    original: object
+    status: str = 'Reduced'                      # ou 'Infeasible'
+    removed: list = field(default_factory=list)  # (linha, motivo)
+    bounds: list = field(default_factory=list)   # (variável, 'lower'/'upper', antes, depois)
+
+    def summary(self):
+        m0, n = self.original.A.shape
+        lines = [f"{self.original.name}: {m0} -> {self.model.A.shape[0]} linhas, {n} variáveis"
+                 + ("" if self.status == 'Reduced' else f" ({self.status})")]
+        lines += [f"  - {row}: {reason}" for row, reason in self.removed]
+        lines += [f"  * {name}: {kind} {_fmt(old)} -> {_fmt(new)}" for name, kind, old, new in self.bounds]
+        return '\n'.join(lines)
+
+
+def _fmt(value):
+    return f"{value:g}"
+
+
+def _activity_max(A, lower, upper):
+    # Maior valor de cada A_i x com lower <= x <= upper (inf se ilimitado)
+    with np.errstate(invalid='ignore'):
+        terms = np.where(A > 0, A * upper, np.where(A < 0, A * lower, 0.0))
+    return terms.sum(axis=1)
+
+
+def _dominated(G, h, lower, tol):
+    # Linhas de G x <= h implicadas por outra linha ainda presente
+    m = len(h)
+    nonneg = lower >= -tol
+    alive = np.ones(m, dtype=bool)
+    for i in range(m):
+        if h[i] < 0:
+            continue
+        candidates = alive & (h > tol)
+        candidates[i] = False
+        if not candidates.any():
+            continue
+        k = np.flatnonzero(candidates)
+        t = h[i] / h[k]
+        diff = G[i] - t[:, None] * G[k]
+        ok = np.all(np.where(nonneg, diff <= tol * (1.0 + np.abs(G[i])), np.abs(diff) <= tol), axis=1)
+        if ok.any():
+            alive[i] = False
+    return ~alive
+
+
+def presolve(model, tol=TOL):
+    """Aplica as reduções ao modelo e retorna um PresolveResult."""
+    A = np.array(model.A, dtype=float)
+    b = np.array(model.b, dtype=float)
+    senses = list(model.senses)
+    names = list(model.constraint_names)
+    lower = np.array(model.lower, dtype=float)
+    upper = np.array(model.upper, dtype=float)
+    integer = np.asarray(model.integer, dtype=bool)
+    result = PresolveResult(model=model, original=model)
+
+    def tighten(j, kind, value):
+        if integer[j]:
+            value = math.floor(value + tol) if kind == 'upper' else math.ceil(value - tol)
+        current = upper[j] if kind == 'upper' else lower[j]
+        if (kind == 'upper' and value < current - tol) or (kind == 'lower' and value > current + tol):
+            result.bounds.append((model.variables[j], kind, float(current), float(value)))
+            (upper if kind == 'upper' else lower)[j] = value
+
+    keep = np.ones(len(b), dtype=bool)
+    for _ in range(MAX_PASSES):
+        changed = False
+        for i in np.flatnonzero(keep):
+            support = np.flatnonzero(np.abs(A[i]) > tol)
+            if len(support) > 1:
+                continue
+            if len(support) == 0:
+                ok = {'<=': 0 <= b[i] + tol, '>=': 0 >= b[i] - tol, '=': abs(b[i]) <= tol}[senses[i]]
+                if not ok:
+                    result.status = 'Infeasible'
+                    result.removed.append((names[i], 'linha vazia infactível'))
+                    return result
+                result.removed.append((names[i], 'linha vazia'))
+            else:
+                j = int(support[0])
+                value = b[i] / A[i, j]
+                sense = senses[i]
+                if A[i, j] < 0 and sense != '=':
+                    sense = '>=' if sense == '<=' else '<='
+                if sense in ('<=', '='):
+                    tighten(j, 'upper', value)
+                if sense in ('>=', '='):
+                    tighten(j, 'lower', value)
+                result.removed.append((names[i], f"singleton -> limite de {model.variables[j]}"))
+            keep[i] = False
+            changed = True
+        if np.any(lower > upper + tol):
+            result.status = 'Infeasible'
+            break
+
+        # Forma "<=" das linhas de desigualdade restantes
+        rows = np.flatnonzero(keep & (np.array(senses) != '='))
+        sign = np.where(np.array(senses)[rows] == '>=', -1.0, 1.0)
+        G, h = A[rows] * sign[:, None], b[rows] * sign
+        high = _activity_max(G, lower, upper)
+        low = -_activity_max(-G, lower, upper)
+        if np.any(low > h + tol * (1.0 + np.abs(h))):
+            result.status = 'Infeasible'
+            break
+        redundant = high <= h + tol * (1.0 + np.abs(h))
+        for i in rows[redundant]:
+            result.removed.append((names[i], 'redundante pelos limites'))
+            keep[i] = False
+            changed = True
+        rows, G, h = rows[~redundant], G[~redundant], h[~redundant]
+        if 1 < len(rows) <= DOMINANCE_LIMIT:
+            for i in rows[_dominated(G, h, lower, tol)]:
+                result.removed.append((names[i], 'dominada por outra linha'))
+                keep[i] = False
+                changed = True
+        if not changed:
+            break
+
+    result.model = replace(
+        model,
+        A=_readonly(A[keep].reshape(int(keep.sum()), A.shape[1])),
+        b=_readonly(b[keep]),
+        senses=tuple(s for s, k in zip(senses, keep) if k),
+        constraint_names=tuple(s for s, k in zip(names, keep) if k),
+        lower=_readonly(lower),
+        upper=_readonly(upper),
+    )
+    return result
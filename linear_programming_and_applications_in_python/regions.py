@@ -0,0 +1,265 @@
+from collections import deque
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .sampling import as_upper_system
+from .vertices import polytope, with_nonnegativity
+
+# =============================================================================
+# REGIÃO FACTÍVEL EXATA EM 2D (INTERSEÇÃO DE SEMIPLANOS)
+# -----------------------------------------------------------------------------
+# Os scripts 2D desenham a região com np.linspace (200-300 pontos) e
+# envelopes np.minimum/np.maximum antes do fill_between, e o Exercise11
+# digita os vértices à mão. Aqui o polígono sai exato das restrições:
+#
+#   - cada linha a_i x <= b_i é um semiplano; a reta de fronteira recebe a
+#     direção (-a2, a1), com a região à esquerda;
+#   - os semiplanos são ordenados pelo ângulo dessa direção (O(m log m)) e,
+#     entre paralelos de mesmo sentido, fica só o mais restritivo;
+#   - uma fila dupla mantém as retas que ainda formam o contorno: cada reta
+#     nova descarta do fim e do início as que deixaram de contribuir.
+#
+# Regiões ilimitadas são recortadas pela caixa `box` (xmin, xmax, ymin, ymax),
+# normalmente os limites do gráfico.
+#
+# As retas de fronteira também saem exatas: cada reta a_i x = b_i é recortada
+# pela caixa e desenhada como um segmento (dois pontos), no lugar de
+# contour/contourf sobre máscaras np.meshgrid de 200 x 200 pontos. Para
+# modelos com 3+ variáveis, `fixed` fixa as demais (por exemplo x3 = 0) e o
+# corte 2D é desenhado do mesmo jeito; pontos inteiros saem por intervalo de
+# cada coluna, sem grade.
+#
+# Exemplo:
+#   V = feasible_polygon(model.A, model.b, model.senses, box=(0, 50, 0, 45))
+#   draw_region(ax, model.A, model.b, model.senses, color='gray', alpha=0.3)
+#   draw_model_region(ax, model, box=(0, 10, 0, 10))   (LinearModel ou pulp.LpProblem)
+#   draw_model_region(ax, model, box=(0, 30, 0, 30), fixed={'C': 0})
+#   draw_boundaries(ax, [[7, 9], [11, 5]], [63, 55], box=(0, 4, 0, 8), linestyle='--')
+# =============================================================================
+
+TOL = 1e-9
+BIG = 1e9  # meia-largura da caixa padrão, relativa à escala do sistema
+
+
+def _box_rows(box):
+    xmin, xmax, ymin, ymax = box
+    return np.array([[-1.0, 0.0], [1.0, 0.0], [0.0, -1.0], [0.0, 1.0]]), np.array([-xmin, xmax, -ymin, ymax])
+
+
+def _meet(A, b, i, j):
+    # Interseção das retas de fronteira i e j (None se paralelas)
+    det = A[i, 0] * A[j, 1] - A[i, 1] * A[j, 0]
+    if abs(det) <= TOL * np.linalg.norm(A[i]) * np.linalg.norm(A[j]):
+        return None
+    return np.array([(b[i] * A[j, 1] - A[i, 1] * b[j]) / det, (A[i, 0] * b[j] - b[i] * A[j, 0]) / det])
+
+
+def feasible_polygon(A, b, senses=None, nonnegative=True, box=None, tol=TOL):
+    """Vértices (k, 2) da região {x : A x <= b} em sentido anti-horário.
+
+    `box` (xmin, xmax, ymin, ymax) recorta regiões ilimitadas; sem ela, uma
+    caixa muito grande é usada. Retorna um array vazio se a região for vazia
+    ou degenerada (segmento ou ponto).
+    """
+    A, b = with_nonnegativity(A, b, senses, nonnegative)
+    if A.shape[1] != 2:
+        raise ValueError("feasible_polygon trabalha com 2 variáveis")
+    if box is None:
+        size = BIG * (1.0 + np.abs(b).max(initial=0.0))
+        box = (-size, size, -size, size)
+    rows, rhs = _box_rows(box)
+    A, b = np.vstack([A, rows]), np.concatenate([b, rhs])
+
+    norm = np.linalg.norm(A, axis=1)
+    empty = norm <= tol
+    if np.any(b[empty] < -tol):
+        return np.empty((0, 2))
+    A, b, norm = A[~empty] / norm[~empty, None], b[~empty] / norm[~empty], None
+
+    # Ordena pelo ângulo da direção da fronteira; entre paralelas, a de menor b
+    angle = np.round(np.arctan2(A[:, 0], -A[:, 1]), 12)
+    order = np.lexsort((b, angle))
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = angle[order][1:] != angle[order][:-1]
+    order = order[keep]
+
+    def outside(i, p):
+        return A[i] @ p > b[i] + tol * (1.0 + abs(b[i]))
+
+    lines = deque()
+    points = deque()  # points[k] = interseção de lines[k] e lines[k + 1]
+    for i in order.tolist():
+        while len(lines) >= 2 and outside(i, points[-1]):
+            lines.pop()
+            points.pop()
+        while len(lines) >= 2 and outside(i, points[0]):
+            lines.popleft()
+            points.popleft()
+        if lines:
+            p = _meet(A, b, lines[-1], i)
+            if p is None:
+                # Paralela de sentido oposto: ou a faixa é vazia, ou a reta
+                # não muda o contorno agora (as vizinhas vão cortá-la)
+                if A[i] @ (A[lines[-1]] * b[lines[-1]]) > b[i] + tol:
+                    return np.empty((0, 2))
+                continue
+            points.append(p)
+        lines.append(i)
+    while len(lines) >= 3 and outside(lines[0], points[-1]):
+        lines.pop()
+        points.pop()
+    while len(lines) >= 3 and outside(lines[-1], points[0]):
+        lines.popleft()
+        points.popleft()
+    if len(lines) < 3:
+        return np.empty((0, 2))
+    closing = _meet(A, b, lines[-1], lines[0])
+    if closing is None:
+        return np.empty((0, 2))
+
+    V = np.array(list(points) + [closing])
+    if np.any(A @ V.T > b[:, None] + 1e-7 * (1.0 + np.abs(b)[:, None])):
+        return np.empty((0, 2))
+    # Remove vértices repetidos (três ou mais retas pelo mesmo ponto)
+    step = 1e-9 * max(1.0, float(np.abs(V).max()))
+    distinct = np.ones(len(V), dtype=bool)
+    distinct[1:] = np.any(np.abs(np.diff(V, axis=0)) > step, axis=1)
+    if len(V) > 1 and np.all(np.abs(V[-1] - V[0]) <= step):
+        distinct[-1] = False
+    V = V[distinct]
+    if len(V) < 3:
+        return np.empty((0, 2))
+    return V + 0.0  # troca -0.0 por 0.0
+
+
+def draw_region(ax, A, b, senses=None, nonnegative=True, box=None, **style):
+    """Desenha a região factível exata como um único Polygon do matplotlib.
+
+    Sem `box`, usa os limites atuais do eixo. Retorna o patch (ou None se a
+    região for vazia).
+    """
+    from matplotlib.patches import Polygon
+
+    if box is None:
+        box = (*ax.get_xlim(), *ax.get_ylim())
+    V = feasible_polygon(A, b, senses, nonnegative, box)
+    if not len(V):
+        return None
+    style.setdefault('color', 'gray')
+    style.setdefault('alpha', 0.3)
+    patch = Polygon(V, closed=True, **style)
+    ax.add_patch(patch)
+    return patch
+
+
+def boundary_segments(A, b, box):
+    """Segmentos (m, 2, 2) das retas a_i x = b_i dentro da caixa (NaN se não a cruzam)."""
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float).ravel()
+    lo, hi = np.array(box[::2], dtype=float), np.array(box[1::2], dtype=float)
+    norm2 = np.einsum('ij,ij->i', A, A)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p0 = A * (b / norm2)[:, None]                  # ponto da reta mais próximo da origem
+        d = np.column_stack([-A[:, 1], A[:, 0]])       # direção da reta
+        t1, t2 = (lo - p0) / d, (hi - p0) / d
+        flat = d == 0                                  # reta paralela ao eixo
+        inside = (p0 >= lo - TOL) & (p0 <= hi + TOL)
+        start = np.where(flat, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2)).max(axis=1)
+        stop = np.where(flat, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2)).min(axis=1)
+        segments = p0[:, None, :] + np.stack([start, stop], axis=1)[:, :, None] * d[:, None, :]
+    segments[~((start <= stop) & (norm2 > 0))] = np.nan
+    return segments
+
+
+def draw_boundaries(ax, A, b, box=None, labels=None, colors=None, **style):
+    """Desenha as retas de fronteira como segmentos exatos; retorna as Line2D."""
+    if box is None:
+        box = (*ax.get_xlim(), *ax.get_ylim())
+    lines = []
+    for i, segment in enumerate(boundary_segments(A, b, box)):
+        if np.isnan(segment).any():
+            continue
+        options = dict(style)
+        if labels is not None:
+            options['label'] = labels[i]
+        if colors is not None:
+            options['color'] = colors[i]
+        lines.extend(ax.plot(segment[:, 0], segment[:, 1], **options))
+    return lines
+
+
+def integer_points(A, b, senses=None, nonnegative=True, box=None):
+    """Pontos inteiros (k, 2) da região, coluna a coluna: para cada x inteiro da
+    caixa, o intervalo de y vem direto das restrições.
+
+    A faixa de x sai dos vértices (vertices.polytope), que existem também
+    quando a região se reduz a um segmento ou a um ponto. Sem `box`, a região
+    precisa ser limitada.
+    """
+    A, b = with_nonnegativity(A, b, senses, nonnegative)
+    if A.shape[1] != 2:
+        raise ValueError("integer_points trabalha com 2 variáveis")
+    bounded = box is not None
+    if not bounded:
+        size = BIG * (1.0 + np.abs(b).max(initial=0.0))
+        box = (-size, size, -size, size)
+    rows, rhs = _box_rows(box)
+    A, b = np.vstack([A, rows]), np.concatenate([b, rhs])
+    V = polytope(A, b, nonnegative=False).vertices
+    if not len(V):
+        return np.empty((0, 2), dtype=np.int64)
+    if not bounded and np.abs(V).max() >= 0.5 * box[1]:
+        raise ValueError("região ilimitada: informe `box` para integer_points")
+    xs = np.arange(np.ceil(V[:, 0].min() - TOL), np.floor(V[:, 0].max() + TOL) + 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bound = (b[:, None] - A[:, :1] * xs[None, :]) / A[:, 1:]    # y (<= ou >=) bound
+    up, down = A[:, 1] > TOL, A[:, 1] < -TOL
+    y_hi = np.floor(np.min(bound[up], axis=0, initial=np.inf) + TOL)
+    y_lo = np.ceil(np.max(bound[down], axis=0, initial=-np.inf) - TOL)
+    # Linhas só em x (a2 = 0) valem para a coluna inteira
+    flat = ~(up | down)
+    column_ok = np.all(A[flat, :1] * xs[None, :] <= b[flat, None] + TOL * (1.0 + np.abs(b[flat, None])), axis=0)
+    counts = np.where(column_ok, np.maximum(y_hi - y_lo + 1, 0), 0).astype(np.int64)
+    x = np.repeat(xs, counts)
+    y = np.repeat(y_lo, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+    return np.column_stack([x, y]).astype(np.int64)
+
+
+def model_system(model, fixed=None):
+    """Sistema 2D A x <= b de um LinearModel ou pulp.LpProblem, com limites.
+
+    `fixed` ({nome ou índice: valor}) fixa as variáveis fora do gráfico; sem
+    ele, as variáveis após as duas primeiras ficam em 0. Retorna (A, b, nomes
+    das 2 variáveis livres).
+    """
+    if not hasattr(model, 'A'):
+        from .models import from_pulp
+
+        model = from_pulp(model)
+    n = len(model.variables)
+    values = np.zeros(n)
+    keep = np.ones(n, dtype=bool)
+    if fixed is None:
+        keep[2:] = False
+    for key, value in (fixed or {}).items():
+        j = model.variables.index(key) if isinstance(key, str) else key
+        values[j], keep[j] = value, False
+    if keep.sum() != 2:
+        raise ValueError(f"{model.name}: o corte 2D deveria deixar 2 variáveis livres, não {keep.sum()}")
+    A, b = as_upper_system(model.A, model.b, model.senses)
+    eye = np.eye(n)
+    low, high = np.isfinite(model.lower) & keep, np.isfinite(model.upper) & keep
+    A = np.vstack([A, -eye[low], eye[high]])
+    b = np.concatenate([b, -model.lower[low], model.upper[high]])
+    b = b - A[:, ~keep] @ values[~keep]
+    return A[:, keep], b, tuple(np.asarray(model.variables)[keep].tolist())
+
+
+def draw_model_region(ax, model, box=None, fixed=None, **style):
+    """Desenha a região factível de um LinearModel ou pulp.LpProblem.
+
+    Os limites das variáveis (lowBound/upBound) entram como semiplanos; com 3+
+    variáveis desenha o corte de `model_system` (demais variáveis em 0).
+    """
+    A, b, _ = model_system(model, fixed)
+    return draw_region(ax, A, b, nonnegative=False, box=box, **style)
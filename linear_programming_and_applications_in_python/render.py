@@ -0,0 +1,367 @@
+import argparse  # Interface de linha de comando
+import contextlib
+import hashlib  # Hash do modelo + especificação (chave do cache de figuras)
+import json
+import os
+import re
+import runpy  # Execução dos scripts dos exercícios dentro do worker
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor  # Renderização paralela
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .batch import DEFAULT_FOLDERS, ROOT, discover_models
+from .models import parse_model
+
+# =============================================================================
+# RENDERIZAÇÃO DAS FIGURAS SEM INTERFACE GRÁFICA, EM PARALELO E COM CACHE
+# -----------------------------------------------------------------------------
+# Os scripts terminam com plt.savefig(..., dpi=300) seguido de plt.show(), e a
+# renderização é a parte mais lenta de uma execução. Aqui as figuras viram
+# especificações desenhadas num pool de processos com o backend Agg (sem
+# janela), de dois tipos:
+#
+#   ScriptSpec -> a figura do próprio script (exercises/, prova-01 a 04): o
+#                 script roda inteiro com plt.show() desligado e o
+#                 plt.savefig dele (mesmo dpi e opções) grava em
+#                 figures/scripts/<pasta>/<script>.png, no lugar do caminho
+#                 fixo do Windows escrito no script;
+#   FigureSpec -> uma figura genérica (região + ótimo) de cada arquivo de
+#                 modelo .toml, em figures/<pasta>/<modelo>.png.
+#
+# Uma figura só é redesenhada quando o conteúdo do script ou do modelo (e a
+# especificação) mudam: o hash SHA-256 fica registrado num manifesto ao lado
+# das imagens geradas. Mudanças na biblioteca de desenho entram pelo
+# RENDER_VERSION.
+#
+# Cada .toml pode ter uma tabela [plot] opcional:
+#   [plot]
+#   title = "Exemplo 04 – Região Factível"
+#   limits = [[0, 30], [0, 30]]
+#   dpi = 300
+#
+# Uso:
+#   python -m linear_programming_and_applications_in_python.render
+#   python -m linear_programming_and_applications_in_python.render prova-02 -j 4
+#   python -m linear_programming_and_applications_in_python.render --force
+#   python -m linear_programming_and_applications_in_python.render --kind scripts prova-04
+# =============================================================================
+
+OUTPUT_DIR = ROOT / 'figures'
+SCRIPT_FOLDERS = (*DEFAULT_FOLDERS, 'prova-03', 'prova-04')
+MANIFEST = '.render-cache.json'
+RENDER_VERSION = 3  # incrementar quando o desenho mudar (invalida o cache)
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    """O que desenhar e onde salvar; tudo o que muda a imagem entra no hash."""
+    source: str                  # arquivo .toml do modelo
+    output: str                  # arquivo .png gerado
+    title: str = ''
+    limits: tuple = None         # ((xmin, xmax), (ymin, ymax)[, (zmin, zmax)])
+    dpi: int = 300
+    figsize: tuple = (8, 6)
+
+    def key(self):
+        """Hash do conteúdo do modelo e da especificação (sem o destino)."""
+        spec = asdict(self)
+        del spec['source'], spec['output']
+        digest = hashlib.sha256(Path(self.source).read_bytes())
+        digest.update(json.dumps([spec, RENDER_VERSION], sort_keys=True).encode())
+        return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ScriptSpec:
+    """Script que salva a própria figura; roda sem janela e grava em `output`."""
+    source: str                  # script .py
+    output: str                  # arquivo .png gerado
+    depends: tuple = ()          # arquivos .toml que o script carrega
+
+    def key(self):
+        """Hash do script, dos modelos que ele carrega e da versão do desenho."""
+        digest = hashlib.sha256()
+        for path in (self.source, *self.depends):
+            digest.update(Path(path).read_bytes())
+        digest.update(json.dumps(['script', RENDER_VERSION]).encode())
+        return digest.hexdigest()
+
+
+def _tuple(value):
+    if isinstance(value, list):
+        return tuple(_tuple(v) for v in value)
+    return value
+
+
+def collect_specs(folders=DEFAULT_FOLDERS, root=ROOT, output_dir=OUTPUT_DIR):
+    """Uma FigureSpec por modelo de 2 ou 3 variáveis das pastas indicadas."""
+    specs = []
+    for path in discover_models(folders, root):
+        with open(path, 'rb') as fh:
+            data = tomllib.load(fh)
+        if len(data['variables']['names']) not in (2, 3):
+            continue  # sem representação geométrica direta
+        plot = data.get('plot', {})
+        try:
+            relative = path.resolve().relative_to(Path(root).resolve())
+        except ValueError:
+            relative = Path(path.name)
+        specs.append(FigureSpec(
+            source=str(path),
+            output=str(Path(output_dir) / relative.with_suffix('.png')),
+            title=plot.get('title', data.get('name', path.stem)),
+            limits=_tuple(plot.get('limits')),
+            dpi=plot.get('dpi', 300),
+            figsize=_tuple(plot.get('figsize', [8, 6])),
+        ))
+    return specs
+
+
+def _script_depends(path, root):
+    # Arquivos .toml citados no script: ao lado dele ou, se não, em outra pasta
+    # do repositório (exercícios repetidos da prova-02 leem o de exercises/)
+    depends = []
+    for name in sorted(set(re.findall(r"['\"]([\w.-]+\.toml)['\"]", path.read_text(encoding='utf-8')))):
+        sibling = path.with_name(name)
+        found = [sibling] if sibling.exists() else sorted(Path(root).rglob(name))[:1]
+        depends.extend(str(p) for p in found)
+    return tuple(depends)
+
+
+def collect_scripts(folders=SCRIPT_FOLDERS, root=ROOT, output_dir=OUTPUT_DIR):
+    """Uma ScriptSpec por script das pastas indicadas que salva figura (savefig)."""
+    specs = []
+    for folder in folders:
+        base = Path(folder) if Path(folder).is_absolute() else Path(root) / folder
+        for path in ([base] if base.is_file() else sorted(base.rglob('*.py'))):
+            if path.suffix != '.py' or '.savefig(' not in path.read_text(encoding='utf-8'):
+                continue
+            try:
+                relative = path.resolve().relative_to(Path(root).resolve())
+            except ValueError:
+                relative = Path(path.name)
+            specs.append(ScriptSpec(
+                source=str(path),
+                output=str(Path(output_dir) / 'scripts' / relative.with_suffix('.png')),
+                depends=_script_depends(path, root),
+            ))
+    return specs
+
+
+def _bounded_system(model, limits):
+    # A x <= b do modelo com limites das variáveis e a caixa de desenho
+    from .sampling import as_upper_system
+
+    A, b = as_upper_system(model.A, model.b, model.senses)
+    n = len(model.variables)
+    eye = np.eye(n)
+    lower = np.where(np.isneginf(model.lower), [lo for lo, _ in limits], model.lower)
+    upper = np.minimum(model.upper, [hi for _, hi in limits])
+    return np.vstack([A, -eye, eye]), np.concatenate([b, -lower, upper])
+
+
+def _default_limits(model):
+    # Caixa que contém os vértices da região (ou o ótimo, se ela for ilimitada)
+    from .vertices import polytope
+
+    n = len(model.variables)
+    region = polytope(model.A, model.b, model.senses, nonnegative=bool(np.all(model.lower >= 0)))
+    points = region.vertices if len(region.vertices) else np.zeros((1, n))
+    top = np.maximum(points.max(axis=0), 0.0)
+    bottom = np.minimum(points.min(axis=0), 0.0)
+    span = np.maximum(top - bottom, 1.0)
+    return tuple((float(lo), float(hi)) for lo, hi in zip(bottom, top + 0.2 * span))
+
+
+def _optimum(model):
+    backend = 'cbc' if model.integer.any() else 'revised'
+    solution = model.solve(backend)
+    return solution.x if solution.status == 'Optimal' else None
+
+
+def render_spec(spec):
+    """Desenha uma figura com o backend Agg; retorna o tempo gasto (s)."""
+    import matplotlib
+
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    from .hull import draw_hull
+    from .regions import draw_region
+
+    start = time.perf_counter()
+    model = parse_model(tomllib.loads(Path(spec.source).read_text(encoding='utf-8')))
+    limits = spec.limits or _default_limits(model)
+    A, b = _bounded_system(model, limits)
+    x = _optimum(model)
+    names = model.variables
+
+    fig = plt.figure(figsize=spec.figsize)
+    if len(names) == 2:
+        ax = fig.add_subplot()
+        draw_region(ax, A, b, nonnegative=False, box=(*limits[0], *limits[1]), label='Região factível')
+        t = np.linspace(*limits[0], 2)
+        rows = zip(model.constraint_names, model.A, model.b)
+        for i, (name, (a1, a2), rhs) in enumerate(rows):
+            if abs(a2) > 1e-12:
+                ax.plot(t, (rhs - a1 * t) / a2, '--', color=f"C{i}", label=name)
+            elif abs(a1) > 1e-12:
+                ax.axvline(rhs / a1, linestyle='--', color=f"C{i}", label=name)
+        if x is not None:
+            ax.scatter(*x, color='black', zorder=5, label=f"Ótimo ({x[0]:.4g}, {x[1]:.4g})")
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        ax.grid(True)
+    else:
+        ax = fig.add_subplot(projection='3d')
+        draw_hull(ax, A, b, nonnegative=False, label='Região factível')
+        if x is not None:
+            ax.scatter(*x, color='black', s=40, label=f"Ótimo ({x[0]:.4g}, {x[1]:.4g}, {x[2]:.4g})")
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        ax.set_zlim(*limits[2])
+        ax.set_zlabel(names[2])
+    ax.set_xlabel(names[0])
+    ax.set_ylabel(names[1])
+    ax.set_title(spec.title)
+    ax.legend()
+
+    Path(spec.output).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(spec.output, dpi=spec.dpi)
+    plt.close(fig)
+    return time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def _silenced():
+    # Os scripts imprimem resultados e o CBC escreve direto no descritor 1
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, 'w') as devnull:
+        os.dup2(devnull.fileno(), 1)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                yield
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved, 1)
+            os.close(saved)
+
+
+def render_script(spec):
+    """Roda o script com o backend Agg; retorna o tempo gasto (s).
+
+    plt.show() não faz nada e cada savefig do script grava em `spec.output`
+    (o segundo em <nome>_2.png, e assim por diante), com os argumentos que o
+    script passou (dpi, bbox_inches, ...).
+    """
+    import matplotlib
+
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+
+    start = time.perf_counter()
+    target = Path(spec.output)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    saved = []
+    original_savefig, original_show = Figure.savefig, plt.show
+
+    def savefig(fig, fname, *args, **kwargs):
+        path = target if not saved else target.with_name(f"{target.stem}_{len(saved) + 1}{target.suffix}")
+        saved.append(path)
+        return original_savefig(fig, path, *args, **kwargs)
+
+    cwd = os.getcwd()
+    Figure.savefig, plt.show = savefig, lambda *args, **kwargs: None
+    try:
+        os.chdir(Path(spec.source).parent)
+        with _silenced():
+            runpy.run_path(spec.source, run_name='__main__')
+    finally:
+        os.chdir(cwd)
+        Figure.savefig, plt.show = original_savefig, original_show
+        plt.close('all')
+    if not saved:
+        raise RuntimeError(f"{spec.source}: o script não salvou nenhuma figura")
+    return time.perf_counter() - start
+
+
+def _render(spec):
+    return (render_script if isinstance(spec, ScriptSpec) else render_spec)(spec)
+
+
+def _load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {}
+
+
+def render_all(specs, jobs=None, output_dir=OUTPUT_DIR, force=False):
+    """Renderiza as figuras pendentes; retorna uma linha por especificação."""
+    specs = list(specs)
+    manifest = _load_manifest(output_dir)
+    keys = [spec.key() for spec in specs]
+    pending = [
+        (spec, key) for spec, key in zip(specs, keys)
+        if force or manifest.get(spec.output) != key or not Path(spec.output).exists()
+    ]
+
+    jobs = jobs or os.cpu_count() or 1
+    todo = [spec for spec, _ in pending]
+    if jobs == 1 or len(todo) <= 1:
+        seconds = [_render(spec) for spec in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            seconds = list(pool.map(_render, todo))
+
+    for spec, key in pending:
+        manifest[spec.output] = key
+    if pending:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        (Path(output_dir) / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
+    rendered = {spec.output: s for spec, s in zip(todo, seconds)}
+    return [
+        {'output': spec.output, 'status': 'renderizada' if spec.output in rendered else 'em cache',
+         'seconds': rendered.get(spec.output, 0.0)}
+        for spec in specs
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza as figuras dos modelos sem interface gráfica.")
+    parser.add_argument('folders', nargs='*', default=None,
+                        help="pastas (ou arquivos .py/.toml) a desenhar")
+    parser.add_argument('-k', '--kind', choices=('all', 'scripts', 'models'), default='all',
+                        help="figuras dos scripts, dos modelos .toml ou ambas (padrão)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="número de processos (padrão: núcleos disponíveis)")
+    parser.add_argument('-o', '--output', default=str(OUTPUT_DIR),
+                        help="pasta das imagens geradas (padrão: figures/)")
+    parser.add_argument('--force', action='store_true',
+                        help="ignora o cache e redesenha tudo")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    specs = []
+    if args.kind in ('all', 'scripts'):
+        specs += collect_scripts(args.folders or SCRIPT_FOLDERS, output_dir=args.output)
+    if args.kind in ('all', 'models'):
+        specs += collect_specs(args.folders or DEFAULT_FOLDERS, output_dir=args.output)
+    results = render_all(specs, jobs=args.jobs, output_dir=args.output, force=args.force)
+    for r in results:
+        print(f"{r['status']:<12} {r['seconds']:6.2f} s  {r['output']}")
+    fresh = sum(r['status'] == 'renderizada' for r in results)
+    print(f"\n{fresh} de {len(results)} figuras renderizadas em {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
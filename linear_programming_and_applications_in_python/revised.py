@@ -0,0 +1,287 @@
+from dataclasses import dataclass, field  # Estruturas do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .simplex import TOL, unit_basis
+
+# =============================================================================
+# SIMPLEX REVISADO COM BASE FATORADA (LU + ATUALIZAÇÕES ETA)
+# -----------------------------------------------------------------------------
+# O simplex em tableau (simplex.py) atualiza a matriz inteira a cada pivô. O
+# simplex revisado guarda apenas a base B e resolve, a cada iteração, dois
+# sistemas com ela:
+#
+#   BTRAN:  B^T y = c_B       (multiplicadores -> custos reduzidos)
+#   FTRAN:  B w = A_s         (coluna que entra -> teste da razão)
+#
+# B é fatorada uma vez como P B = L U (eliminação de Gauss com pivoteamento
+# parcial). Cada troca de base é registrada como uma matriz eta (forma produto
+# da inversa), sem refatorar; a cada `refactor_every` pivôs a fatoração é
+# refeita do zero para conter o acúmulo de erros numéricos.
+#
+# Trabalha sobre a forma padrão de simplex.standard_form:
+#   min c @ z   sujeito a   A z = b,  z >= 0
+#
+# Partindo de uma base anterior, usa o simplex primal (se a base continua
+# primal factível) ou o simplex dual (se continua dual factível, como ocorre
+# quando só o lado direito b muda).
+# =============================================================================
+
+
+def lu_factor(B):
+    """Fatoração P B = L U com pivoteamento parcial; retorna (LU, perm)."""
+    LU = np.array(B, dtype=float)
+    m = LU.shape[0]
+    perm = np.arange(m)
+    for k in range(m - 1):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        if LU[p, k] == 0.0:
+            raise np.linalg.LinAlgError("base singular")
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    if m and LU[m - 1, m - 1] == 0.0:
+        raise np.linalg.LinAlgError("base singular")
+    return LU, perm
+
+
+def lu_solve(LU, perm, rhs):
+    """Resolve B x = rhs a partir de lu_factor."""
+    x = np.asarray(rhs, dtype=float)[perm]
+    m = len(x)
+    for i in range(1, m):
+        x[i] -= LU[i, :i] @ x[:i]
+    for i in range(m - 1, -1, -1):
+        x[i] = (x[i] - LU[i, i + 1:] @ x[i + 1:]) / LU[i, i]
+    return x
+
+
+def lu_solve_transpose(LU, perm, rhs):
+    """Resolve B^T y = rhs a partir de lu_factor."""
+    y = np.array(rhs, dtype=float)
+    m = len(y)
+    for i in range(m):
+        y[i] = (y[i] - LU[:i, i] @ y[:i]) / LU[i, i]
+    for i in range(m - 2, -1, -1):
+        y[i] -= LU[i + 1:, i] @ y[i + 1:]
+    out = np.empty(m)
+    out[perm] = y
+    return out
+
+
+class BasisFactor:
+    """Base B fatorada em LU com arquivo de etas (forma produto da inversa)."""
+
+    def __init__(self, A, basis, refactor_every=64):
+        self.A = A
+        self.refactor_every = refactor_every
+        self.refactorizations = 0
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        self.LU, self.perm = lu_factor(self.A[:, basis])
+        self.etas = []
+        self.refactorizations += 1
+
+    def ftran(self, rhs):
+        x = lu_solve(self.LU, self.perm, rhs)
+        for r, w in self.etas:
+            x_r = x[r] / w[r]
+            x -= x_r * w
+            x[r] = x_r
+        return x
+
+    def btran(self, rhs):
+        y = np.array(rhs, dtype=float)
+        for r, w in reversed(self.etas):
+            y[r] = (y[r] - w @ y + w[r] * y[r]) / w[r]
+        return lu_solve_transpose(self.LU, self.perm, y)
+
+    def update(self, r, w, basis):
+        """Registra a troca da r-ésima coluna básica (w = B^-1 A_s)."""
+        if len(self.etas) >= self.refactor_every:
+            self.refactor(basis)
+        else:
+            self.etas.append((r, w))
+
+
+@dataclass
+class SimplexResult:
+    """Resultado do simplex revisado (na forma padrão)."""
+    status: str
+    z: np.ndarray
+    basis: np.ndarray
+    y: np.ndarray = None            # multiplicadores simplex (duais) finais
+    iterations: int = 0
+    phase1_iterations: int = 0
+    pivots: list = field(default_factory=list)   # (entra, sai) por iteração
+    refactorizations: int = 0
+
+
+def _primal_loop(A, c, factor, basis, x_B, allowed, max_iter, tol, pivots):
+    # Iterações do simplex primal; altera basis/x_B/factor em uso. Regra de
+    # Dantzig (custo reduzido mais negativo); empates no teste da razão ficam
+    # com a variável básica de menor índice. Não é a regra de Bland completa
+    # (a coluna que entra não é a de menor índice), então a ciclagem em
+    # problemas degenerados é evitada só por `max_iter`.
+    m = len(basis)
+    for iteration in range(max_iter):
+        y = factor.btran(c[basis])
+        d = c - y @ A
+        d[~allowed] = 0.0
+        d[basis] = 0.0
+        s = int(np.argmin(d))
+        if d[s] >= -tol:
+            return 'Optimal', iteration, y
+        w = factor.ftran(A[:, s])
+        positive = w > tol
+        if not positive.any():
+            return 'Unbounded', iteration, y
+        ratios = np.full(m, np.inf)
+        ratios[positive] = x_B[positive] / w[positive]
+        theta = ratios.min()
+        ties = np.flatnonzero(ratios <= theta + tol * (1.0 + abs(theta)))
+        r = int(ties[np.argmin(basis[ties])])  # empates: menor índice básico
+
+        x_B -= theta * w
+        x_B[r] = theta
+        pivots.append((s, int(basis[r])))
+        basis[r] = s
+        factor.update(r, w, basis)
+    return 'Not Solved', max_iter, None
+
+
+def _dual_loop(A, c, factor, basis, x_B, max_iter, tol, pivots):
+    # Simplex dual: parte de uma base dual factível (custos reduzidos >= 0) e
+    # elimina as infactibilidades primais (x_B < 0) uma a uma. É o reinício
+    # natural quando só o lado direito b mudou.
+    m, N = A.shape
+    e = np.eye(m)
+    for iteration in range(max_iter):
+        r = int(np.argmin(x_B))
+        if x_B[r] >= -tol * (1.0 + np.abs(x_B).max()):
+            return 'Optimal', iteration
+        y = factor.btran(c[basis])
+        d = c - y @ A
+        alpha = factor.btran(e[r]) @ A
+        alpha[basis] = 0.0
+        candidates = alpha < -tol
+        if not candidates.any():
+            return 'Infeasible', iteration
+        ratios = np.full(N, np.inf)
+        ratios[candidates] = np.maximum(d[candidates], 0.0) / -alpha[candidates]
+        s = int(np.argmin(ratios))  # empates: menor índice (sem garantia anticiclagem)
+
+        w = factor.ftran(A[:, s])
+        theta = x_B[r] / w[r]
+        x_B -= theta * w
+        x_B[r] = theta
+        pivots.append((s, int(basis[r])))
+        basis[r] = s
+        factor.update(r, w, basis)
+    return 'Not Solved', max_iter
+
+
+def revised_simplex(c, A, b, basis=None, max_iter=10_000, tol=TOL, refactor_every=64):
+    """Simplex revisado de duas fases: min c @ z, A z = b, z >= 0.
+
+    `basis` (opcional) é uma base inicial, por exemplo a base ótima de um
+    problema parecido. Se ela for primal factível, a fase 1 é dispensada; se
+    for apenas dual factível (caso típico quando só b mudou), o simplex dual
+    parte dela. Caso contrário, resolve do zero (linhas com b < 0 têm o sinal
+    trocado antes da fase 1).
+    """
+    A = np.asarray(A, dtype=float)
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, N = A.shape
+    pivots = []
+
+    if basis is not None and len(basis) == m and np.all(np.asarray(basis) < N):
+        basis = np.array(basis, dtype=np.intp)
+        try:
+            factor = BasisFactor(A, basis, refactor_every)
+            x_B = factor.ftran(b)
+        except np.linalg.LinAlgError:
+            factor = None
+        if factor is not None:
+            scale = 1.0 + np.abs(b).max(initial=0.0)
+            y = factor.btran(c[basis])
+            d = c - y @ A
+            if np.all(x_B >= -tol * scale):
+                x_B = np.maximum(x_B, 0.0)
+                status, iterations, y = _primal_loop(
+                    A, c, factor, basis, x_B, np.ones(N, bool), max_iter, tol, pivots)
+                return _result(status, N, basis, x_B, y, iterations, 0, pivots, factor)
+            if np.all(d >= -tol * (1.0 + np.abs(c).max(initial=0.0))):
+                status, iterations = _dual_loop(A, c, factor, basis, x_B, max_iter, tol, pivots)
+                y = None
+                if status == 'Optimal':
+                    # Limpeza: garante custos reduzidos >= 0 após os pivôs duais
+                    x_B = np.maximum(x_B, 0.0)
+                    status, more, y = _primal_loop(
+                        A, c, factor, basis, x_B, np.ones(N, bool), max_iter, tol, pivots)
+                    iterations += more
+                return _result(status, N, basis, x_B, y, iterations, 0, pivots, factor)
+    if np.any(b < 0):
+        flip = np.where(b < 0, -1.0, 1.0)
+        A, b = A * flip[:, None], b * flip
+        result = revised_simplex(c, A, b, max_iter=max_iter, tol=tol, refactor_every=refactor_every)
+        if result.y is not None:
+            result.y = result.y * flip
+        return result
+
+    # Base inicial: colunas unitárias + artificiais nas linhas restantes
+    basis = unit_basis(A)
+    missing = np.flatnonzero(basis < 0)
+    n_art = len(missing)
+    A_ext = A
+    if n_art:
+        art = np.zeros((m, n_art))
+        art[missing, np.arange(n_art)] = 1.0
+        A_ext = np.hstack([A, art])
+        basis[missing] = N + np.arange(n_art)
+    factor = BasisFactor(A_ext, basis, refactor_every)
+    x_B = b.astype(float).copy()
+
+    phase1 = 0
+    if n_art:
+        # Fase 1: minimizar a soma das artificiais
+        c1 = np.zeros(N + n_art)
+        c1[N:] = 1.0
+        status, phase1, _ = _primal_loop(
+            A_ext, c1, factor, basis, x_B, np.ones(N + n_art, bool), max_iter, tol, pivots)
+        if c1[basis] @ x_B > tol * (1.0 + np.abs(b).max(initial=0.0)):
+            return _result('Infeasible', N, basis, x_B, None, phase1, phase1, pivots, factor)
+
+        # Artificiais que ficaram na base (em nível zero) saem por pivôs
+        # degenerados; se a linha for redundante, a artificial fica presa em
+        # zero e nunca volta a entrar.
+        for r in np.flatnonzero(basis >= N):
+            rho = factor.btran(np.eye(m)[r])
+            alpha = rho @ A
+            alpha[basis[basis < N]] = 0.0
+            candidates = np.flatnonzero(np.abs(alpha) > tol)
+            if len(candidates):
+                s = int(candidates[0])
+                w = factor.ftran(A_ext[:, s])
+                pivots.append((s, int(basis[r])))
+                basis[r] = s
+                factor.update(r, w, basis)
+
+    c2 = np.concatenate([c, np.zeros(n_art)])
+    allowed = np.concatenate([np.ones(N, bool), np.zeros(n_art, bool)])
+    status, phase2, y = _primal_loop(A_ext, c2, factor, basis, x_B, allowed, max_iter, tol, pivots)
+    return _result(status, N, basis, x_B, y, phase1 + phase2, phase1, pivots, factor)
+
+
+def _result(status, N, basis, x_B, y, iterations, phase1, pivots, factor):
+    z = np.zeros(N)
+    real = basis < N
+    z[basis[real]] = x_B[real]
+    return SimplexResult(
+        status=status, z=z, basis=basis.copy(), y=y, iterations=iterations,
+        phase1_iterations=phase1, pivots=pivots, refactorizations=factor.refactorizations,
+    )
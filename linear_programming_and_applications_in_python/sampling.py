@@ -0,0 +1,126 @@
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+# =============================================================================
+# AMOSTRAGEM VETORIZADA DA REGIÃO FACTÍVEL
+# -----------------------------------------------------------------------------
+# Os scripts 3D (Exercise2, 4, 5, 6 e 7) varriam a região factível com três
+# laços aninhados em Python, testando restrição por restrição em cada ponto.
+# Aqui o mesmo teste A @ x <= b é feito em lote com NumPy:
+#
+#   - os eixos iniciais formam uma malha avaliada por blocos (chunks), de modo
+#     que a memória fica limitada a `chunk_size` linhas por vez;
+#   - para cada linha da malha, o último eixo não precisa ser varrido ponto a
+#     ponto: como a região é convexa, os valores factíveis do último eixo
+#     formam um intervalo contíguo, localizado com np.searchsorted.
+#
+# O resultado é o mesmo conjunto de pontos que os laços produziam, na mesma
+# ordem (eixos em ordem crescente), já como array NumPy de shape (k, n).
+# =============================================================================
+
+
+def as_upper_system(A, b, senses=None):
+    """Converte um sistema com sentidos mistos para a forma A x <= b.
+
+    `senses` é uma sequência com '<=', '>=' ou '=' por linha (padrão: todas
+    '<='). Linhas '>=' são multiplicadas por -1 e linhas '=' viram o par
+    (<=, >=).
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float).ravel()
+    if senses is None:
+        return A, b
+
+    rows, rhs = [], []
+    for a_row, b_i, sense in zip(A, b, senses):
+        if sense in ('<=', 'L'):
+            rows.append(a_row)
+            rhs.append(b_i)
+        elif sense in ('>=', 'G'):
+            rows.append(-a_row)
+            rhs.append(-b_i)
+        elif sense in ('=', '==', 'E'):
+            rows.extend([a_row, -a_row])
+            rhs.extend([b_i, -b_i])
+        else:
+            raise ValueError(f"Sentido de restrição desconhecido: {sense!r}")
+    return np.array(rows, dtype=float).reshape(-1, A.shape[1]), np.array(rhs, dtype=float)
+
+
+def feasible_grid(A, b, ranges, senses=None, chunk_size=65_536):
+    """Retorna os pontos da malha `ranges` que satisfazem A x <= b.
+
+    Parâmetros
+    ----------
+    A, b : matriz (m, n) e vetor (m,) das restrições.
+    ranges : sequência com n vetores 1D (um por eixo), como os `np.arange`
+        usados nos scripts.
+    senses : sentidos opcionais por linha ('<=', '>=', '=').
+    chunk_size : número máximo de combinações dos eixos iniciais avaliadas
+        por bloco; controla o pico de memória.
+
+    Retorna um array (k, n) com os pontos factíveis.
+    """
+    A, b = as_upper_system(A, b, senses)
+    axes = [np.asarray(r, dtype=float).ravel() for r in ranges]
+    n = len(axes)
+    if A.shape[1] != n:
+        raise ValueError(f"A tem {A.shape[1]} colunas, mas foram dados {n} eixos")
+    if any(axis.size == 0 for axis in axes):
+        return np.empty((0, n))
+
+    # O último eixo é resolvido por intervalo; ordená-lo permite o searchsorted.
+    # Para os `np.arange` dos scripts a ordem já é crescente e nada muda.
+    last = axes[-1]
+    order = np.argsort(last, kind='stable')
+    last_sorted = last[order]
+
+    a_last = A[:, -1]
+    pos, neg, zero = a_last > 0, a_last < 0, a_last == 0
+
+    lead_axes = axes[:-1]
+    lead_shape = tuple(axis.size for axis in lead_axes)
+    lead_total = int(np.prod(lead_shape)) if lead_axes else 1
+
+    blocks = []
+    for start in range(0, lead_total, chunk_size):
+        stop = min(start + chunk_size, lead_total)
+
+        # Coordenadas dos eixos iniciais deste bloco, shape (k, n-1)
+        if lead_axes:
+            idx = np.unravel_index(np.arange(start, stop), lead_shape)
+            lead = np.column_stack([axis[i] for axis, i in zip(lead_axes, idx)])
+        else:
+            lead = np.empty((1, 0))
+
+        # Folga de cada restrição descontada a parte dos eixos iniciais: (k, m)
+        slack = b - lead @ A[:, :-1].T
+
+        # Intervalo [low, high] do último eixo em que todas as linhas valem
+        high = np.full(len(lead), np.inf)
+        low = np.full(len(lead), -np.inf)
+        if pos.any():
+            high = np.min(slack[:, pos] / a_last[pos], axis=1)
+        if neg.any():
+            low = np.max(slack[:, neg] / a_last[neg], axis=1)
+        ok = np.all(slack[:, zero] >= 0, axis=1) if zero.any() else np.ones(len(lead), bool)
+
+        first = np.searchsorted(last_sorted, low, side='left')
+        end = np.searchsorted(last_sorted, high, side='right')
+        counts = np.where(ok, np.maximum(end - first, 0), 0)
+
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        # Expande cada linha pelos seus `counts` valores do último eixo
+        rows = np.repeat(np.arange(len(lead)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        last_idx = order[first[rows] + offsets]
+        block = np.empty((total, n))
+        block[:, :-1] = lead[rows]
+        block[:, -1] = last[last_idx]
+        blocks.append(block)
+
+    if not blocks:
+        return np.empty((0, n))
+    return np.concatenate(blocks)
@@ -0,0 +1,196 @@
+from dataclasses import dataclass  # Estruturas do relatório
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .revised import BasisFactor, revised_simplex
+from .simplex import TOL, unit_basis
+
+# =============================================================================
+# ANÁLISE DE SENSIBILIDADE A PARTIR DA BASE ÓTIMA
+# -----------------------------------------------------------------------------
+# Tudo sai de uma única resolução: com a base ótima B da forma padrão,
+#
+#   preço-sombra da linha i   -> y = B^-T c_B  (com o sinal e o sentido do modelo)
+#   custo reduzido da coluna j -> d_j = c_j - y @ A_j
+#   faixa do lado direito      -> maior passo em b_i com B^-1 b >= 0
+#   faixa do custo c_j         -> maior passo em c_j com custos reduzidos >= 0
+#
+# Dentro das faixas a base não muda: o preço-sombra vale para qualquer valor
+# de b_i em [b_i - diminuição, b_i + aumento], sem resolver de novo.
+#
+# Exemplo:
+#   model = load_model('exercises/Exercise7.toml')
+#   print(sensitivity(model).format())
+# =============================================================================
+
+
+@dataclass
+class ConstraintRange:
+    """Linha do relatório para uma restrição do modelo."""
+    name: str
+    activity: float       # valor de A_i x no ótimo
+    rhs: float
+    slack: float          # b_i - A_i x (negativo para '>=' com excesso)
+    shadow_price: float   # variação do objetivo por unidade de aumento em b_i
+    increase: float       # aumento permitido em b_i sem trocar a base
+    decrease: float       # diminuição permitida em b_i sem trocar a base
+
+
+@dataclass
+class VariableRange:
+    """Linha do relatório para uma variável do modelo."""
+    name: str
+    value: float
+    cost: float
+    reduced_cost: float   # variação do objetivo por unidade de aumento em x_j
+    increase: float       # aumento permitido em c_j sem trocar a base
+    decrease: float       # diminuição permitida em c_j sem trocar a base
+
+
+@dataclass
+class SensitivityReport:
+    """Relatório de sensibilidade de um modelo contínuo."""
+    model: str
+    objective: float
+    constraints: list
+    variables: list
+
+    def constraint(self, name):
+        return next(r for r in self.constraints if r.name == name)
+
+    def variable(self, name):
+        return next(r for r in self.variables if r.name == name)
+
+    @property
+    def shadow_prices(self):
+        return {r.name: r.shadow_price for r in self.constraints}
+
+    @property
+    def reduced_costs(self):
+        return {r.name: r.reduced_cost for r in self.variables}
+
+    def format(self):
+        """Monta as duas tabelas do relatório em texto."""
+        lines = [f"{self.model}: objetivo = {_fmt(self.objective)}", '']
+        lines += _table(
+            ('Restrição', 'Atividade', 'RHS', 'Folga', 'Preço-sombra', 'Aumento', 'Diminuição'),
+            [(r.name, r.activity, r.rhs, r.slack, r.shadow_price, r.increase, r.decrease)
+             for r in self.constraints],
+        )
+        lines.append('')
+        lines += _table(
+            ('Variável', 'Valor', 'Custo', 'Custo reduzido', 'Aumento', 'Diminuição'),
+            [(r.name, r.value, r.cost, r.reduced_cost, r.increase, r.decrease)
+             for r in self.variables],
+        )
+        return '\n'.join(lines)
+
+
+def _fmt(value):
+    if isinstance(value, str):
+        return value
+    if np.isinf(value):
+        return 'inf'
+    return f"{value:.6g}"
+
+
+def _table(header, rows):
+    rows = [tuple(_fmt(v) for v in row) for row in rows]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    lines = ['  '.join(h.ljust(w) for h, w in zip(header, widths))]
+    lines.append('-' * len(lines[0]))
+    lines += ['  '.join(c.ljust(w) for c, w in zip(row, widths)) for row in rows]
+    return lines
+
+
+def _step(base, direction, tol):
+    # Maiores passos t >= 0 para cima e para baixo com base + t*direction >= 0
+    # (no sentido oposto, base - t*direction >= 0)
+    down = direction < -tol
+    up = direction > tol
+    increase = np.min(base[down] / -direction[down]) if down.any() else np.inf
+    decrease = np.min(base[up] / direction[up]) if up.any() else np.inf
+    return max(float(increase), 0.0), max(float(decrease), 0.0)
+
+
+def sensitivity(model, basis=None, tol=TOL):
+    """Relatório de sensibilidade a partir da base ótima do modelo.
+
+    `basis` é a base ótima da forma padrão (por exemplo
+    model.solve('revised').extra['basis']); se omitida, o modelo é resolvido
+    pelo simplex revisado.
+    """
+    if np.any(model.integer):
+        raise ValueError(f"{model.name}: a análise de sensibilidade exige um modelo contínuo")
+    sf = model.standard
+    m, N = sf.A.shape
+    if basis is None:
+        result = revised_simplex(sf.c, sf.A, sf.b)
+        if result.status != 'Optimal':
+            raise ValueError(f"{model.name}: sem solução ótima ({result.status})")
+        basis = result.basis
+    basis = np.asarray(basis, dtype=np.intp)
+
+    # Artificiais presas na base (linhas redundantes) voltam como colunas
+    # unitárias, na mesma ordem usada por revised_simplex
+    A = sf.A
+    if np.any(basis >= N):
+        missing = np.flatnonzero(unit_basis(sf.A) < 0)
+        art = np.zeros((m, len(missing)))
+        art[missing, np.arange(len(missing))] = 1.0
+        A = np.hstack([sf.A, art])
+    c = np.concatenate([sf.c, np.zeros(A.shape[1] - N)])
+
+    factor = BasisFactor(A, basis)
+    x_B = factor.ftran(sf.b)
+    y = factor.btran(c[basis])
+    d = c - y @ A
+    nonbasic = np.ones(A.shape[1], dtype=bool)
+    nonbasic[basis] = False
+    nonbasic[N:] = False  # artificiais nunca voltam a entrar
+
+    z = np.zeros(A.shape[1])
+    z[basis] = x_B
+    z = z[:N]
+    x = sf.recover(z)
+    activity = np.asarray(model.A) @ x
+
+    constraints = []
+    for i, name in enumerate(model.constraint_names):
+        # b_i do modelo -> row_sign_i * b_i na forma padrão
+        increase, decrease = _step(x_B, factor.ftran(sf.row_sign[i] * np.eye(m)[i]), tol)
+        constraints.append(ConstraintRange(
+            name=name,
+            activity=float(activity[i]),
+            rhs=float(model.b[i]),
+            slack=float(model.b[i] - activity[i]),
+            shadow_price=float(sf.sign * sf.row_sign[i] * y[i]) + 0.0,
+            increase=increase,
+            decrease=decrease,
+        ))
+
+    free = list(sf.free)
+    variables = []
+    for j, name in enumerate(model.variables):
+        # c_j do modelo -> sign * c_j na coluna j (e -sign * c_j na parte
+        # negativa, se a variável for livre)
+        p = np.zeros(A.shape[1])
+        p[j] = sf.sign
+        if j in free:
+            p[sf.n + free.index(j)] = -sf.sign
+        change = p - factor.btran(p[basis]) @ A
+        increase, decrease = _step(d[nonbasic], change[nonbasic], tol)
+        reduced = 0.0 if not nonbasic[j] else float(sf.sign * d[j])
+        variables.append(VariableRange(
+            name=name,
+            value=float(x[j]),
+            cost=float(model.objective[j]),
+            reduced_cost=reduced + 0.0,
+            increase=increase,
+            decrease=decrease,
+        ))
+
+    return SensitivityReport(
+        model=model.name, objective=float(sf.objective(z)),
+        constraints=constraints, variables=variables,
+    )
@@ -0,0 +1,199 @@
+from dataclasses import dataclass  # Estrutura para a forma padrão
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+# =============================================================================
+# MÉTODO SIMPLEX (TABLEAU) EM NUMPY
+# -----------------------------------------------------------------------------
+# Implementação direta do método visto na Aula 03, sem arquivos temporários
+# nem processo externo: o modelo é levado à forma padrão
+#
+#   min c @ z   sujeito a   A z = b,  z >= 0,  b >= 0
+#
+# (folgas para '<=', excessos para '>=', limites superiores viram linhas,
+# limites inferiores são deslocados e variáveis livres são desdobradas) e
+# resolvido pelo simplex de duas fases sobre um tableau denso.
+# =============================================================================
+
+TOL = 1e-9
+
+
+@dataclass
+class StandardForm:
+    """Modelo na forma padrão e o necessário para voltar às variáveis originais."""
+    c: np.ndarray          # custos (minimização) das colunas padrão
+    A: np.ndarray          # matriz m x N com folgas/excessos
+    b: np.ndarray          # lado direito (>= 0)
+    n: int                 # número de variáveis originais
+    lower: np.ndarray      # deslocamento aplicado às variáveis originais
+    free: np.ndarray       # índices das variáveis livres (desdobradas)
+    sign: float            # -1 para maximização (min -c), +1 para minimização
+    offset: float          # constante do objetivo devida ao deslocamento
+    row_sign: np.ndarray   # -1 nas linhas multiplicadas por -1 (b < 0)
+    slack: np.ndarray      # coluna de folga/excesso de cada linha (-1 se '=')
+    m_model: int           # linhas do modelo (as demais são limites superiores)
+
+    def recover(self, z):
+        """Converte a solução padrão z nas variáveis originais x."""
+        x = self.lower + z[:self.n]
+        if len(self.free):
+            x[self.free] -= z[self.n:self.n + len(self.free)]
+        return x
+
+    def objective(self, z):
+        """Valor do objetivo original (com o sentido do modelo)."""
+        return self.sign * (self.c @ z + self.offset)
+
+
+def standard_form(c, A, b, senses, lower, upper, maximize):
+    """Leva min/max c @ x, A x (senses) b, lower <= x <= upper à forma padrão."""
+    c = np.asarray(c, dtype=float)
+    A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(-1, len(c))
+    b = np.asarray(b, dtype=float)
+    senses = np.asarray(senses) if len(senses) else np.empty(0, dtype='<U2')
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    n = len(c)
+    m_model = len(b)
+    sign = -1.0 if maximize else 1.0
+
+    # Deslocamento x = lower + x' (variáveis livres ficam com deslocamento 0)
+    free = np.flatnonzero(np.isneginf(lower))
+    shift = np.where(np.isneginf(lower), 0.0, lower)
+    b = b - A @ shift
+
+    # Limites superiores finitos viram linhas x'_j <= upper_j - lower_j
+    bounded = np.flatnonzero(np.isfinite(upper))
+    if len(bounded):
+        rows = np.zeros((len(bounded), n))
+        rows[np.arange(len(bounded)), bounded] = 1.0
+        A = np.vstack([A, rows])
+        b = np.concatenate([b, upper[bounded] - shift[bounded]])
+        senses = np.concatenate([senses, np.full(len(bounded), '<=')])
+
+    # Variáveis livres: x = x+ - x-
+    cols = np.hstack([A, -A[:, free]])
+    cost = np.concatenate([sign * c, -sign * c[free]])
+
+    # Folgas (+1) para '<=' e excessos (-1) para '>='
+    m = len(b)
+    has_slack = senses != '='
+    k = int(has_slack.sum())
+    S = np.zeros((m, k))
+    slack = np.full(m, -1)
+    idx = np.flatnonzero(has_slack)
+    S[idx, np.arange(k)] = np.where(senses[idx] == '>=', -1.0, 1.0)
+    slack[idx] = cols.shape[1] + np.arange(k)
+
+    A_std = np.hstack([cols, S])
+    c_std = np.concatenate([cost, np.zeros(k)])
+
+    # Garante b >= 0 trocando o sinal das linhas necessárias
+    row_sign = np.where(b < 0, -1.0, 1.0)
+    A_std *= row_sign[:, None]
+    b = b * row_sign
+
+    return StandardForm(
+        c=c_std, A=A_std, b=b, n=n, lower=shift, free=free, sign=sign,
+        offset=float(c @ shift) * sign, row_sign=row_sign, slack=slack, m_model=m_model,
+    )
+
+
+def unit_basis(A):
+    """Colunas unitárias (+1 numa só linha) usáveis como base inicial."""
+    m = A.shape[0]
+    if m == 0 or A.shape[1] == 0:
+        return np.full(m, -1)
+    nonzero = A != 0
+    unit = (nonzero.sum(axis=0) == 1) & (np.abs(A.max(axis=0) - 1.0) <= TOL)
+    basis = np.full(m, -1)
+    for j in np.flatnonzero(unit)[::-1]:
+        basis[np.argmax(nonzero[:, j])] = j
+    return basis
+
+
+def _pivot(T, r, s):
+    T[r] /= T[r, s]
+    col = T[:, s].copy()
+    col[r] = 0.0
+    T -= np.outer(col, T[r])
+
+
+def _iterate(T, basis, max_iter, tol):
+    # Regra de Dantzig (custo reduzido mais negativo); empates no teste da
+    # razão ficam com a variável básica de menor índice. Não é a regra de
+    # Bland completa (a coluna que entra não é a de menor índice), então a
+    # ciclagem em problemas degenerados é evitada só por `max_iter`.
+    iterations = 0
+    m = len(basis)
+    while iterations < max_iter:
+        d = T[-1, :-1]
+        s = int(np.argmin(d))
+        if d[s] >= -tol:
+            return 'Optimal', iterations
+        column = T[:m, s]
+        positive = column > tol
+        if not positive.any():
+            return 'Unbounded', iterations
+        ratios = np.full(m, np.inf)
+        ratios[positive] = T[:m, -1][positive] / column[positive]
+        best = ratios.min()
+        ties = np.flatnonzero(ratios <= best + tol * (1.0 + abs(best)))
+        r = int(ties[np.argmin(basis[ties])])
+        _pivot(T, r, s)
+        basis[r] = s
+        iterations += 1
+    return 'Not Solved', iterations
+
+
+def tableau_simplex(c, A, b, max_iter=10_000, tol=TOL):
+    """Simplex de duas fases: min c @ z, A z = b, z >= 0 (b >= 0).
+
+    Retorna (status, z, basis, iterations), com status no vocabulário do pulp
+    ('Optimal', 'Infeasible', 'Unbounded').
+    """
+    m, N = A.shape
+    basis = unit_basis(A)
+    missing = np.flatnonzero(basis < 0)
+    n_art = len(missing)
+
+    # Tableau com colunas artificiais nas linhas sem coluna unitária
+    T = np.zeros((m + 1, N + n_art + 1))
+    T[:m, :N] = A
+    T[missing, N + np.arange(n_art)] = 1.0
+    T[:m, -1] = b
+    basis[missing] = N + np.arange(n_art)
+
+    iterations = 0
+    if n_art:
+        # Fase 1: minimizar a soma das artificiais
+        T[-1, N:N + n_art] = 1.0
+        T[-1] -= T[missing].sum(axis=0)
+        status, iterations = _iterate(T, basis, max_iter, tol)
+        if -T[-1, -1] > tol * (1.0 + np.abs(b).max(initial=0.0)):
+            return 'Infeasible', None, basis, iterations
+
+        # Retira da base as artificiais remanescentes (nível zero)
+        keep = np.ones(m, dtype=bool)
+        for r in np.flatnonzero(basis >= N):
+            candidates = np.flatnonzero(np.abs(T[r, :N]) > tol)
+            if len(candidates):
+                _pivot(T, r, candidates[0])
+                basis[r] = candidates[0]
+            else:
+                keep[r] = False  # linha redundante
+        T = np.vstack([T[:m][keep], T[-1:]])
+        T = np.delete(T, np.s_[N:N + n_art], axis=1)
+        basis = basis[keep]
+        m = len(basis)
+
+    # Fase 2: custos reduzidos do objetivo original
+    T[-1] = 0.0
+    T[-1, :N] = c
+    T[-1] -= c[basis] @ T[:m]
+    status, more = _iterate(T, basis, max_iter, tol)
+    iterations += more
+
+    z = np.zeros(N)
+    z[basis] = T[:m, -1]
+    return status, z, basis, iterations
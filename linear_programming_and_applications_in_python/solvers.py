@@ -0,0 +1,168 @@
+from dataclasses import dataclass, field  # Estrutura do resultado
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .revised import revised_simplex
+from .simplex import tableau_simplex
+
+# =============================================================================
+# BACKENDS DE RESOLUÇÃO
+# -----------------------------------------------------------------------------
+# solve(model, backend=...) resolve um LinearModel com o backend escolhido:
+#
+#   'cbc'    -> pulp + CBC (escreve arquivo temporário e dispara o binário);
+#   'numpy'  -> simplex em tableau, dentro do próprio processo (Aula 03);
+#   'revised'-> simplex revisado com base fatorada em LU (revised.py), que
+#               também informa pivôs e multiplicadores da base final;
+#   'bnb'    -> branch-and-bound sobre o simplex revisado (branch.py), para
+#               modelos com variáveis inteiras;
+#   'enum'   -> enumeração de todos os pontos inteiros da caixa de limites
+#               (enumeration.py), para grades pequenas.
+#
+# Para modelos de 2–3 variáveis, como os da prova-01, o custo do CBC é quase
+# todo de processo e E/S; o backend 'numpy' evita esse custo por completo.
+# Todos os backends devolvem o mesmo Solution, com os status do pulp.
+# =============================================================================
+
+
+@dataclass
+class Solution:
+    """Resultado de uma resolução, independente do backend."""
+    status: str
+    objective: float
+    x: np.ndarray
+    variables: tuple = ()
+    iterations: int = 0
+    backend: str = ''
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def values(self):
+        """Valores das variáveis por nome."""
+        return dict(zip(self.variables, self.x))
+
+
+def solve_cbc(model, msg=False):
+    import pulp
+
+    problem, xs = model.to_pulp()
+    problem.solve(pulp.PULP_CBC_CMD(msg=msg))
+    status = pulp.LpStatus[problem.status]
+    x = np.array([np.nan if v.varValue is None else v.varValue for v in xs])
+    objective = pulp.value(problem.objective)
+    if status == 'Optimal':
+        objective = objective or 0.0    # objetivo todo nulo: pulp devolve None
+        # Variável fora do objetivo e das restrições não vai ao CBC (varValue
+        # None); qualquer valor dos limites é ótimo: o mais próximo de 0.
+        lost = np.isnan(x)
+        lower, upper = np.asarray(model.lower, dtype=float), np.asarray(model.upper, dtype=float)
+        integer = np.asarray(model.integer, dtype=bool)
+        lower = np.where(integer, np.ceil(lower), lower)
+        upper = np.where(integer, np.floor(upper), upper)
+        x[lost] = np.clip(0.0, lower[lost], upper[lost])
+    return Solution(
+        status=status,
+        objective=objective,
+        x=x,
+        variables=model.variables,
+        backend='cbc',
+    )
+
+
+def solve_numpy(model, max_iter=10_000):
+    if np.any(model.integer):
+        raise ValueError(f"{model.name}: o backend 'numpy' resolve apenas modelos contínuos")
+    sf = model.standard
+    status, z, basis, iterations = tableau_simplex(sf.c, sf.A, sf.b, max_iter=max_iter)
+    if status != 'Optimal':
+        return Solution(status=status, objective=None, x=np.full(sf.n, np.nan),
+                        variables=model.variables, iterations=iterations, backend='numpy')
+    return Solution(
+        status=status,
+        objective=sf.objective(z),
+        x=sf.recover(z),
+        variables=model.variables,
+        iterations=iterations,
+        backend='numpy',
+        extra={'basis': basis},
+    )
+
+
+def solve_revised(model, basis=None, max_iter=10_000):
+    if np.any(model.integer):
+        raise ValueError(f"{model.name}: o backend 'revised' resolve apenas modelos contínuos")
+    sf = model.standard
+    result = revised_simplex(sf.c, sf.A, sf.b, basis=basis, max_iter=max_iter)
+    optimal = result.status == 'Optimal'
+    return Solution(
+        status=result.status,
+        objective=sf.objective(result.z) if optimal else None,
+        x=sf.recover(result.z) if optimal else np.full(sf.n, np.nan),
+        variables=model.variables,
+        iterations=result.iterations,
+        backend='revised',
+        extra={
+            'basis': result.basis,
+            'y': result.y,
+            'pivots': result.pivots,
+            'phase1_iterations': result.phase1_iterations,
+            'refactorizations': result.refactorizations,
+        },
+    )
+
+
+def solve_bnb(model, **options):
+    from .branch import branch_and_bound
+
+    return branch_and_bound(model, **options)
+
+
+def solve_enum(model, **options):
+    from .enumeration import enumerate_plans
+
+    result = enumerate_plans(model, **options)
+    if not len(result.plans):
+        return Solution(status='Infeasible', objective=None, x=np.full(len(model.variables), np.nan),
+                        variables=model.variables, backend='enum',
+                        extra={'evaluated': result.evaluated})
+    return Solution(
+        status='Optimal',
+        objective=float(result.objective[0]),
+        x=result.plans[0].astype(float),
+        variables=model.variables,
+        backend='enum',
+        extra={'evaluated': result.evaluated, 'feasible': result.feasible, 'plans': result.plans},
+    )
+
+
+BACKENDS = {
+    'cbc': solve_cbc,
+    'numpy': solve_numpy,
+    'revised': solve_revised,
+    'bnb': solve_bnb,
+    'enum': solve_enum,
+}
+
+
+def solve(model, backend='cbc', presolve=False, **options):
+    """Resolve o modelo com o backend indicado (ver BACKENDS).
+
+    Com `presolve=True` o backend recebe o modelo reduzido por
+    presolve.presolve; o relatório fica em `extra['presolve']`.
+    """
+    try:
+        solver = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend desconhecido: {backend!r} (opções: {', '.join(BACKENDS)})") from None
+    if not presolve:
+        return solver(model, **options)
+
+    from .presolve import presolve as run_presolve
+
+    reduced = run_presolve(model)
+    if reduced.status == 'Infeasible':
+        return Solution(status='Infeasible', objective=None, x=np.full(len(model.variables), np.nan),
+                        variables=model.variables, backend=backend, extra={'presolve': reduced})
+    solution = solver(reduced.model, **options)
+    solution.extra['presolve'] = reduced
+    return solution
@@ -0,0 +1,209 @@
+from dataclasses import dataclass  # Estrutura imutável do modelo esparso
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .models import SENSES, LinearModel, _readonly
+
+# =============================================================================
+# MODELO DE PL COM MATRIZ ESPARSA (CSR)
+# -----------------------------------------------------------------------------
+# LinearModel guarda A como matriz densa, o que serve para os exercícios de
+# 2-3 variáveis. Numa versão ampliada da fábrica de facas (Exercise7) com
+# centenas de máquinas e 10^5 produtos, cada produto passa por poucas
+# máquinas: quase toda a matriz é zero, e montar o modelo termo a termo com
+# expressões do pulp cria milhões de objetos Python.
+#
+# SparseModel guarda só os coeficientes não nulos em formato CSR, como as
+# listas de adjacência de cpm.py (sem scipy):
+#
+#   row_ptr[i]:row_ptr[i+1]  -> posições da linha i em col_idx / values
+#
+# e é montado de uma vez a partir de arrays COO (linha, coluna, valor), com
+# coeficientes repetidos somados.
+#
+# Exemplo:
+#   model = SparseModel.from_coo(rows, cols, values, objective=lucro,
+#                                senses=['<='] * m, rhs=capacidade, sense='max')
+#   model.nnz, model.matvec(x)
+#   model.solve('cbc')
+# =============================================================================
+
+
+def _pulp_rows(problem, xs, row_ptr, col_idx, values, senses, rhs, names):
+    # Uma LpConstraint por linha CSR, sem aritmética de expressões termo a termo
+    import pulp
+
+    kinds = {'<=': pulp.LpConstraintLE, '>=': pulp.LpConstraintGE, '=': pulp.LpConstraintEQ}
+    cols, coefficients = np.asarray(col_idx).tolist(), np.asarray(values).tolist()
+    ptr, rhs = np.asarray(row_ptr).tolist(), np.asarray(rhs, dtype=float).tolist()
+    for i, (name, sense, b) in enumerate(zip(names, np.asarray(senses).tolist(), rhs)):
+        start, stop = ptr[i], ptr[i + 1]
+        expr = pulp.LpAffineExpression(zip([xs[j] for j in cols[start:stop]], coefficients[start:stop]))
+        problem.addConstraint(pulp.LpConstraint(expr, kinds[sense], rhs=b), name)
+
+
+@dataclass(frozen=True)
+class SparseModel:
+    """Modelo de PL com A em CSR: otimizar c @ x sujeito a A x (senses) b."""
+    name: str
+    sense: str
+    variables: tuple
+    objective: np.ndarray
+    constraint_names: tuple
+    row_ptr: np.ndarray
+    col_idx: np.ndarray
+    values: np.ndarray
+    senses: np.ndarray
+    b: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    integer: np.ndarray
+    objective_name: str = "Objetivo"
+
+    @property
+    def maximize(self):
+        return self.sense == 'max'
+
+    @property
+    def shape(self):
+        return len(self.b), len(self.objective)
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    @property
+    def row_of(self):
+        """Linha de cada coeficiente armazenado (forma COO)."""
+        return np.repeat(np.arange(len(self.b)), np.diff(self.row_ptr))
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, objective, senses, rhs, sense='max', name='Modelo',
+                 variables=None, constraint_names=None, lower=None, upper=None, integer=None,
+                 objective_name='Objetivo'):
+        """Monta o modelo a partir de triplas (linha, coluna, valor)."""
+        objective = np.asarray(objective, dtype=float)
+        b = np.asarray(rhs, dtype=float)
+        n, m = len(objective), len(b)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols e values devem ter o mesmo tamanho")
+        if len(rows) and (rows.min() < 0 or rows.max() >= m or cols.min() < 0 or cols.max() >= n):
+            raise ValueError(f"índices fora da matriz {m} x {n}")
+        senses = np.asarray(senses if len(senses) else [], dtype='<U2').reshape(-1)
+        if len(senses) == 1 and m > 1:
+            senses = np.repeat(senses, m)
+        bad = set(np.unique(senses).tolist()) - set(SENSES)
+        if bad:
+            raise ValueError(f"Sentidos de restrição inválidos: {sorted(bad)}")
+        sense = sense.lower()
+        if sense not in ('max', 'min'):
+            raise ValueError(f"Sentido do objetivo inválido: {sense!r}")
+
+        # Ordena por (linha, coluna), soma repetidos e descarta zeros
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if len(rows):
+            first = np.empty(len(rows), dtype=bool)
+            first[0] = True
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            values = np.bincount(np.cumsum(first) - 1, weights=values)
+            rows, cols = rows[first], cols[first]
+            nonzero = values != 0
+            rows, cols, values = rows[nonzero], cols[nonzero], values[nonzero]
+        row_ptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=m), out=row_ptr[1:])
+
+        model = cls(
+            name=name,
+            sense=sense,
+            variables=tuple(variables) if variables is not None else tuple(f"x{j + 1}" for j in range(n)),
+            objective=_readonly(objective),
+            constraint_names=tuple(constraint_names) if constraint_names is not None
+            else tuple(f"R{i + 1}" for i in range(m)),
+            row_ptr=_readonly(row_ptr, dtype=np.int64),
+            col_idx=_readonly(cols, dtype=np.int64),
+            values=_readonly(values),
+            senses=_readonly(senses, dtype='<U2'),
+            b=_readonly(b),
+            lower=_readonly(np.zeros(n) if lower is None else np.broadcast_to(lower, (n,))),
+            upper=_readonly(np.full(n, np.inf) if upper is None else np.broadcast_to(upper, (n,))),
+            integer=_readonly(np.zeros(n, bool) if integer is None else np.broadcast_to(integer, (n,)),
+                              dtype=bool),
+            objective_name=objective_name,
+        )
+        for field_name, size in (('variables', n), ('senses', m), ('constraint_names', m)):
+            if len(getattr(model, field_name)) != size:
+                raise ValueError(f"{model.name}: '{field_name}' deveria ter {size} elementos")
+        return model
+
+    @classmethod
+    def from_dense(cls, model):
+        """Converte um LinearModel (matriz densa) para CSR."""
+        rows, cols = np.nonzero(model.A)
+        return cls.from_coo(
+            rows, cols, model.A[rows, cols], model.objective, list(model.senses), model.b,
+            sense=model.sense, name=model.name, variables=model.variables,
+            constraint_names=model.constraint_names, lower=model.lower, upper=model.upper,
+            integer=model.integer, objective_name=model.objective_name,
+        )
+
+    def matvec(self, x):
+        """A @ x."""
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.row_of, weights=self.values * x[self.col_idx], minlength=len(self.b))
+
+    def rmatvec(self, y):
+        """A^T @ y."""
+        y = np.asarray(y, dtype=float)
+        return np.bincount(self.col_idx, weights=self.values * y[self.row_of], minlength=len(self.objective))
+
+    def row(self, i):
+        """(colunas, coeficientes) da linha i."""
+        start, stop = self.row_ptr[i], self.row_ptr[i + 1]
+        return self.col_idx[start:stop], self.values[start:stop]
+
+    def to_dense(self):
+        """LinearModel equivalente (matriz densa m x n)."""
+        m, n = self.shape
+        A = np.zeros((m, n))
+        A[self.row_of, self.col_idx] = self.values
+        return LinearModel(
+            name=self.name, sense=self.sense, variables=self.variables,
+            objective=self.objective, constraint_names=self.constraint_names,
+            A=_readonly(A), senses=tuple(self.senses.tolist()), b=self.b,
+            lower=self.lower, upper=self.upper, integer=self.integer,
+            objective_name=self.objective_name,
+        )
+
+    def to_pulp(self):
+        """Monta o pulp.LpProblem linha a linha a partir do CSR; retorna (problema, variáveis)."""
+        import pulp
+
+        problem = pulp.LpProblem(self.name, pulp.LpMaximize if self.maximize else pulp.LpMinimize)
+        xs = [
+            pulp.LpVariable(
+                name,
+                lowBound=None if np.isneginf(lo) else lo,
+                upBound=None if np.isposinf(up) else up,
+                cat='Integer' if is_int else 'Continuous',
+            )
+            for name, lo, up, is_int in zip(self.variables, self.lower.tolist(), self.upper.tolist(),
+                                            self.integer.tolist())
+        ]
+        nonzero = np.flatnonzero(self.objective)
+        problem += pulp.LpAffineExpression(
+            zip([xs[j] for j in nonzero.tolist()], self.objective[nonzero].tolist())), self.objective_name
+        _pulp_rows(problem, xs, self.row_ptr, self.col_idx, self.values, self.senses, self.b,
+                   self.constraint_names)
+        return problem, xs
+
+    def solve(self, backend='cbc', **options):
+        """Resolve com o CBC direto do CSR; os demais backends usam to_dense()."""
+        from .solvers import solve, solve_cbc
+
+        if backend == 'cbc':
+            return solve_cbc(self, **options)
+        return solve(self.to_dense(), backend, **options)
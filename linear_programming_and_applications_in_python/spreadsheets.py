@@ -0,0 +1,315 @@
+import os
+import re
+from dataclasses import dataclass  # Estrutura da tabela de atividades
+from pathlib import Path
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .models import parse_model
+
+# =============================================================================
+# LEITURA DAS PLANILHAS DAS AULAS (XLSX)
+# -----------------------------------------------------------------------------
+# Os dados dos exercícios estão nas planilhas de aula-01..aula-04 e prova-05,
+# e os scripts redigitam os coeficientes à mão. Aqui as planilhas são lidas
+# em modo somente leitura do openpyxl, linha a linha (iter_rows), sem
+# carregar a planilha inteira:
+#
+#   read_lp_sheets        -> um LinearModel por aba no formato das Aulas 01/03
+#                            (cabeçalho "Lucro"/"Min", uma linha por
+#                            variável e uma linha de sentidos "<=1200");
+#   read_activity_table   -> tabela PERT/CPM nas células (atividade, duração
+#                            e/ou a/m/b, predecessoras); nas planilhas da
+#                            Aula 04/prova-05 essas tabelas são imagens;
+#   read_activity_boxes   -> caixas dos diagramas desenhados na planilha da
+#                            Aula 04 (PDI/Dur/PDT acima do nome, UDI/FL/UDT
+#                            abaixo). As setas são formas desenhadas, não
+#                            células, então as dependências não são lidas.
+#
+# O resultado de cada leitura fica em cache, com a data de modificação do
+# arquivo (mtime) como chave: rodar de novo sem alterar a planilha não a lê.
+#
+# Exemplo:
+#   models = read_lp_sheets('aula-03/Exercícios - Aula 03 (Método Simplex).xlsx')
+#   models['EXEMPLO 1'].solve('revised').values  -> {'x1': 15.0, 'x2': 30.0}
+# =============================================================================
+
+_CACHE = {}
+_SENSE = re.compile(r'^\s*(<=|>=|=<|=>|=)\s*(.*?)\s*$')
+_TERM = re.compile(r'^([-+]?[\d\s.,]*)\s*\*?\s*(x\d+)$', re.IGNORECASE)
+_VARIABLE = re.compile(r'\((x\d+)\)', re.IGNORECASE)
+_SENSES = {'<=': '<=', '=<': '<=', '>=': '>=', '=>': '>=', '=': '='}
+_ACTIVITY_COLUMNS = {
+    'name': ('atividade', 'id', 'tarefa'),
+    'duration': ('duração', 'duracao', 'dur', 'tempo'),
+    'predecessors': ('predecessoras', 'predecessores', 'precedentes', 'dependências', 'dependencias'),
+    'optimistic': ('otimista', 'a'),
+    'most_likely': ('mais provável', 'mais provavel', 'provável', 'm'),
+    'pessimistic': ('pessimista', 'b'),
+}
+
+
+def _cached(path, key, reader):
+    # Reaproveita a leitura enquanto a data de modificação não mudar
+    path = Path(path).resolve()
+    mtime = os.stat(path).st_mtime_ns
+    hit = _CACHE.get((path, key))
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    result = reader(path)
+    _CACHE[(path, key)] = (mtime, result)
+    return result
+
+
+def clear_workbook_cache():
+    """Esvazia o cache de planilhas lidas."""
+    _CACHE.clear()
+
+
+def _rows(path, sheet=None):
+    # Gera (nome da aba, linha) lendo em modo somente leitura
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets = workbook.worksheets if sheet is None else [workbook[sheet]]
+        for ws in sheets:
+            for row in ws.iter_rows(values_only=True):
+                yield ws.title, row
+    finally:
+        workbook.close()
+
+
+def _number(value):
+    # Aceita 1200, "9 600 000" e "0,3"
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).replace('\xa0', '').replace(' ', '').replace(',', '.')
+    return float(text)
+
+
+def _unique(names):
+    seen = {}
+    out = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        out.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return out
+
+
+def _lp_table(title, header, objective_col, variable_rows, sense_row):
+    # Monta o dicionário do formato declarativo a partir das linhas da aba;
+    # os rótulos das variáveis ficam na coluna à esquerda da função objetivo
+    columns = [c for c, v in enumerate(header) if v is not None and c > objective_col]
+    labels = [str(row[objective_col - 1]).strip() for row in variable_rows]
+    found = [_VARIABLE.search(label) for label in labels]
+    names = [m.group(1).lower() if m else label for m, label in zip(found, labels)]
+    if len(set(names)) != len(names):
+        names = [f"x{k + 1}" for k in range(len(names))]
+
+    def cell(row, c):
+        value = row[c] if c < len(row) else None
+        return 0.0 if value is None else _number(value)
+
+    objective = [cell(row, objective_col) for row in variable_rows]
+    matrix, senses, rhs = [], [], []
+    for c in columns:
+        text = sense_row[c] if c < len(sense_row) else None
+        match = _SENSE.match(str(text)) if text is not None else None
+        if match is None:
+            raise ValueError(f"{title}: coluna {header[c]!r} sem sentido/lado direito")
+        coefficients = [cell(row, c) for row in variable_rows]
+        bound = match.group(2)
+        term = _TERM.match(bound.replace(' ', ''))
+        if term:
+            # Lado direito com variável ("x3 >= 16 x1"): passa para a esquerda
+            k = term.group(1).replace(',', '.')
+            j = names.index(term.group(2).lower())
+            coefficients[j] -= float(k) if k not in ('', '+', '-') else float(k + '1')
+            value = 0.0
+        else:
+            value = _number(bound)
+        matrix.append(coefficients)
+        senses.append(_SENSES[match.group(1)])
+        rhs.append(value)
+
+    kind = str(header[objective_col]).strip()
+    return parse_model({
+        'name': title.strip(),
+        'sense': 'min' if kind.lower().startswith(('min', 'custo')) else 'max',
+        'objective_name': kind,
+        'variables': {'names': names, 'objective': objective},
+        'constraints': {
+            'names': _unique([str(header[c]).strip() for c in columns]),
+            'senses': senses,
+            'rhs': rhs,
+            'matrix': matrix,
+        },
+    })
+
+
+def _objective_column(row):
+    # Coluna do cabeçalho "Lucro"/"Min"/"Custo", com colunas de restrição à direita
+    for c, value in enumerate(row):
+        if c > 0 and isinstance(value, str) and value.strip().lower().startswith(('lucro', 'min', 'custo')):
+            if any(v is not None for v in row[c + 1:]):
+                return c
+    return None
+
+
+def _read_lp_sheets(path, errors):
+    models, state = {}, {}
+    for title, row in _rows(path):
+        st = state.setdefault(title, {'header': None, 'variables': [], 'done': False})
+        if st['done']:
+            continue
+        values = [v for v in row if v is not None]
+        if not values:
+            continue
+        if st['header'] is None:
+            # O cabeçalho da função objetivo pode vir depois do rótulo das
+            # variáveis ('Variável de decisão' | 'Lucro R$' | restrições...)
+            c = _objective_column(row)
+            if c is not None:
+                st['header'], st['column'] = row, c
+            continue
+        c = st['column']
+        if isinstance(row[c - 1], str) and any(isinstance(v, (int, float)) for v in row[c:]):
+            st['variables'].append(row)
+        elif all(isinstance(v, str) and _SENSE.match(v) for v in values):
+            st['done'] = True
+            try:
+                models[title] = _lp_table(title, st['header'], c, st['variables'], row)
+            except (ValueError, KeyError) as exc:
+                if errors == 'raise':
+                    raise ValueError(f"{Path(path).name} / {title}: {exc}") from None
+        else:
+            st['done'] = True  # tabela terminou sem a linha de sentidos
+    return models
+
+
+def read_lp_sheets(path, errors='raise'):
+    """Um LinearModel por aba com tabela de PL no formato das Aulas 01/03.
+
+    Abas sem tabela são ignoradas; tabelas mal formadas, ou uma planilha sem
+    nenhuma tabela (as da Aula 02 só têm imagens), levantam ValueError. Com
+    errors='skip' elas são puladas e o resultado pode ser vazio.
+    """
+    if errors not in ('raise', 'skip'):
+        raise ValueError("errors deve ser 'raise' ou 'skip'")
+    models = _cached(path, ('lp', errors), lambda p: _read_lp_sheets(p, errors))
+    if not models and errors == 'raise':
+        raise ValueError(f"{Path(path).name}: nenhuma tabela de PL encontrada nas células "
+                         "(abas só com imagens não são lidas)")
+    return models
+
+
+@dataclass
+class ActivityTable:
+    """Tabela de atividades lida de uma planilha."""
+    names: tuple
+    duration: np.ndarray
+    predecessors: tuple
+    optimistic: np.ndarray = None
+    most_likely: np.ndarray = None
+    pessimistic: np.ndarray = None
+
+    def rows(self):
+        """Linhas (nome, duração, [predecessoras]) para ActivityNetwork.from_table."""
+        return list(zip(self.names, self.duration.tolist(), self.predecessors))
+
+    def network(self):
+        from .cpm import ActivityNetwork
+
+        return ActivityNetwork.from_table(self.rows())
+
+
+def _split_predecessors(value):
+    if value is None:
+        return []
+    text = str(value).strip()
+    if text in ('', '-', '—'):
+        return []
+    return [p.strip() for p in re.split(r'[,;/]', text) if p.strip()]
+
+
+def _read_activity_table(path, sheet):
+    columns = None
+    data = {key: [] for key in _ACTIVITY_COLUMNS}
+    for _, row in _rows(path, sheet):
+        if columns is None:
+            labels = [str(v).strip().lower() if v is not None else '' for v in row]
+            found = {key: next((c for c, label in enumerate(labels) if label in aliases), None)
+                     for key, aliases in _ACTIVITY_COLUMNS.items()}
+            # Cabeçalho só com duração ou com as três estimativas a/m/b completas
+            three_point = all(found[k] is not None for k in ('optimistic', 'most_likely', 'pessimistic'))
+            if found['name'] is not None and (found['duration'] is not None or three_point):
+                columns = {key: c for key, c in found.items() if c is not None}
+            continue
+        name = row[columns['name']] if columns['name'] < len(row) else None
+        if name is None:
+            break  # a tabela termina na primeira linha sem atividade
+        for key, c in columns.items():
+            data[key].append(row[c] if c < len(row) else None)
+    if columns is None:
+        raise ValueError(f"{Path(path).name}: nenhuma tabela de atividades encontrada "
+                         "(tabelas coladas como imagem não são lidas)")
+
+    three_point = all(k in columns for k in ('optimistic', 'most_likely', 'pessimistic'))
+    estimates = {k: np.array([_number(v) for v in data[k]]) for k in ('optimistic', 'most_likely', 'pessimistic')
+                 if three_point}
+    if 'duration' in columns:
+        duration = np.array([_number(v) for v in data['duration']])
+    else:
+        a, m, b = estimates['optimistic'], estimates['most_likely'], estimates['pessimistic']
+        duration = (a + 4 * m + b) / 6
+    return ActivityTable(
+        names=tuple(str(v).strip() for v in data['name']),
+        duration=duration,
+        predecessors=tuple(_split_predecessors(v) for v in data['predecessors']) if 'predecessors' in columns
+        else tuple([] for _ in data['name']),
+        **estimates,
+    )
+
+
+def read_activity_table(path, sheet=None):
+    """Lê uma tabela de atividades (cabeçalho Atividade/Duração/Predecessoras).
+
+    A tabela precisa estar nas células. Nas planilhas da Aula 04 e da prova-05
+    as tabelas de atividades são imagens coladas; delas só os diagramas
+    desenhados nas células são lidos, com read_activity_boxes.
+    """
+    return _cached(path, ('activities', sheet), lambda p: _read_activity_table(p, sheet))
+
+
+def _read_activity_boxes(path, sheet):
+    boxes = {}
+    previous = {}  # últimas três linhas de cada aba
+    for title, row in _rows(path, sheet):
+        window = previous.get(title, [])[-2:] + [row]
+        previous[title] = window
+        if len(window) < 3:
+            continue
+        above, middle, below = window
+
+        def numbers(r, c):
+            vals = [r[k] if k < len(r) else None for k in range(c, c + 3)]
+            return vals if all(isinstance(v, (int, float)) for v in vals) else None
+
+        for c, value in enumerate(middle):
+            if not isinstance(value, str) or c + 2 >= len(above):
+                continue
+            top, bottom = numbers(above, c), numbers(below, c)
+            if top is None or bottom is None:
+                continue
+            boxes.setdefault(title, []).append({
+                'name': value.strip(), 'es': float(top[0]), 'duration': float(top[1]),
+                'ef': float(top[2]), 'ls': float(bottom[0]), 'float': float(bottom[1]),
+                'lf': float(bottom[2]),
+            })
+    return boxes
+
+
+def read_activity_boxes(path, sheet=None):
+    """Caixas de atividades dos diagramas desenhados nas células, por aba."""
+    return _cached(path, ('boxes', sheet), lambda p: _read_activity_boxes(p, sheet))
@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field  # Estrutura simples para agrupar o resultado
+from itertools import combinations, islice  # Geração preguiçosa das bases candidatas
+
+import numpy as np  # Biblioteca para manipulação de arrays e cálculos numéricos
+
+from .sampling import as_upper_system
+
+# =============================================================================
+# ENUMERAÇÃO EXATA DE VÉRTICES DO POLIEDRO A x <= b
+# -----------------------------------------------------------------------------
+# Em vez de amostrar a região factível com milhares de pontos, calculamos os
+# vértices exatos: cada vértice é a solução de um sistema n x n formado por n
+# restrições ativas (uma "base" combinatória). Todas as bases candidatas são
+# resolvidas de uma vez com np.linalg.solve sobre uma pilha de matrizes, em
+# blocos para manter a memória limitada. As soluções que violam alguma
+# restrição são descartadas e as repetidas (vértices degenerados) unificadas.
+#
+# A estrutura de faces (facetas) sai de graça: uma restrição define uma faceta
+# quando os vértices em que ela é ativa geram uma face de dimensão n-1.
+# =============================================================================
+
+
+@dataclass
+class Polytope:
+    """Região factível {x : A x <= b} descrita pelos seus vértices e facetas.
+
+    `facets` associa o índice de cada linha de A que forma uma faceta aos
+    índices (em `vertices`) dos vértices dessa faceta. Em 2D e 3D os índices
+    vêm ordenados ao longo do contorno, prontos para desenhar a face.
+    """
+    A: np.ndarray
+    b: np.ndarray
+    vertices: np.ndarray
+    facets: dict = field(default_factory=dict)
+
+    def evaluate(self, c):
+        """Avalia a função objetivo c @ x em todos os vértices."""
+        return self.vertices @ np.asarray(c, dtype=float)
+
+    def optimum(self, c, maximize=True):
+        """Retorna (vértice, valor) ótimo de c @ x entre os vértices."""
+        values = self.evaluate(c)
+        k = int(np.argmax(values) if maximize else np.argmin(values))
+        return self.vertices[k], float(values[k])
+
+
+def with_nonnegativity(A, b, senses=None, nonnegative=True):
+    """Monta o sistema A x <= b, acrescentando x >= 0 quando pedido."""
+    A, b = as_upper_system(A, b, senses)
+    if nonnegative:
+        n = A.shape[1]
+        A = np.vstack([A, -np.eye(n)])
+        b = np.concatenate([b, np.zeros(n)])
+    return A, b
+
+
+def enumerate_vertices(A, b, senses=None, nonnegative=True, tol=1e-9, batch_size=50_000):
+    """Calcula todos os vértices de {x : A x <= b} (e x >= 0 por padrão).
+
+    Retorna um array (k, n) com os vértices em ordem lexicográfica.
+    """
+    A, b = with_nonnegativity(A, b, senses, nonnegative)
+    m, n = A.shape
+
+    found = []
+    bases = combinations(range(m), n)
+    while True:
+        chunk = np.array(list(islice(bases, batch_size)), dtype=np.intp)
+        if chunk.size == 0:
+            break
+        chunk = chunk.reshape(-1, n)
+
+        # Pilha de sistemas n x n; bases singulares são descartadas pelo posto
+        M = A[chunk]
+        rhs = b[chunk]
+        det = np.linalg.det(M)
+        regular = np.abs(det) > tol * np.prod(np.linalg.norm(M, axis=2), axis=1)
+        if not regular.any():
+            continue
+        X = np.linalg.solve(M[regular], rhs[regular][..., None])[..., 0]
+
+        # Mantém apenas as soluções factíveis para todas as restrições; a
+        # tolerância acompanha a magnitude de cada termo (ex.: milhões de litros)
+        scale = 1.0 + np.abs(b) + np.abs(X) @ np.abs(A).T
+        feasible = np.all(X @ A.T <= b + tol * scale, axis=1)
+        found.append(X[feasible])
+
+    if not found:
+        return np.empty((0, n))
+    V = np.concatenate(found)
+    if len(V) == 0:
+        return V
+    return _unique_rows(V, tol)
+
+
+def _unique_rows(V, tol):
+    # Arredonda numa grade proporcional à magnitude para unificar vértices
+    # degenerados obtidos por bases diferentes.
+    step = tol * max(1.0, float(np.abs(V).max()))
+    keys = np.round(V / step).astype(np.int64)
+    _, idx = np.unique(keys, axis=0, return_index=True)
+    V = V[np.sort(idx)]
+    V[np.abs(V) < step] = 0.0
+    return V[np.lexsort(V.T[::-1])]
+
+
+def facet_structure(A, b, vertices, tol=1e-9):
+    """Associa cada restrição que forma faceta aos vértices sobre ela."""
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float)
+    n = A.shape[1]
+    if len(vertices) == 0:
+        return {}
+
+    # Matriz de incidência restrição x vértice (restrição ativa no vértice)
+    slack = b[:, None] - A @ vertices.T
+    scale = 1.0 + np.abs(b)[:, None] + np.abs(A) @ np.abs(vertices).T
+    tight = np.abs(slack) <= tol * scale
+
+    facets = {}
+    seen = set()
+    for i in range(A.shape[0]):
+        idx = np.flatnonzero(tight[i])
+        if len(idx) < n:
+            continue
+        pts = vertices[idx]
+        if np.linalg.matrix_rank(pts[1:] - pts[0], tol=tol * max(1.0, np.abs(pts).max())) < n - 1:
+            continue
+        key = tuple(idx)
+        if key in seen:  # restrições repetidas geram a mesma faceta
+            continue
+        seen.add(key)
+        facets[i] = _order_facet(pts, idx, A[i])
+    return facets
+
+
+def _order_facet(pts, idx, normal):
+    # Em 2D a faceta é uma aresta; em 3D, ordenamos os vértices pelo ângulo em
+    # torno do centróide, no plano da faceta, para formar um polígono.
+    if pts.shape[1] != 3 or len(idx) <= 3:
+        return [int(i) for i in idx]
+    centre = pts.mean(axis=0)
+    u = pts[0] - centre
+    u /= np.linalg.norm(u)
+    w = np.cross(normal, u)
+    w /= np.linalg.norm(w)
+    d = pts - centre
+    angles = np.arctan2(d @ w, d @ u)
+    return [int(i) for i in idx[np.argsort(angles)]]
+
+
+def polytope(A, b, senses=None, nonnegative=True, tol=1e-9):
+    """Enumera vértices e facetas do sistema usado nos modelos pulp."""
+    A, b = with_nonnegativity(A, b, senses, nonnegative)
+    V = enumerate_vertices(A, b, nonnegative=False, tol=tol)
+    return Polytope(A=A, b=b, vertices=V, facets=facet_structure(A, b, V, tol=tol))
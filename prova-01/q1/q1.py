@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -42,45 +45,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio1_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q1.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Ternos), y
+# (Vestidos).
+model, (x, y) = load_model(Path(__file__).with_name('q1.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-# x: número de ternos produzidos
-# y: número de vestidos produzidos
-# As variáveis são definidas como contínuas; se necessário, podem ser forçadas a inteiras.
-x = pulp.LpVariable('Ternos', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Vestidos', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-# O objetivo é maximizar o lucro total:
-#   Max Z = 300*x + 500*y
-model += 300 * x + 500 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de algodão: 2*x + y <= 16
-model += 2 * x + y <= 16, "Restricao_Algodao"
-
-# Restrição de seda: x + 2*y <= 11
-model += x + 2 * y <= 11, "Restricao_Seda"
-
-# Restrição de lã: x + 3*y <= 15
-model += x + 3 * y <= 15, "Restricao_La"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de Ternos a Produzir =", x.varValue)
@@ -88,7 +67,7 @@ print("Número de Vestidos a Produzir =", y.varValue)
 print("Lucro Máximo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a plotagem, usamos x (ternos) no eixo X e y (vestidos) no eixo Y.
 # As restrições transformadas para igualdade são:
@@ -104,10 +83,6 @@ y_algodao = 16 - 2 * x_vals       # y <= 16 - 2*x
 y_seda = (11 - x_vals) / 2        # y <= (11 - x)/2
 y_la = (15 - x_vals) / 3          # y <= (15 - x)/3
 
-# A região factível será o conjunto onde y é menor ou igual ao menor desses valores:
-y_max = np.minimum(np.minimum(y_algodao, y_seda), y_la)
-y_max = np.maximum(y_max, 0)  # Garantir que y não seja negativo
-
 # Criação da figura para a plotagem
 plt.figure(figsize=(8, 6))
 
@@ -117,7 +92,7 @@ plt.plot(x_vals, y_seda, label='x + 2y = 11 (Seda)', color='red')
 plt.plot(x_vals, y_la, label='x + 3y = 15 (Lã)', color='green')
 
 # Preencher a região factível (abaixo do menor limite superior)
-plt.fill_between(x_vals, 0, y_max, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 10), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
@@ -132,7 +107,7 @@ plt.legend()
 plt.grid(True)
 
 # =============================================================================
-# 8) Salvar o gráfico no diretório especificado
+# 5) Salvar o gráfico no diretório especificado
 # -----------------------------------------------------------------------------
 # Salva o gráfico 2D no diretório:
 # 'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\exercises\result'
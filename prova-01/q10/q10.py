@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -28,30 +31,16 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio10_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q10.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Panelas), y
+# (Frigideiras).
+model, (x, y) = load_model(Path(__file__).with_name('q10.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable("Panelas", lowBound=0, cat="Continuous")
-y = pulp.LpVariable("Frigideiras", lowBound=0, cat="Continuous")
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 3 * x + 4 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-model += x + y <= 6, "Restricao_Tempo"  # Tempo de moldagem
-model += x <= 4, "Restricao_Panelas"      # Demanda de panelas
-model += y <= 4, "Restricao_Frigideiras"   # Demanda de frigideiras
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
@@ -61,7 +50,7 @@ print("Número de Frigideiras =", y.varValue)
 print("Lucro Máximo =", pulp.value(model.objective))
 
 # =============================================================================
-# 6) Visualizar a região factível e a solução ótima em 2D
+# 3) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # A região factível é definida por:
 #   • x + y <= 6   (linha: y = 6 - x)
@@ -72,15 +61,11 @@ x_vals = np.linspace(0, 6, 300)
 y_tempo = 6 - x_vals         # Representa a reta x + y = 6
 y_limite = np.full_like(x_vals, 4)  # y = 4
 
-# A região factível para y é o mínimo entre a restrição do tempo e o limite de mercado para y:
-y_feasible = np.minimum(y_tempo, y_limite)
-y_feasible = np.maximum(y_feasible, 0)
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_tempo, label='x + y = 6 (Tempo de Moldagem)')
 plt.axhline(4, color='red', linestyle='--', label='y = 4 (Máx Frigideiras)')
 plt.axvline(4, color='green', linestyle='--', label='x = 4 (Máx Panelas)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 6, 0, 6), label='Região Factível')
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
 
 plt.xlim(0, 6)
@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -33,42 +36,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Número de Sessões)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio2_Maximizar_Sessoes", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q2.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Natacao), y
+# (Ciclismo).
+model, (x, y) = load_model(Path(__file__).with_name('q2.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Natacao', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Ciclismo', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += x + y, "Numero_Total_Sessoes"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de custo:
-model += 3 * x + 2 * y <= 70, "Restricao_Custo"
-
-# Restrição de tempo (cada sessão tem 2 horas, total máximo 18 horas):
-model += x + y <= 9, "Restricao_Tempo"
-
-# Restrição calórica:
-model += 1500 * x + 1000 * y <= 80000, "Restricao_Calorias"
-# (A forma simplificada 3*x + 2*y <= 160 não é necessária, pois a restrição de custo já é mais
-#  limitante)
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de Sessões de Natação =", x.varValue)
@@ -76,7 +58,7 @@ print("Número de Sessões de Ciclismo =", y.varValue)
 print("Número Total de Sessões =", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a plotagem, usamos x no eixo X e y no eixo Y.
 # As restrições importantes para a visualização:
@@ -89,15 +71,11 @@ y_tempo = 9 - x_vals
 y_custo = (70 - 3 * x_vals) / 2
 y_calorias = (80000 - 1500 * x_vals) / 1000
 
-# Para cada valor de x, o limite efetivo de y é o menor entre as restrições (garantindo que y >= 0)
-y_feasible = np.minimum(np.minimum(y_tempo, y_custo), y_calorias)
-y_feasible = np.maximum(y_feasible, 0)
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_tempo, label='x + y = 9 (Tempo)')
 plt.plot(x_vals, y_custo, label='3x + 2y = 70 (Custo)')
 plt.plot(x_vals, y_calorias, label='1500x + 1000y = 80000 (Calorias)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 10), label='Região Factível')
 
 # Marcar a solução ótima encontrada (qualquer ponto com x+y = 9 é ótimo)
 # Exemplo: escolher x = 4, y = 5
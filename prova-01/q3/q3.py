@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -31,37 +34,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio3_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q3.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Produto1), y
+# (Produto2).
+model, (x, y) = load_model(Path(__file__).with_name('q3.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Produto1', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Produto2', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 2 * x + 5 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Horas de máquina:
-model += 3 * x + 4 * y <= 200, "Restricao_Horas_Maquina"
-
-# Matéria-prima:
-model += 9 * x + 7 * y <= 300, "Restricao_Materia_Prima"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de Unidades do Produto1 =", x.varValue)
@@ -69,7 +56,7 @@ print("Número de Unidades do Produto2 =", y.varValue)
 print("Lucro Máximo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x no eixo X e y no eixo Y.
 # As restrições são:
@@ -80,20 +67,16 @@ x_vals = np.linspace(0, 100, 300)
 y_maquina = (200 - 3 * x_vals) / 4
 y_materia = (300 - 9 * x_vals) / 7
 
-# Para cada valor de x, o limite superior de y é o menor entre as duas restrições:
-y_feasible = np.minimum(y_maquina, y_materia)
-y_feasible = np.maximum(y_feasible, 0)  # Garantir que y não seja negativo
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_maquina, label='3x + 4y = 200 (Horas de Máquina)')
 plt.plot(x_vals, y_materia, label='9x + 7y = 300 (Matéria-Prima)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 100, 0, 300 / 7), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
 
 plt.xlim(0, max(x_vals))
-plt.ylim(0, max(y_feasible))
+plt.ylim(0, 300 / 7)
 plt.xlabel('Unidades do Produto1 (x)')
 plt.ylabel('Unidades do Produto2 (y)')
 plt.title('Exercício 3 - Região Factível e Solução Ótima')
@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -39,38 +42,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio4_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q4.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Manga_Longa), y
+# (Manga_Curta).
+model, (x, y) = load_model(Path(__file__).with_name('q4.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Manga_Longa', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Manga_Curta', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 5 * x + 3.5 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de mão-de-obra:
-model += 1.5 * x + y <= 400, "Restricao_Mao_de_Obra"
-
-# Restrição de mercado:
-model += x <= 150, "Restricao_Mercado_Manga_Longa"
-model += y <= 300, "Restricao_Mercado_Manga_Curta"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de Camisas de Manga Longa =", x.varValue)
@@ -78,7 +64,7 @@ print("Número de Camisas de Manga Curta =", y.varValue)
 print("Lucro Máximo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x no eixo X (camisas de manga longa) e y no eixo Y (camisas de manga curta).
 # As restrições importantes:
@@ -89,15 +75,11 @@ print("Lucro Máximo = R$", pulp.value(model.objective))
 x_vals = np.linspace(0, 160, 300)
 y_mao_de_obra = 400 - 1.5 * x_vals
 
-# A região factível é definida pelo menor valor entre as restrições:
-y_feasible = np.minimum(y_mao_de_obra, 300)
-y_feasible = np.maximum(y_feasible, 0)  # Garantindo não-negatividade
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_mao_de_obra, label='1.5x + y = 400 (Mão-de-obra)')
 plt.axvline(x=150, color='red', linestyle='--', label='x = 150 (Manga Longa)')
 plt.axhline(y=300, color='green', linestyle='--', label='y = 300 (Manga Curta)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 160, 0, 320), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -41,37 +44,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio5_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q5.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Paraquedas), y
+# (Asa_Delta).
+model, (x, y) = load_model(Path(__file__).with_name('q5.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Paraquedas', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Asa_Delta', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 60 * x + 40 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Linha de montagem 1: 10*x + 10*y <= 100
-model += 10 * x + 10 * y <= 100, "Restricao_Linha1"
-
-# Linha de montagem 2: 3*x + 7*y <= 42
-model += 3 * x + 7 * y <= 42, "Restricao_Linha2"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de Paraquedas a produzir =", x.varValue)
@@ -79,7 +66,7 @@ print("Número de Asa-Deltas a produzir =", y.varValue)
 print("Lucro Máximo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x (paraquedas) no eixo X e y (asa-deltas) no eixo Y.
 # As restrições são:
@@ -90,20 +77,16 @@ x_vals = np.linspace(0, 15, 300)
 y_linha1 = 10 - x_vals
 y_linha2 = (42 - 3 * x_vals) / 7
 
-# Para cada valor de x, o limite superior de y é o menor valor entre as duas restrições:
-y_feasible = np.minimum(y_linha1, y_linha2)
-y_feasible = np.maximum(y_feasible, 0)  # Assegurando que y não seja negativo
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_linha1, label='10x + 10y = 100 (Linha 1)')
 plt.plot(x_vals, y_linha2, label='3x + 7y = 42 (Linha 2)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 15, 0, 7), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
 
 plt.xlim(0, max(x_vals))
-plt.ylim(0, max(y_feasible)+1)
+plt.ylim(0, 7)
 plt.xlabel('Número de Paraquedas (x)')
 plt.ylabel('Número de Asa-Deltas (y)')
 plt.title('Exercício 5 - Região Factível e Solução Ótima')
@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -44,40 +47,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Minimização do Custo)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio6_Minimizar_Custo", pulp.LpMinimize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q6.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Dias_SP), y
+# (Dias_RJ).
+model, (x, y) = load_model(Path(__file__).with_name('q6.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Dias_SP', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Dias_RJ', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 100000 * x + 200000 * y, "Custo_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Lâminas finas: 8*x + 2*y >= 16
-model += 8 * x + 2 * y >= 16, "Restricao_Finas"
-
-# Lâminas médias: x + y >= 6
-model += x + y >= 6, "Restricao_Medias"
-
-# Lâminas grossas: 2*x + 7*y >= 28
-model += 2 * x + 7 * y >= 28, "Restricao_Grossas"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Dias de operação da fábrica de São Paulo =", x.varValue)
@@ -85,7 +69,7 @@ print("Dias de operação da fábrica do Rio de Janeiro =", y.varValue)
 print("Custo Mínimo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x no eixo X e y no eixo Y.
 # As restrições são:
@@ -100,15 +84,11 @@ y_finas   = 8 - 4 * x_vals
 y_medias  = 6 - x_vals
 y_grossas = 4 - (2/7) * x_vals
 
-# Para cada valor de x, o limite inferior efetivo para y é o máximo entre as três expressões e 0:
-y_feasible = np.maximum(np.maximum(y_finas, y_medias), y_grossas)
-y_feasible = np.maximum(y_feasible, 0)
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_finas, label='8x + 2y = 16 (Finas)')
 plt.plot(x_vals, y_medias, label='x + y = 6 (Médias)')
 plt.plot(x_vals, y_grossas, label='2x + 7y = 28 (Grossas)')
-plt.fill_between(x_vals, y_feasible, 20, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 20), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
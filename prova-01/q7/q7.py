@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -33,40 +36,21 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Minimização do Custo)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio7_Minimizar_Custo", pulp.LpMinimize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q7.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Solucao_Red), y
+# (Solucao_Blue).
+model, (x, y) = load_model(Path(__file__).with_name('q7.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable('Solucao_Red', lowBound=0, cat='Continuous')
-y = pulp.LpVariable('Solucao_Blue', lowBound=0, cat='Continuous')
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 0.06 * x + 0.08 * y, "Custo_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de extrato de guaraná:
-model += 8 * x + 6 * y >= 48, "Restricao_Guarana"
-
-# Restrição de cafeína (mínimo):
-model += x + 2 * y >= 12, "Restricao_Cafeina_Min"
-
-# Restrição de cafeína (máximo):
-model += x + 2 * y <= 20, "Restricao_Cafeina_Max"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
 # =============================================================================
-# 6) Exibir os resultados da otimização
+# 3) Exibir os resultados da otimização
 # -----------------------------------------------------------------------------
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Número de doses da Solução Red (x) =", x.varValue)
@@ -74,7 +58,7 @@ print("Número de doses da Solução Blue (y) =", y.varValue)
 print("Custo Mínimo = R$", pulp.value(model.objective))
 
 # =============================================================================
-# 7) Visualizar a região factível e a solução ótima em 2D
+# 4) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x (doses de Red) no eixo X e y (doses de Blue) no eixo Y.
 # As restrições são:
@@ -87,19 +71,13 @@ y_guarana = (48 - 8 * x_vals) / 6
 y_cafeina_min = (12 - x_vals) / 2
 y_cafeina_max = (20 - x_vals) / 2
 
-# Para cada valor de x, o limite inferior efetivo para y é o máximo entre as restrições mínimas
-y_lower = np.maximum(y_guarana, y_cafeina_min)
-# O limite superior para y é a restrição do máximo de cafeína
-y_upper = y_cafeina_max
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_guarana, label='8x + 6y = 48 (Guaraná)')
 plt.plot(x_vals, y_cafeina_min, label='x + 2y = 12 (Cafeína Mínima)')
 plt.plot(x_vals, y_cafeina_max, label='x + 2y = 20 (Cafeína Máxima)')
 
 # Preencher a região factível (entre os limites inferior e superior)
-plt.fill_between(x_vals, y_lower, y_upper, where=(y_lower <= y_upper),
-                 color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 10), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
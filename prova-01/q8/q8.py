@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -30,30 +33,16 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização do Lucro por Hora)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio8_Maximizar_Lucro", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q8.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Sapatos), y
+# (Cintos).
+model, (x, y) = load_model(Path(__file__).with_name('q8.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable("Sapatos", lowBound=0, cat="Continuous")
-y = pulp.LpVariable("Cintos", lowBound=0, cat="Continuous")
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 5 * x + 2 * y, "Lucro_Total"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-model += 2 * x + y <= 6, "Restricao_Couro"    # Consumo de couro
-model += x <= 6, "Restricao_Sapatos"            # Capacidade máxima de sapatos
-model += y <= 5, "Restricao_Cintos"             # Capacidade máxima de cintos
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
@@ -63,7 +52,7 @@ print("Número de Cintos por hora =", y.varValue)
 print("Lucro Máximo por hora =", pulp.value(model.objective))
 
 # =============================================================================
-# 6) Visualizar a região factível e a solução ótima em 2D
+# 3) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para visualização, usamos x no eixo X e y no eixo Y.
 #
@@ -73,14 +62,10 @@ print("Lucro Máximo por hora =", pulp.value(model.objective))
 x_vals = np.linspace(0, 6, 300)
 y_couro = 6 - 2 * x_vals
 
-# O limite superior para y é o mínimo entre a restrição do couro e o limite de cintos (y <= 5)
-y_feasible = np.minimum(y_couro, 5)
-y_feasible = np.maximum(y_feasible, 0)
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_couro, label='2x + y = 6 (Couro)')
 plt.axhline(5, color='red', linestyle='--', label='y = 5 (Máx de cintos)')
-plt.fill_between(x_vals, 0, y_feasible, color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 6, 0, 6), label='Região Factível')
 
 # Marcar a solução ótima encontrada pelo solver
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
@@ -1,6 +1,9 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import draw_model_region  # Região factível exata (interseção de semiplanos)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -31,32 +34,16 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 # =============================================================================
 
 # =============================================================================
-# 1) Definir o problema de otimização (Maximização dos Telespectadores)
+# 1) Carregar o modelo
 # -----------------------------------------------------------------------------
-model = pulp.LpProblem("Exercicio9_Maximizar_Telespectadores", pulp.LpMaximize)
+# O problema (variáveis, função objetivo e restrições) está declarado em
+# q9.toml, ao lado deste script. load_model() lê o arquivo e to_pulp() monta o
+# pulp.LpProblem, com as variáveis na ordem do arquivo: x (Programa_A), y
+# (Programa_B).
+model, (x, y) = load_model(Path(__file__).with_name('q9.toml')).to_pulp()
 
 # =============================================================================
-# 2) Criar as variáveis de decisão
-# -----------------------------------------------------------------------------
-x = pulp.LpVariable("Programa_A", lowBound=0, cat="Continuous")
-y = pulp.LpVariable("Programa_B", lowBound=0, cat="Continuous")
-
-# =============================================================================
-# 3) Definir a função objetivo
-# -----------------------------------------------------------------------------
-model += 30000 * x + 10000 * y, "Total_Telespectadores"
-
-# =============================================================================
-# 4) Adicionar as restrições do problema
-# -----------------------------------------------------------------------------
-# Restrição de propaganda: x + y >= 5
-model += x + y >= 5, "Restricao_Propaganda"
-
-# Restrição de música: 2*x + y <= 8
-model += 2 * x + y <= 8, "Restricao_Musica"
-
-# =============================================================================
-# 5) Resolver o modelo
+# 2) Resolver o modelo
 # -----------------------------------------------------------------------------
 model.solve()
 
@@ -66,7 +53,7 @@ print("Programa B deve ser exibido =", y.varValue, "vezes por semana")
 print("Número máximo de telespectadores =", pulp.value(model.objective))
 
 # =============================================================================
-# 6) Visualizar a região factível e a solução ótima em 2D
+# 3) Visualizar a região factível e a solução ótima em 2D
 # -----------------------------------------------------------------------------
 # Para a visualização, usamos x no eixo X e y no eixo Y.
 #
@@ -78,14 +65,10 @@ x_vals = np.linspace(0, 10, 300)
 y_propaganda = 5 - x_vals
 y_musica = 8 - 2 * x_vals
 
-# A região factível é delimitada por y >= (5 - x) e y <= (8 - 2*x)
-y_lower = np.maximum(5 - x_vals, 0)
-y_upper = 8 - 2 * x_vals
-
 plt.figure(figsize=(8, 6))
 plt.plot(x_vals, y_propaganda, label='x + y = 5 (Propaganda)')
 plt.plot(x_vals, y_musica, label='2x + y = 8 (Música)')
-plt.fill_between(x_vals, y_lower, y_upper, where=(y_lower <= y_upper), color='gray', alpha=0.3, label='Região Factível')
+draw_model_region(plt.gca(), model, box=(0, 10, 0, 10), label='Região Factível')
 
 plt.scatter(x.varValue, y.varValue, color='black', zorder=5, label='Solução Ótima')
 
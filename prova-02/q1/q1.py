@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                   # Biblioteca para modelagem e resolução de problemas de programação linear
 import numpy as np            # Biblioteca para manipulação de arrays e cálculos numéricos
 import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # DESCRIÇÃO DO PROBLEMA
@@ -21,31 +23,19 @@ import matplotlib.pyplot as plt  # Biblioteca para criação de gráficos 2D
 #   x1, x2 >= 0
 # =============================================================================
 
-# 1) Definir o problema (Maximização do lucro)
-model = pulp.LpProblem("Prova2_Q1_Maximizar_Lucro", pulp.LpMaximize)
+# 1) Carregar o modelo (declarado em q1.toml, ao lado deste script)
+model, (x1, x2) = load_model(Path(__file__).with_name('q1.toml')).to_pulp()
 
-# 2) Criar variáveis de decisão (contínuas)
-x1 = pulp.LpVariable('P1', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('P2', lowBound=0, cat='Continuous')
-
-# 3) Função objetivo
-model += 1000 * x1 + 1800 * x2, "Lucro_Total"
-
-# 4) Restrições
-model += 20 * x1 + 30 * x2 <= 1200, "Restricao_Tempo"
-model += x1 <= 40,                   "Restricao_Demanda_P1"
-model += x2 <= 30,                   "Restricao_Demanda_P2"
-
-# 5) Resolver com Simplex
+# 2) Resolver com Simplex
 model.solve()
 
-# 6) Exibir resultados
+# 3) Exibir resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Quantidade P1 (x1) =", x1.varValue)
 print("Quantidade P2 (x2) =", x2.varValue)
 print("Lucro Máximo = R$", pulp.value(model.objective))
 
-# 7) Plotar região factível e solução ótima
+# 4) Plotar região factível e solução ótima
 x_vals = np.linspace(0, 50, 400)
 
 # Limites das restrições transformadas em igualdades:
@@ -79,7 +69,7 @@ plt.title('Prova 2 – Q1: Região Factível e Solução Ótima')
 plt.legend()
 plt.grid(True)
 
-# 8) Salvar o gráfico
+# 5) Salvar o gráfico
 output_path = r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q1\exercise1.png'
 plt.savefig(output_path, dpi=300)
 
@@ -1,32 +1,22 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp
 import numpy as np
 import matplotlib.pyplot as plt
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
-# 1) Definição do modelo de minimização
-model = pulp.LpProblem("Exemplo10_Minimizar_Custo_Papel", pulp.LpMinimize)
+# 1) Carregar o modelo (o mesmo do Exemplo 10: exercises/Exercise10.toml)
+model, (d1, d2) = load_model(Path(__file__).parents[2] / 'exercises' / 'Exercise10.toml').to_pulp()
 
-# 2) Variáveis de decisão (dias de operação)
-d1 = pulp.LpVariable('Dias_Fabrica1', lowBound=0, cat='Continuous')
-d2 = pulp.LpVariable('Dias_Fabrica2', lowBound=0, cat='Continuous')
-
-# 3) Função objetivo
-model += 1000 * d1 + 2000 * d2, "Custo_Total"
-
-# 4) Restrições de demanda
-model +=  8 * d1 +  2 * d2 >= 16, "Minimo_Fino"
-model +=  1 * d1 +  1 * d2 >=  6, "Minimo_Medio"
-model +=  2 * d1 +  7 * d2 >= 28, "Minimo_Grosso"
-
-# 5) Resolver via Simplex
+# 2) Resolver via Simplex
 model.solve()
 
-# 6) Exibir resultados
+# 3) Exibir resultados
 print("Status:", pulp.LpStatus[model.status])
 print(f"Dias Fábrica 1 = {d1.varValue:.2f}")
 print(f"Dias Fábrica 2 = {d2.varValue:.2f}")
 print(f"Custo Mínimo   = R$ {pulp.value(model.objective):.2f}")
 
-# 7) Plotagem da região factível
+# 4) Plotagem da região factível
 x = np.linspace(0, d1.varValue * 1.5, 300)
 y1 = (16 - 8 * x) / 2    # 8d1 + 2d2 =16 → d2 = (16 -8 x)/2
 y2 = (6  - 1 * x) / 1    # 1d1 + 1d2 =6  → d2 = 6 - x
@@ -51,7 +41,7 @@ plt.ylabel('Dias Fábrica 2 (d₂)')
 plt.title('Exemplo 10 – Região Factível e Solução Ótima')
 plt.legend(); plt.grid(True)
 
-# 8) Salvar o gráfico
+# 5) Salvar o gráfico
 plt.savefig(
     r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q10\exercise10.png',
     dpi=300
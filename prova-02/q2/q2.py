@@ -1,26 +1,16 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # biblioteca de otimização Linear Programming (LP) em Python :contentReference[oaicite:4]{index=4}
 import numpy as np  # para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # para visualização da região factível :contentReference[oaicite:5]{index=5}
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
-# 1) Definir o problema (Maximização)
-model = pulp.LpProblem("Exemplo2_Maximizar_Receita", pulp.LpMaximize)
+# 1) Carregar o modelo (declarado em q2.toml, ao lado deste script)
+model, (x1, x2, x3) = load_model(Path(__file__).with_name('q2.toml')).to_pulp()
 
-# 2) Variáveis de decisão contínuas (≥ 0)
-x1 = pulp.LpVariable('TipoI', lowBound=0, cat='Continuous')  # equipes Tipo I :contentReference[oaicite:6]{index=6}
-x2 = pulp.LpVariable('TipoII', lowBound=0, cat='Continuous')  # equipes Tipo II
-x3 = pulp.LpVariable('TipoIII', lowBound=0, cat='Continuous')  # equipes Tipo III
-
-# 3) Função objetivo
-model += 2000 * x1 + 3000 * x2 + 2800 * x3, "Receita_Total"
-
-# 4) Restrições de recursos
-model += 2 * x1 + 4 * x2 + 3 * x3 <= 25, "Restricao_Engenheiros"
-model += 6 * x1 + 8 * x2 + 9 * x3 <= 40, "Restricao_Tecnicos"
-
-# 5) Resolver via Simplex (CBC por padrão no PuLP)
+# 2) Resolver via Simplex (CBC por padrão no PuLP)
 model.solve()
 
-# 6) Exibir resultados
+# 3) Exibir resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print(f"x₁ (Tipo I) = {x1.varValue}")
 print(f"x₂ (Tipo II) = {x2.varValue}")
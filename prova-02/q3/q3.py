@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                    # Biblioteca para modelagem e resolução de PL
 import numpy as np             # Para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # Para visualização da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # Exemplo 03 – Sapateiro
@@ -29,30 +31,19 @@ import matplotlib.pyplot as plt  # Para visualização da região factível
 #   • x1, x2 ≥ 0
 # =============================================================================
 
-# 1) Definir o problema como maximização
-model = pulp.LpProblem("Exemplo3_Maximizar_Lucro_Sapateiro", pulp.LpMaximize)
+# 1) Carregar o modelo (declarado em q3.toml, ao lado deste script)
+model, (x1, x2) = load_model(Path(__file__).with_name('q3.toml')).to_pulp()
 
-# 2) Criar variáveis de decisão (contínuas, ≥ 0)
-x1 = pulp.LpVariable('Sapatos', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('Cintos',  lowBound=0, cat='Continuous')
-
-# 3) Definir a função objetivo
-model += 5 * x1 + 2 * x2, "Lucro_Total"
-
-# 4) Adicionar restrições (divisões convertidas em multiplicações pelo inverso)
-model += (1/6) * x1 + (1/5) * x2 <= 1,     "Restricao_Tempo"
-model += 2 * x1 + 1 * x2     <= 6,         "Restricao_Couro"
-
-# 5) Resolver com Simplex (solver padrão CBC)
+# 2) Resolver com Simplex (solver padrão CBC)
 model.solve()
 
-# 6) Exibir resultados
+# 3) Exibir resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print("Sapatos (x1) =", x1.varValue)
 print("Cintos  (x2) =", x2.varValue)
 print("Lucro Máximo = $", pulp.value(model.objective))
 
-# 7) Visualizar região factível e solução ótima
+# 4) Visualizar região factível e solução ótima
 x_vals = np.linspace(0, 6, 300)
 
 # Limites das restrições em igualdade:
@@ -76,7 +67,7 @@ plt.title('Exemplo 03 – Região Factível e Solução Ótima')
 plt.legend()
 plt.grid(True)
 
-# 8) Salvar o gráfico
+# 5) Salvar o gráfico
 output_path = r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q3\exercise3.png'
 plt.savefig(output_path, dpi=300)
 plt.show()
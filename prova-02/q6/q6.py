@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                    # Biblioteca para modelagem e resolução de PL
 import numpy as np             # Para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # Para visualização da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # Exemplo 06 – Refinaria de Gasolinas
@@ -39,37 +41,20 @@ import matplotlib.pyplot as plt  # Para visualização da região factível
 #   xV, xA, xC ≥ 0
 # =============================================================================
 
-# 1) Definir o problema (maximização)
-model = pulp.LpProblem("Ex06_Maximizar_Lucro_Refinaria", pulp.LpMaximize)
+# 1) Carregar o modelo (o mesmo do Exemplo 06: exercises/Exercise6.toml)
+model, (xV, xA, xC) = load_model(Path(__file__).parents[2] / 'exercises' / 'Exercise6.toml').to_pulp()
 
-# 2) Variáveis de decisão
-xV = pulp.LpVariable('Gasolina_Verde', lowBound=0, cat='Continuous')
-xA = pulp.LpVariable('Gasolina_Azul',  lowBound=0, cat='Continuous')
-xC = pulp.LpVariable('Gasolina_Comum', lowBound=0, cat='Continuous')
-
-# 3) Função objetivo
-model += 0.30 * xV + 0.25 * xA + 0.20 * xC, "Margem_Total"
-
-# 4) Restrições de insumo
-model += 0.22 * xV + 0.52 * xA + 0.74 * xC <= 9_600_000, "Restricao_Pura"
-model += 0.50 * xV + 0.34 * xA + 0.20 * xC <= 4_800_000, "Restricao_Octana"
-model += 0.28 * xV + 0.14 * xA + 0.06 * xC <= 2_200_000, "Restricao_Aditivo"
-
-# 5) Restrições de planejamento de mercado
-model += xC >= 16 * xV,    "Comum_vs_Verde"
-model += xA <= 600_000,    "Max_Azul"
-
-# 6) Resolver (Simplex via CBC)
+# 2) Resolver (Simplex via CBC)
 model.solve()
 
-# 7) Exibir resultados
+# 3) Exibir resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print(f"Gasolina Verde (xV) = {xV.varValue:.0f} L")
 print(f"Gasolina Azul  (xA) = {xA.varValue:.0f} L")
 print(f"Gasolina Comum (xC) = {xC.varValue:.0f} L")
 print(f"Margem Máxima   = R$ {pulp.value(model.objective):.2f}")
 
-# 8) Visualização 2D: projeção xC vs xV com xA fixado no valor ótimo
+# 4) Visualização 2D: projeção xC vs xV com xA fixado no valor ótimo
 opt_xA = xA.varValue
 
 # Determinar domínio de xV baseado nos recursos e na regra xC ≥ 16*xV:
@@ -108,7 +93,7 @@ plt.title('Exemplo 06 – Região Factível e Solução Ótima (xA fixo)')
 plt.legend()
 plt.grid(True)
 
-# 9) Salvar o gráfico
+# 5) Salvar o gráfico
 output_path = r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q6\exercise6.png'
 plt.savefig(output_path, dpi=300)
 
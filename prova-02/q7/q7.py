@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp  # Biblioteca para modelagem e resolução de PL
-import numpy as np  # Para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # Para visualização da região factível
+from linear_programming_and_applications_in_python import draw_boundaries, draw_model_region  # Região e fronteiras exatas (sem grade)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # Exemplo – Afia Bem Ltda. (Facas P, M e G)
@@ -43,67 +45,39 @@ import matplotlib.pyplot as plt  # Para visualização da região factível
 #   25*xP + 32*xM + 45*xG ≤ 50000     (Chapa)
 # =============================================================================
 
-# 1) Definir problema
-model = pulp.LpProblem("AfiaBem_Facas", pulp.LpMaximize)
+# 1) Carregar o modelo (o mesmo do Exemplo 07: exercises/Exercise7.toml)
+model, (xP, xM, xG) = load_model(Path(__file__).parents[2] / 'exercises' / 'Exercise7.toml').to_pulp()
 
-# 2) Decisão
-xP = pulp.LpVariable('Padrao', lowBound=0, cat='Continuous')
-xM = pulp.LpVariable('Medio', lowBound=0, cat='Continuous')
-xG = pulp.LpVariable('Grande', lowBound=0, cat='Continuous')
-
-# 3) Objetivo
-model += 3.0 * xP + 4.0 * xM + 4.7 * xG, "Lucro_Total"
-
-# 4) Restrições de máquina
-model += 10 * xP + 10 * xM + 12 * xG <= 14400, "Corte"
-model += 10 * xP + 15.5 * xM + 17 * xG <= 21600, "Modelagem"
-model += 12 * xP + 16 * xM + 19 * xG <= 21600, "Afiacao"
-model += 19 * xP + 21 * xM + 24 * xG <= 28800, "Cabo"
-model += 19 * xP + 21 * xM + 22 * xG <= 28800, "Montagem"
-
-# 5) Restrição de chapa
-model += 25 * xP + 32 * xM + 45 * xG <= 50000, "Chapa"
-
-# 6) Resolver
+# 2) Resolver
 model.solve()
 
-# 7) Resultados
+# 3) Resultados
 print("Status:", pulp.LpStatus[model.status])
 print(f"Padrão (xP) = {xP.varValue:.1f}")
 print(f"Médio  (xM) = {xM.varValue:.1f}")
 print(f"Grande (xG) = {xG.varValue:.1f}")
 print(f"Lucro Máximo = R$ {pulp.value(model.objective):.2f}")
 
-# 8) Gráfico 2D: projeção xP vs xM (assumindo xG = 0)
-xP_vals = np.linspace(0, xP.varValue * 1.2, 300)
-xM_vals = np.linspace(0, xM.varValue * 1.2, 300)
-X, Y = np.meshgrid(xP_vals, xM_vals)
-
-# com xG = 0, restrições de chapa e corte:
-corte_feasible = (10 * X + 10 * Y) <= 14400
-model_feasible = (10 * X + 15.5 * Y) <= 21600
-afiacao_feasible = (12 * X + 16 * Y) <= 21600
-cabo_feasible = (19 * X + 21 * Y) <= 28800
-mont_feasible = (19 * X + 21 * Y) <= 28800
-chapa_feasible = (25 * X + 32 * Y) <= 50000
-
-feasible = corte_feasible & model_feasible & afiacao_feasible & cabo_feasible & mont_feasible & chapa_feasible
+# 4) Gráfico 2D: projeção xP vs xM (assumindo xG = 0)
+# Caixa pelos interceptos do corte xG = 0 (xP <= 1440, xM <= 1350); o ótimo tem xP = 0
+box = (0, 1600, 0, 1600)
 
+# com xG = 0: polígono exato de todas as restrições; retas de chapa e corte
 plt.figure(figsize=(8, 6))
-plt.contourf(X, Y, feasible, levels=[-0.5, 0.5, 1.5], colors=['white', 'gray'], alpha=0.3)
-plt.contour(X, Y, 10 * X + 10 * Y, levels=[14400], colors='blue', linestyles='--')
-plt.contour(X, Y, 25 * X + 32 * Y, levels=[50000], colors='red', linestyles='--')
+draw_model_region(plt.gca(), model, box=box, fixed={xG.name: 0})
+draw_boundaries(plt.gca(), [[10, 10], [25, 32]], [14400, 50000], box=box,
+                colors=['blue', 'red'], linestyle='--')
 plt.scatter(xP.varValue, xM.varValue, color='black', zorder=5, label='Ótimo (proj. xG=0)')
 
-plt.xlim(0, max(xP_vals))
-plt.ylim(0, max(xM_vals))
+plt.xlim(*box[:2])
+plt.ylim(*box[2:])
 plt.xlabel('Facas Padrão (xP)')
 plt.ylabel('Facas Média (xM)')
 plt.title('Região Factível e Solução Ótima (xG = 0)')
 plt.legend()
 plt.grid(True)
 
-# 9) Salvar gráfico
+# 5) Salvar gráfico
 plt.savefig(r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q7\exercise07.png',
             dpi=300)
 plt.show()
@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                    # Biblioteca para modelagem e resolução de PL
 import numpy as np             # Para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # Para visualização da região factível
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # Exemplo 08 – Produção de P1 e P2
@@ -27,31 +29,19 @@ import matplotlib.pyplot as plt  # Para visualização da região factível
 #   100*x1 + 200*x2 ≤ 500 (matéria-prima)
 # =============================================================================
 
-# 1) Definir o modelo de maximização
-model = pulp.LpProblem("Exemplo08_Prod_P1_P2", pulp.LpMaximize)
+# 1) Carregar o modelo (declarado em q8.toml, ao lado deste script)
+model, (x1, x2) = load_model(Path(__file__).with_name('q8.toml')).to_pulp()
 
-# 2) Criar variáveis de decisão
-x1 = pulp.LpVariable('P1', lowBound=0, cat='Continuous')
-x2 = pulp.LpVariable('P2', lowBound=0, cat='Continuous')
-
-# 3) Definir a função objetivo
-model += 1900 * x1 + 2100 * x2, "Receita_Total"
-
-# 4) Adicionar as restrições
-model += 4 * x1 + 2 * x2 <= 20,      "Restricao_Forja"
-model += 2 * x1 + 3 * x2 <= 10,      "Restricao_Polimento"
-model += 100 * x1 + 200 * x2 <= 500, "Restricao_MateriaPrima"
-
-# 5) Resolver (Simplex via CBC)
+# 2) Resolver (Simplex via CBC)
 model.solve()
 
-# 6) Exibir resultados
+# 3) Exibir resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print(f"P1 (x1) = {x1.varValue:.0f}")
 print(f"P2 (x2) = {x2.varValue:.0f}")
 print(f"Receita Máxima = R$ {pulp.value(model.objective):.2f}")
 
-# 7) Visualização da região factível e solução ótima
+# 4) Visualização da região factível e solução ótima
 # Gerar valores de x1 no intervalo 0 até um pouco acima do ótimo
 x_vals = np.linspace(0, x1.varValue * 1.5, 300)
 
@@ -84,7 +74,7 @@ plt.title('Exemplo 08 – Região Factível e Solução Ótima')
 plt.legend()
 plt.grid(True)
 
-# 8) Salvar o gráfico
+# 5) Salvar o gráfico
 output_path = r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q8\exercise8.png'
 plt.savefig(output_path, dpi=300)
 
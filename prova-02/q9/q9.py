@@ -1,6 +1,8 @@
+from pathlib import Path        # Caminho do arquivo .toml do modelo
 import pulp                    # Biblioteca para modelagem e resolução de PL
-import numpy as np             # Para geração de pontos na plotagem
 import matplotlib.pyplot as plt  # Para visualização da região factível
+from linear_programming_and_applications_in_python import draw_boundaries, draw_region, integer_points, model_system  # Região e fronteiras exatas (sem grade)
+from linear_programming_and_applications_in_python import load_model  # Modelo declarado no .toml
 
 # =============================================================================
 # Exemplo 09 – Transporte de 600 funcionários
@@ -23,43 +25,30 @@ import matplotlib.pyplot as plt  # Para visualização da região factível
 #   xG + xP ≤ 13            (motoristas)
 # =============================================================================
 
-# 1) Definir o modelo de minimização
-model = pulp.LpProblem("Exemplo09_Minimizar_Custo_Transporte", pulp.LpMinimize)
+# 1) Carregar o modelo (declarado em q9.toml, ao lado deste script)
+model, (xG, xP) = load_model(Path(__file__).with_name('q9.toml')).to_pulp()
 
-# 2) Definir variáveis inteiras
-xG = pulp.LpVariable('Onibus_G', lowBound=0, upBound=8, cat='Integer')
-xP = pulp.LpVariable('Onibus_P', lowBound=0, upBound=12, cat='Integer')
-
-# 3) Função objetivo
-model += 190 * xG + 140 * xP, "Custo_Total"
-
-# 4) Restrições
-model += 60 * xG + 40 * xP >= 600, "Capacidade_Passageiros"
-model += xG + xP <= 13,            "Motoristas_Disponiveis"
-
-# 5) Resolver
+# 2) Resolver
 model.solve()
 
-# 6) Resultados
+# 3) Resultados
 print("Status da Solução:", pulp.LpStatus[model.status])
 print(f"Ônibus G usados (xG) = {xG.varValue}")
 print(f"Ônibus P usados (xP) = {xP.varValue}")
 print(f"Custo Mínimo = R$ {pulp.value(model.objective):.2f}")
 
-# 7) Plotagem da região factível e solução ótima
-xG_vals = np.arange(0, 9)   # 0 a 8
-xP_vals = np.arange(0, 13)  # 0 a 12
-XG, XP = np.meshgrid(xG_vals, xP_vals)
+# 4) Plotagem da região factível e solução ótima
+box = (0, 8, 0, 12)
 
-# Verificar factibilidade
-cap_ok = (60 * XG + 40 * XP) >= 600
-drv_ok = (XG + XP) <= 13
-feasible = cap_ok & drv_ok
+# Pontos inteiros factíveis, coluna a coluna a partir das restrições (sem grade)
+A, b, _ = model_system(model)
+pontos = integer_points(A, b, nonnegative=False, box=box)
 
 plt.figure(figsize=(8, 6))
-plt.scatter(XG[feasible], XP[feasible], color='lightgray', label='Região Factível')
-plt.plot(xG_vals, (600 - 60 * xG_vals) / 40, label='60xG + 40xP = 600', linewidth=2)
-plt.plot(xG_vals, 13 - xG_vals,            label='xG + xP = 13',       linewidth=2)
+draw_region(plt.gca(), A, b, nonnegative=False, box=box, alpha=0.15)
+plt.scatter(pontos[:, 0], pontos[:, 1], color='lightgray', label='Região Factível')
+draw_boundaries(plt.gca(), [[60, 40], [1, 1]], [600, 13], box=box,
+                labels=['60xG + 40xP = 600', 'xG + xP = 13'], linewidth=2)
 
 # Subir o contorno de xP para inteiro dentro dos limites
 plt.scatter(xG.varValue, xP.varValue, color='red', s=100, label='Solução Ótima')
@@ -72,7 +61,7 @@ plt.title('Exemplo 09 – Região Factível e Solução Ótima')
 plt.legend()
 plt.grid(True)
 
-# 8) Salvar o gráfico
+# 5) Salvar o gráfico
 output_path = r'C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-02\q9\exercise9.png'
 plt.savefig(output_path, dpi=300)
 
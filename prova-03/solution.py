@@ -1,40 +1,29 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from linear_programming_and_applications_in_python import draw_boundaries, draw_region, polytope
+
 # =============================================================================
 # Exercício – Fabricação de Refribom e Refrisaúde via Álgebra Linear
 # Salvando gráfico em:
 # C:\Users\Vinícius Andrade\Desktop\linear-programming-and-applications-in-python\prova-03
 # =============================================================================
 
-# 1) Definição das restrições ativas
+# 1) Definição do sistema de restrições A · x <= b
 A = np.array([[7, 9],    # coeficientes na 1ª restrição
-              [11, 5]])  # coeficientes na 2ª restrição
+              [11, 5],   # coeficientes na 2ª restrição
+              [1, 0]])   # limite de capacidade de x1 (x1 <= 4)
 b = np.array([63,        # lado direito da 1ª restrição
-              55])       # lado direito da 2ª restrição
-
-# resolve A · [x1, x2]ᵀ = b → interseção das duas retas
-x_int, y_int = np.linalg.solve(A, b)
+              55,        # lado direito da 2ª restrição
+              4])        # capacidade máxima de x1
 
-# 2) Cálculo de outros vértices factíveis
-vertice_origem     = (0.0, 0.0)                   # (0,0)
-vertice_r1_eixo_x2 = (0.0, 63/9)                  # x1=0 na 1ª restrição → x2=7
-vertice_x1_cap     = (4.0, (55 - 11*4) / 5)       # x1=4 na 2ª restrição → x2=2.2
-vertice_duas_restr = (x_int, y_int)               # interseção das duas restrições
+# 2) Enumeração exata dos vértices factíveis
+# Cada vértice é a interseção de duas restrições ativas (incluindo x1, x2 >= 0);
+# todas as combinações são resolvidas em lote e as infactíveis são descartadas.
+regiao = polytope(A, b)
 
-# 3) Filtrar vértices que satisfazem todas as restrições
-candidatos = [
-    vertice_origem,
-    vertice_r1_eixo_x2,
-    vertice_x1_cap,
-    vertice_duas_restr
-]
-feasible = []
-for x, y in candidatos:
-    if (0 <= x <= 4 and y >= 0
-        and 7*x + 9*y <= 63
-        and 11*x + 5*y <= 55):
-        feasible.append((x, y))
+# 3) Vértices que satisfazem todas as restrições
+feasible = [tuple(v) for v in regiao.vertices]
 
 # 4) Avaliar função-objetivo L = x1 + 2·x2 em cada vértice
 melhor = None
@@ -54,15 +43,12 @@ print(f"Refrisaúde (x2) = {melhor[1]:.3f} milhões")
 print(f"Lucro máximo Lₘₐₓ = {L_max:.3f} milhões")
 
 # 6) Plot da região factível e ponto ótimo
-x_vals = np.linspace(0, 4, 200)
-y_vals = np.linspace(0, 8, 200)
-X, Y = np.meshgrid(x_vals, y_vals)
-mask = (7*X + 9*Y <= 63) & (11*X + 5*Y <= 55)
+# Região e retas de fronteira exatas, direto de A e b (sem grade de pontos)
+box = (0, 4, 0, 8)
 
 plt.figure(figsize=(6, 6))
-plt.contourf(X, Y, mask, levels=[-0.5, 0.5, 1.5], alpha=0.3)
-plt.contour(X, Y, 7*X + 9*Y, levels=[63], linestyles='--', linewidths=2)
-plt.contour(X, Y, 11*X + 5*Y, levels=[55], linestyles='--', linewidths=2)
+draw_region(plt.gca(), A, b, box=box, color='C0')
+draw_boundaries(plt.gca(), A[:2], b[:2], box=box, colors=['C0', 'C1'], linestyle='--', linewidth=2)
 
 for vx, vy in feasible:
     plt.scatter(vx, vy, color='black', zorder=5)
@@ -1,3 +1,5 @@
+from linear_programming_and_applications_in_python import enumerate_plans, parse_model  # Enumeração vetorizada
+
 # Lucros por unidade de produto (em R$)
 LUCRO_PANELA = 3      # Lucro de R$ 3,00 por panela de pressão
 LUCRO_FRIGIDEIRA = 4  # Lucro de R$ 4,00 por frigideira
@@ -7,31 +9,37 @@ HORAS_DISPONIVEIS = 6   # Horas disponíveis de máquina por dia (1 h/un)
 DEMANDA_MAX_PANELA = 4  # Demanda máxima de panelas por dia
 DEMANDA_MAX_FRIGIDEIRA = 4  # Demanda máxima de frigideiras por dia
 
-# Lista de pontos extremos (vértices) viáveis
-pontos_viaveis = []
+# Modelo com as variáveis inteiras limitadas pela demanda
+modelo = parse_model({
+    'name': 'Panelas_Frigideiras_Inteiro',
+    'sense': 'max',
+    'objective_name': 'Lucro_Total',
+    'variables': {
+        'names': ['panelas', 'frigideiras'],
+        'objective': [LUCRO_PANELA, LUCRO_FRIGIDEIRA],
+        'upper': [DEMANDA_MAX_PANELA, DEMANDA_MAX_FRIGIDEIRA],
+        'integer': [True, True],
+    },
+    # Restrição de tempo de máquina: 1 h por unidade
+    'constraints': {'names': ['Horas_de_Maquina'], 'senses': ['<='], 'rhs': [HORAS_DISPONIVEIS],
+                    'matrix': [[1, 1]]},
+})
 
-# Gerar todas as combinações possíveis de produção (x panelas, y frigideiras)
-for x in range(DEMANDA_MAX_PANELA + 1):
-    for y in range(DEMANDA_MAX_FRIGIDEIRA + 1):
-        # Restrição de tempo de máquina: 1 h por unidade
-        if x + y <= HORAS_DISPONIVEIS:
-            pontos_viaveis.append((x, y))
+# Avaliar todas as combinações possíveis de produção (x panelas, y frigideiras)
+# em lote; `top` cobre a grade inteira, então voltam todos os planos viáveis,
+# do maior para o menor lucro
+total = (DEMANDA_MAX_PANELA + 1) * (DEMANDA_MAX_FRIGIDEIRA + 1)
+planos = enumerate_plans(modelo, top=total)
 
-# Encontrar a solução ótima (máximo lucro)
-melhor_plano = None
-lucro_maximo = -1
+for (x, y), lucro in zip(planos.plans.astype(int).tolist(), planos.objective.tolist()):
+    print(f"Produzir {x} panelas e {y} frigideiras → Lucro = R${lucro:g}")
 
-for x, y in pontos_viaveis:
-    # Cálculo do lucro total para o vértice (x, y)
-    lucro = LUCRO_PANELA * x + LUCRO_FRIGIDEIRA * y
-    print(f"Produzir {x} panelas e {y} frigideiras → Lucro = R${lucro}")
-    # Atualiza melhor solução caso o lucro seja maior
-    if lucro > lucro_maximo:
-        lucro_maximo = lucro
-        melhor_plano = (x, y)
+# O primeiro plano é a solução ótima (máximo lucro)
+melhor_plano = planos.plans[0].astype(int)
+lucro_maximo = planos.objective[0]
 
 # Exibe o resultado final
 print("\n=== Solução Ótima ===")
 print(f"Painelas de pressão: {melhor_plano[0]}")
 print(f"Frigideiras:       {melhor_plano[1]}")
-print(f"Lucro máximo:      R${lucro_maximo}")
+print(f"Lucro máximo:      R${lucro_maximo:g}")